@@ -0,0 +1,86 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from scipy.linalg import solve_triangular
+
+# Upper bound on floats held by one chunk's stacked (b, p, n) weighted design
+CHUNK_ELEMENTS = 4_000_000
+# Points along the data range at which the prediction band is evaluated
+N_BAND_POINTS = 100
+
+
+def chunk_plan(n, p, n_boot, seed=0):
+    """[(start, stop, seed sequence)] splitting the resamples so one chunk stays under CHUNK_ELEMENTS"""
+    chunk = max(1, CHUNK_ELEMENTS // max(1, n * p))
+    bounds = [(s, min(s + chunk, n_boot)) for s in range(0, n_boot, chunk)]
+    streams = np.random.SeedSequence(seed).spawn(len(bounds))
+    return [(start, stop, ss) for (start, stop), ss in zip(bounds, streams)]
+
+
+def resample_weights(n, size, seed_seq):
+    """(size, n) multinomial counts: how often each row appears in each resample"""
+    return np.random.default_rng(seed_seq).multinomial(n, np.full(n, 1.0 / n), size=size).astype(float)
+
+
+def bootstrap_coefficients(A, Y, n_boot=200, seed=0, workers=None):
+    """Bootstrap draws of the least-squares solution of A @ beta ~= Y.
+
+    Every resample is expressed as a vector of multinomial counts w_b, so the
+    B refits become one batched weighted solve instead of a Python loop:
+    with A = QR, beta_b = R^-1 (Q^T W_b Q)^-1 Q^T W_b Y. Chunks of resamples
+    run on a thread pool (the stacked matmuls release the GIL); each chunk
+    draws its own weights from a spawned seed, so only one chunk's counts
+    are in memory per worker and the result does not depend on `workers`.
+
+    Returns an array of shape (n_boot, p) or (n_boot, p, n_targets).
+    """
+    A = np.asarray(A, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    n, p = A.shape
+    Q, R = np.linalg.qr(A)
+    plan = chunk_plan(n, p, n_boot, seed)
+
+    def solve_chunk(step):
+        start, stop, seed_seq = step
+        Wc = resample_weights(n, stop - start, seed_seq)
+        QtW = Q.T[None, :, :] * Wc[:, None, :]      # (b, p, n)
+        G = QtW @ Q                                   # (b, p, p)
+        rhs = QtW @ Y if Y.ndim == 2 else (QtW @ Y)[..., None]
+        try:
+            return np.linalg.solve(G, rhs)
+        except np.linalg.LinAlgError:
+            # A resample can drop every point that pins down a term
+            return np.linalg.pinv(G) @ rhs
+
+    workers = workers or os.cpu_count() or 1
+    if len(plan) > 1 and workers > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(plan))) as pool:
+            Z = np.concatenate(list(pool.map(solve_chunk, plan)))
+    else:
+        Z = np.concatenate([solve_chunk(step) for step in plan])
+
+    # Undo the QR change of variables for all draws at once: R beta = z
+    t = Z.shape[2]
+    flat = Z.transpose(1, 0, 2).reshape(p, n_boot * t)
+    beta = solve_triangular(R, flat).reshape(p, n_boot, t).transpose(1, 0, 2)
+    return beta if Y.ndim == 2 else beta[..., 0]
+
+
+def percentile_interval(draws, level=0.95, axis=0):
+    alpha = (1.0 - level) / 2.0
+    lo, hi = np.percentile(draws, [100 * alpha, 100 * (1 - alpha)], axis=axis)
+    return lo, hi
+
+
+def band_grid(X, n=N_BAND_POINTS):
+    """Rows sweeping the first input over its data range, other inputs held at their mean"""
+    X = np.asarray(X, dtype=float).reshape(len(X), -1)
+    grid = np.tile(X.mean(axis=0), (n, 1))
+    grid[:, 0] = np.linspace(X[:, 0].min(), X[:, 0].max(), n)
+    return grid
+
+
+def prediction_band(A, draws, level=0.95):
+    """Pointwise percentile band of A @ beta_b across bootstrap draws"""
+    preds = np.einsum('np,bp...->bn...', A, draws)
+    return percentile_interval(preds, level)
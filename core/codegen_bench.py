@@ -0,0 +1,132 @@
+import ctypes
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import numpy as np
+
+# Golden rows drawn from the training data per benchmark run
+N_GOLDEN = 1000
+# Timed repetitions; the fastest is reported (least disturbed by the rest of the machine)
+REPEATS = 5
+# Rows evaluated per timed C sample
+MIN_C_ROWS = 200_000
+COMPILERS = ["cc", "gcc", "clang"]
+
+
+def find_compiler():
+    for name in COMPILERS:
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def golden_inputs(model, n=N_GOLDEN, seed=0, default_range=(0.0, 10.0)):
+    """Rows over the model's function arguments (all_input_names), taken from its training data.
+
+    Chained models take their inputs from two data sets, so those are sampled
+    uniformly over each input's training range instead.
+    """
+    rng = np.random.default_rng(seed)
+    direct = list(getattr(model, 'input_feature_names', None) or [])
+    names = list(getattr(model, 'all_input_names', None) or direct)
+    X = getattr(model, 'X_train', None)
+    if X is not None and len(X) and names == direct:
+        X = np.asarray(X, dtype=float).reshape(len(X), -1)
+        return X[rng.choice(len(X), size=min(n, len(X)), replace=False)]
+
+    n_inputs = max(len(names), 1)
+    lo, hi = np.full(n_inputs, default_range[0]), np.full(n_inputs, default_range[1])
+    sources = [(direct, X), (getattr(model, 'sub_model_input_names', None) or [],
+                             getattr(getattr(model, 'sub_model', None), 'X_train', None))]
+    for j, name in enumerate(names):
+        for cols, data in sources:
+            if data is not None and len(data) and name in cols:
+                col = np.asarray(data, dtype=float).reshape(len(data), -1)[:, cols.index(name)]
+                lo[j], hi[j] = col.min(), col.max()
+                break
+    return lo + (hi - lo) * rng.random((n, n_inputs))
+
+
+def reference_predict(model, X):
+    """Source model prediction on rows of all_input_names (upstream _poly_pred computed here)"""
+    direct = list(getattr(model, 'input_feature_names', None) or [])
+    names = list(getattr(model, 'all_input_names', None) or direct)
+    if direct and direct != names:
+        cols = []
+        for feat in direct:
+            if feat == '_poly_pred' and getattr(model, 'sub_model', None) is not None:
+                sub_idx = [names.index(s) for s in model.sub_model_input_names]
+                cols.append(np.ravel(model.sub_model.predict(X[:, sub_idx])))
+            else:
+                cols.append(X[:, names.index(feat)])
+        X = np.column_stack(cols)
+    y = np.asarray(model.predict(X), dtype=float)
+    return y.reshape(len(X), -1)
+
+
+def error_stats(out, ref):
+    err = np.abs(np.asarray(out, dtype=float) - np.asarray(ref, dtype=float))
+    return float(err.max()), float(err.mean())
+
+
+def run_python(code, func_name, X):
+    """Import the generated module source and time the scalar function; (outputs, ns per prediction)"""
+    namespace = {}
+    exec(compile(code, "<generated>", "exec"), namespace)
+    func = namespace[func_name]
+    rows = [tuple(float(v) for v in row) for row in X]
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter_ns()
+        out = [func(*row) for row in rows]
+        best = min(best, time.perf_counter_ns() - start)
+    return np.asarray(out, dtype=float), best / len(rows)
+
+
+def run_c(code, func_name, X, compiler=None):
+    """Build the generated C as a shared library and time <func>_batch over X (row-major)"""
+    compiler = compiler or find_compiler()
+    if compiler is None:
+        raise RuntimeError("no C compiler found")
+    with tempfile.TemporaryDirectory() as tmp:
+        src, lib_path = os.path.join(tmp, "model.c"), os.path.join(tmp, "model.so")
+        with open(src, "w") as f:
+            f.write(code)
+        proc = subprocess.run([compiler, "-O2", "-shared", "-fPIC", "-o", lib_path, src, "-lm"],
+                              capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[0] if proc.stderr.strip() else "compile failed")
+        lib = ctypes.CDLL(lib_path)
+        func = getattr(lib, f"{func_name}_batch")
+        func.restype = None
+        ptr = ctypes.POINTER(ctypes.c_double)
+        func.argtypes = [ptr, ptr, ctypes.c_size_t]
+
+        X = np.ascontiguousarray(X, dtype=float)
+        out = np.empty(len(X))
+        x_ptr, out_ptr = X.ctypes.data_as(ptr), out.ctypes.data_as(ptr)
+        # Enough calls per sample that the ctypes call overhead is amortized
+        calls = max(1, MIN_C_ROWS // len(X))
+        best = float("inf")
+        for _ in range(REPEATS):
+            start = time.perf_counter_ns()
+            for _ in range(calls):
+                func(x_ptr, out_ptr, len(X))
+            best = min(best, time.perf_counter_ns() - start)
+        del lib
+    return out, best / (calls * len(X))
+
+
+def format_report(rows):
+    """Fixed-width table of benchmark rows (dicts with variant, lang, max_err, mean_err, ns, error)"""
+    lines = [f"{'variant':<12}{'lang':<8}{'max err':>11}{'mean err':>11}{'ns/pred':>10}"]
+    for r in rows:
+        head = f"{r['variant']:<12}{r['lang']:<8}"
+        if r.get('error'):
+            lines.append(head + f"  {r['error']}")
+        else:
+            lines.append(head + f"{r['max_err']:>11.2e}{r['mean_err']:>11.2e}{r['ns']:>10.1f}")
+    return lines
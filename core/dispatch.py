@@ -0,0 +1,79 @@
+import operator
+import numpy as np
+
+# Comparison operators a ConditionalSplitter clause may use, and their complements
+OPS = {'>': operator.gt, '<': operator.lt, '>=': operator.ge, '<=': operator.le,
+       '==': operator.eq, '!=': operator.ne}
+NEGATED = {'>': '<=', '<': '>=', '>=': '<', '<=': '>', '==': '!=', '!=': '=='}
+# With fewer branches a plain if/else is as cheap as the table lookup
+TABLE_MIN_BRANCHES = 3
+
+
+def negate(clause):
+    column, op, value = clause
+    return (column, NEGATED[op], value)
+
+
+def clause_text(clause):
+    column, op, value = clause
+    return f"{column} {op} {value}"
+
+
+def order_branches(conditions):
+    """Dispatch order for branches with the given clause lists (None/[] = unconditional).
+
+    Conditional branches keep their order and are tested first; the first
+    unconditional branch becomes the default and any further ones, which
+    could never be reached, are dropped. Returns indices into `conditions`.
+    """
+    conditional = [i for i, c in enumerate(conditions) if c]
+    default = [i for i, c in enumerate(conditions) if not c][:1]
+    return conditional + default
+
+
+def _thresholds(op, value):
+    """Thresholds t, each tested as x > t, at which the clause can change value.
+
+    x >= v is exactly x > nextafter(v, -inf) for doubles, so every boundary
+    becomes the same strict comparison and one sorted table covers them all.
+    """
+    below = float(np.nextafter(value, -np.inf))
+    if op in ('>', '<='):
+        return [value]
+    if op in ('>=', '<'):
+        return [below]
+    return [below, value]
+
+
+def threshold_table(conditions):
+    """Single-column segment table for an ordered branch list, or None.
+
+    conditions[i] is the clause list ((column, op, value) conjunction) of
+    branch i; the last branch is the default. Applies when every other
+    branch tests the same single column. Returns (column, thresholds,
+    segment_branch): segment s = number of thresholds below x (a binary
+    search), and segment_branch[s] is the first branch whose clauses all
+    hold on that segment. Neighbouring segments that pick the same branch
+    are merged.
+    """
+    tested = conditions[:-1]
+    columns = {column for clauses in tested for column, _, _ in clauses or []}
+    if len(columns) != 1 or not all(tested):
+        return None
+    column = columns.pop()
+    thresholds = sorted({t for clauses in tested for _, op, v in clauses for t in _thresholds(op, float(v))})
+
+    # Segment s is (thresholds[s-1], thresholds[s]]: its right end represents it exactly
+    points = thresholds + [float(np.nextafter(thresholds[-1], np.inf))]
+    segment_branch = []
+    for x in points:
+        branch = next((i for i, clauses in enumerate(tested)
+                       if all(OPS[op](x, float(v)) for _, op, v in clauses)), len(conditions) - 1)
+        segment_branch.append(branch)
+
+    kept, branches = [], [segment_branch[0]]
+    for t, branch in zip(thresholds, segment_branch[1:]):
+        if branch != branches[-1]:
+            kept.append(t)
+            branches.append(branch)
+    return column, kept, branches
@@ -0,0 +1,193 @@
+import numpy as np
+
+# Rows per chunk for large batches; keeps the Horner temporaries cache-resident
+BATCH_CHUNK = 65536
+
+
+def build_horner_tree(powers, coeffs, intercept):
+    """Factor sum_i c_i * prod_j x_j^p_ij + intercept into nested Horner form.
+
+    A node is either a constant leaf or a tuple (var_index, children) where
+    children[k] is the sub-polynomial multiplying x_var^k (None when absent).
+    Evaluating children from the highest power down shares every monomial
+    sub-product instead of rebuilding each term from scratch.
+    """
+    powers = np.asarray(powers, dtype=int)
+    terms = [(tuple(int(p) for p in row), c) for row, c in zip(powers, coeffs) if np.any(c != 0)]
+    n_features = powers.shape[1] if powers.ndim == 2 else 1
+    terms.append(((0,) * n_features, intercept))
+    return _build(terms)
+
+
+def _build(terms):
+    if not terms:
+        return None
+    # Pick the variable that appears in the most terms so the factoring shares the most work
+    n_features = len(terms[0][0])
+    counts = [sum(1 for p, _ in terms if p[j]) for j in range(n_features)]
+    var = int(np.argmax(counts)) if counts else 0
+    if not counts or counts[var] == 0:
+        total = terms[0][1]
+        for _, c in terms[1:]:
+            total = total + c
+        return total
+
+    groups = {}
+    for p, c in terms:
+        reduced = p[:var] + (0,) + p[var + 1:]
+        groups.setdefault(p[var], []).append((reduced, c))
+    max_power = max(groups)
+    children = [_build(groups[k]) if k in groups else None for k in range(max_power + 1)]
+    return (var, children)
+
+
+def eval_tree(node, cols):
+    """Evaluate a Horner tree on per-feature values (floats or equally shaped arrays)"""
+    if node is None:
+        return 0.0
+    if not isinstance(node, tuple):
+        return node
+    var, children = node
+    x = cols[var]
+    result = eval_tree(children[-1], cols)
+    for child in reversed(children[:-1]):
+        result = result * x
+        if child is not None:
+            result = result + eval_tree(child, cols)
+    return result
+
+
+def horner_expr(node, num, power):
+    """Source expression for a Horner tree.
+
+    num(leaf) formats a constant and power(var, k) names x_var^k; powers
+    above 1 only appear to skip gaps between the used powers of a variable.
+    """
+    if not isinstance(node, tuple):
+        return num(node)
+    var, children = node
+    ks = [k for k, child in enumerate(children) if child is not None]
+    expr = horner_expr(children[ks[-1]], num, power)
+    for lo, hi in reversed(list(zip(ks[:-1], ks[1:]))):
+        expr = f"({horner_expr(children[lo], num, power)} + {power(var, hi - lo)} * {expr})"
+    return f"{power(var, ks[0])} * {expr}" if ks[0] else expr
+
+
+def power_chain(ks):
+    """Steps (k, a, b) with x^k = x^a * x^b building every power in ks from x by halving"""
+    have = {1}
+    steps = []
+    def build(k):
+        if k in have:
+            return
+        build(k // 2)
+        build(k - k // 2)
+        have.add(k)
+        steps.append((k, k // 2, k - k // 2))
+    for k in sorted(ks):
+        build(k)
+    return steps
+
+
+def compile_tree(tree, n_features):
+    """Compile a Horner tree into a Python function f(x0, ..., x{n-1}).
+
+    The body is the expression the code generator exports, with the same
+    hoisted power chains, so results match the exported code exactly. It
+    runs on floats and on equally shaped arrays alike; vector leaves
+    (multi-target models) are bound as constants.
+    """
+    consts = {}
+    def num(v):
+        if np.ndim(v):
+            name = f"_c{len(consts)}"
+            consts[name] = np.asarray(v, dtype=float)
+            return name
+        return repr(float(v))
+
+    needed = {}
+    def power(j, k):
+        if k > 1:
+            needed.setdefault(j, set()).add(k)
+            return f"x{j}_{k}"
+        return f"x{j}"
+
+    expr = horner_expr(tree, num, power)
+    lines = [f"def horner({', '.join(f'x{j}' for j in range(n_features))}):"]
+    for j, ks in sorted(needed.items()):
+        lines += [f"    x{j}_{k} = {power(j, a)} * {power(j, b)}" for k, a, b in power_chain(ks)]
+    lines.append(f"    return {expr}")
+    source = "\n".join(lines)
+    namespace = dict(consts)
+    exec(compile(source, "<horner>", "exec"), namespace)
+    func = namespace["horner"]
+    func.source = source
+    return func
+
+
+def count_ops(node):
+    """(multiplies, adds) needed to evaluate a Horner tree once"""
+    if not isinstance(node, tuple):
+        return 0, 0
+    _, children = node
+    muls = len(children) - 1
+    adds = 0
+    for child in children[:-1]:
+        if child is not None:
+            adds += 1
+    for child in children:
+        m, a = count_ops(child)
+        muls += m
+        adds += a
+    return muls, adds
+
+
+class MonomialPlan:
+    """Compiled evaluation plan for a monomial polynomial model.
+
+    The Horner tree is compiled once into a plain Python function (see
+    compile_tree) that is called on floats for single rows and on NumPy
+    columns for batches.
+
+    coeffs may be (n_terms,) or (n_terms, n_targets); in the latter case every
+    leaf is a per-target vector and predict returns (n_rows, n_targets).
+    """
+    def __init__(self, powers, coeffs, intercept):
+        self.n_features = np.asarray(powers).shape[1]
+        coeffs = np.asarray(coeffs, dtype=float)
+        self.n_targets = coeffs.shape[1] if coeffs.ndim == 2 else None
+        self.tree = build_horner_tree(powers, coeffs, intercept)
+        self.func = compile_tree(self.tree, self.n_features)
+        self.out_tail = (self.n_targets,) if self.n_targets else ()
+
+    def __call__(self, X):
+        X = np.asarray(X, dtype=float)
+        if X.ndim == 1:
+            X = X.reshape(-1, self.n_features)
+        n = X.shape[0]
+
+        # Single row: plain Python floats beat NumPy dispatch overhead
+        if n == 1:
+            result = self.func(*X[0].tolist())
+            return np.asarray(result, dtype=float).reshape((1,) + self.out_tail)
+
+        if n <= BATCH_CHUNK:
+            return self._eval_batch(X)
+
+        out = np.empty((n,) + self.out_tail)
+        for start in range(0, n, BATCH_CHUNK):
+            stop = min(start + BATCH_CHUNK, n)
+            out[start:stop] = self._eval_batch(X[start:stop])
+        return out
+
+    def _eval_batch(self, X):
+        if self.n_targets:
+            # (n, 1) columns broadcast against the per-target coefficient vectors
+            cols = [np.ascontiguousarray(X[:, j:j + 1]) for j in range(self.n_features)]
+        else:
+            cols = [np.ascontiguousarray(X[:, j]) for j in range(self.n_features)]
+        shape = (X.shape[0],) + self.out_tail
+        result = self.func(*cols)
+        if isinstance(result, np.ndarray) and result.shape == shape:
+            return result
+        return np.broadcast_to(result, shape).astype(float)
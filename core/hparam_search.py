@@ -0,0 +1,142 @@
+import itertools
+import os
+import pickle
+import warnings
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+
+# Kept free of Qt imports: worker processes import this module on spawn.
+
+GRID = {
+    'layers': [(32,), (64,), (128,), (64, 32), (128, 64)],
+    'activation': ["relu", "tanh"],
+    'solver': ["adam", "lbfgs"],
+}
+RANDOM_WIDTHS = [8, 16, 32, 64, 128, 256]
+RANDOM_ACTIVATIONS = ["relu", "tanh", "logistic"]
+RANDOM_SOLVERS = ["adam", "lbfgs", "sgd"]
+VAL_FRACTION = 0.2
+ETA = 3  # Successive halving keeps the best 1/ETA of each rung
+
+
+def grid_configs(current=None):
+    configs = [dict(zip(GRID, values)) for values in itertools.product(*GRID.values())]
+    if current and current not in configs:
+        configs.insert(0, current)
+    return configs
+
+
+def random_configs(n, seed=0, current=None):
+    rng = np.random.default_rng(seed)
+    configs = [current] if current else []
+    while len(configs) < n:
+        depth = int(rng.integers(1, 4))
+        widths = sorted(rng.choice(RANDOM_WIDTHS, size=depth), reverse=True)
+        config = {
+            'layers': tuple(int(w) for w in widths),
+            'activation': str(rng.choice(RANDOM_ACTIVATIONS)),
+            'solver': str(rng.choice(RANDOM_SOLVERS)),
+        }
+        if config not in configs:
+            configs.append(config)
+    return configs
+
+
+def config_label(config):
+    layers = "x".join(str(w) for w in config['layers'])
+    return f"{layers} {config['activation']}/{config['solver']}"
+
+
+def share_array(arr):
+    """Copy an array into a new shared memory block; returns (block, descriptor)"""
+    arr = np.ascontiguousarray(arr, dtype=float)
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+    view[...] = arr
+    return shm, (shm.name, arr.shape, arr.dtype.str)
+
+
+def _attach(desc):
+    name, shape, dtype = desc
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _train_candidate(x_desc, y_desc, config, budget):
+    """Worker: train one config for `budget` iterations on the shared data, score on the held-out split"""
+    from sklearn.neural_network import MLPRegressor
+    from sklearn.metrics import mean_squared_error
+    from sklearn.exceptions import ConvergenceWarning
+
+    x_shm, X = _attach(x_desc)
+    y_shm, Y = _attach(y_desc)
+    try:
+        # Same deterministic split in every worker, without copying the data
+        order = np.random.default_rng(42).permutation(len(X))
+        n_val = max(1, int(len(X) * VAL_FRACTION))
+        val_idx, tr_idx = order[:n_val], order[n_val:]
+
+        mlp = MLPRegressor(hidden_layer_sizes=config['layers'], activation=config['activation'],
+                           solver=config['solver'], max_iter=budget, random_state=42)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ConvergenceWarning)
+            mlp.fit(X[tr_idx], Y[tr_idx])
+        val_mse = float(mean_squared_error(Y[val_idx], mlp.predict(X[val_idx])))
+        if not np.isfinite(val_mse):
+            val_mse = float("inf")
+        return config, budget, val_mse, pickle.dumps(mlp)
+    finally:
+        del X, Y
+        x_shm.close()
+        y_shm.close()
+
+
+def run_search(X, Y, configs, max_budget, halving=False, workers=None, on_progress=None):
+    """Train candidate MLPs in parallel worker processes.
+
+    With halving=True the candidates go through successive halving: every
+    rung trains the survivors with ETA times the budget of the previous one
+    and keeps the best 1/ETA, so only a few configs get the full budget.
+
+    Returns (leaderboard sorted by validation MSE, best fitted MLPRegressor).
+    """
+    x_shm, x_desc = share_array(X)
+    y_shm, y_desc = share_array(Y)
+    workers = workers or max(1, (os.cpu_count() or 2) - 1)
+
+    if halving:
+        n_rungs = max(1, int(np.floor(np.log(len(configs)) / np.log(ETA))) + 1)
+        budgets = [max(10, int(max_budget / ETA ** (n_rungs - 1 - r))) for r in range(n_rungs)]
+    else:
+        budgets = [max_budget]
+
+    leaderboard = []
+    best_blob = None
+    try:
+        # spawn: never fork a process that owns a running Qt application
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn")) as pool:
+            survivors = list(configs)
+            for rung, budget in enumerate(budgets):
+                pending = {pool.submit(_train_candidate, x_desc, y_desc, c, budget) for c in survivors}
+                results = []
+                total = len(pending)
+                while pending:
+                    done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        results.append(fut.result())
+                    if on_progress:
+                        on_progress(rung, len(budgets), len(results), total)
+                results.sort(key=lambda r: r[2])
+                leaderboard = [{'config': c, 'label': config_label(c), 'budget': b, 'val_mse': mse}
+                               for c, b, mse, _ in results] + [e for e in leaderboard if e['config'] not in survivors]
+                best_blob = results[0][3]
+                survivors = [r[0] for r in results[:max(1, len(results) // ETA)]]
+    finally:
+        x_shm.close()
+        x_shm.unlink()
+        y_shm.close()
+        y_shm.unlink()
+
+    return leaderboard, pickle.loads(best_blob)
@@ -0,0 +1,102 @@
+import numpy as np
+
+# Grid size limits: start coarse, never emit more than MAX_POINTS table entries
+START_POINTS = 9
+MAX_POINTS = 4096
+
+
+def model_function(model, target=0):
+    """Single-output prediction over the model's direct inputs (output `target` of multi-output models)"""
+    def f(X):
+        y = np.asarray(model.predict(X), dtype=float)
+        return y[:, target] if y.ndim == 2 else y.ravel()
+    return f
+
+
+def grid_axes(lo, hi, shape):
+    return [np.linspace(l, h, n) for l, h, n in zip(lo, hi, shape)]
+
+
+def sample(f, lo, hi, shape):
+    axes = grid_axes(lo, hi, shape)
+    mesh = np.meshgrid(*axes, indexing='ij')
+    return f(np.column_stack([m.ravel() for m in mesh])).reshape(shape)
+
+
+class LookupTable:
+    """Uniform grid of model values with clamped linear (1 input) or bilinear (2 inputs) interpolation.
+
+    Evaluation mirrors the generated code: t = (x - lo) * inv_step clamped
+    to the grid, i = min(int(t), n - 2), then a lerp along each axis.
+    """
+    def __init__(self, table, lo, hi):
+        self.table = np.asarray(table, dtype=float)
+        self.lo = np.asarray(lo, dtype=float)
+        self.hi = np.asarray(hi, dtype=float)
+        self.shape = self.table.shape
+        self.inv_step = np.array([(n - 1) / max(h - l, 1e-300) for l, h, n in zip(self.lo, self.hi, self.shape)])
+        self.max_error = None
+
+    def _locate(self, x, axis):
+        n = self.shape[axis]
+        t = np.clip((x - self.lo[axis]) * self.inv_step[axis], 0.0, n - 1)
+        i = np.minimum(t.astype(int), n - 2)
+        return i, t - i
+
+    def __call__(self, X):
+        X = np.asarray(X, dtype=float).reshape(len(X), -1)
+        T = self.table
+        i, fx = self._locate(X[:, 0], 0)
+        if T.ndim == 1:
+            return T[i] + fx * (T[i + 1] - T[i])
+        j, fy = self._locate(X[:, 1], 1)
+        a = T[i, j] + fx * (T[i + 1, j] - T[i, j])
+        b = T[i, j + 1] + fx * (T[i + 1, j + 1] - T[i, j + 1])
+        return a + fy * (b - a)
+
+
+def _midpoint_errors(f, lut):
+    """Max interpolation error half-way between nodes, per axis (other axes on nodes) and at cell centres"""
+    errors = []
+    n_dims = len(lut.shape)
+    for axis in range(n_dims):
+        axes = grid_axes(lut.lo, lut.hi, lut.shape)
+        axes[axis] = (axes[axis][:-1] + axes[axis][1:]) / 2.0
+        mesh = np.meshgrid(*axes, indexing='ij')
+        X = np.column_stack([m.ravel() for m in mesh])
+        errors.append(float(np.max(np.abs(lut(X) - f(X)))))
+    if n_dims > 1:
+        axes = [(a[:-1] + a[1:]) / 2.0 for a in grid_axes(lut.lo, lut.hi, lut.shape)]
+        mesh = np.meshgrid(*axes, indexing='ij')
+        X = np.column_stack([m.ravel() for m in mesh])
+        centre = float(np.max(np.abs(lut(X) - f(X))))
+        errors = [max(e, centre) for e in errors]
+    return errors
+
+
+def build_lut(f, lo, hi, max_error, max_points=MAX_POINTS):
+    """Smallest uniform grid (nodes doubled per axis) whose interpolation error is within max_error.
+
+    Axes are refined independently, so a model that is nearly linear in one
+    input keeps few nodes along it. Stops at max_points entries; the
+    returned table's max_error then reports what was actually reached.
+    """
+    shape = [START_POINTS] * len(lo)
+    while True:
+        lut = LookupTable(sample(f, lo, hi, shape), lo, hi)
+        errors = _midpoint_errors(f, lut)
+        lut.max_error = max(errors)
+        if lut.max_error <= max_error:
+            return lut
+        grown = list(shape)
+        for axis, err in enumerate(errors):
+            if err > max_error:
+                grown[axis] = 2 * shape[axis] - 1  # Keeps every existing node
+        if np.prod(grown) > max_points:
+            # Out of budget for every failing axis: spend what is left on the worst one
+            grown = list(shape)
+            worst = int(np.argmax(errors))
+            grown[worst] = 2 * shape[worst] - 1
+            if np.prod(grown) > max_points:
+                return lut
+        shape = grown
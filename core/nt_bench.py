@@ -0,0 +1,242 @@
+import enum
+import sys
+import threading
+import time
+import types
+import numpy as np
+
+# Updates sent per latency run, and the fixed-rate loop the event-driven runtime replaces
+N_UPDATES = 100
+POLL_PERIOD = 0.02
+# Idle window over which the runtime's CPU use is sampled
+IDLE_WINDOW = 0.5
+TIMEOUT = 2.0
+
+
+class EventFlags(enum.IntFlag):
+    kImmediate = 1
+    kValueRemote = 2
+    kValueLocal = 4
+    kValueAll = 6
+
+
+class _Stopped(BaseException):
+    """Raised into the runtime thread on shutdown (a BaseException, so generated try/except lets it through)"""
+
+
+class _Topic:
+    def __init__(self, instance, name):
+        self.instance = instance
+        self.name = name
+        self.value = None
+        self.listeners = []
+
+    def subscribe(self, default):
+        return _Subscriber(self, default)
+
+    def publish(self):
+        return _Publisher(self)
+
+
+class _Subscriber:
+    def __init__(self, topic, default):
+        self.topic = topic
+        self.default = default
+
+    def get(self):
+        if self.topic.instance.stopped:
+            raise _Stopped()
+        value = self.topic.value
+        return self.default if value is None else value
+
+
+class _Publisher:
+    def __init__(self, topic):
+        self.topic = topic
+
+    def set(self, value):
+        self.topic.instance.on_publish(self.topic.name, value)
+
+
+class _Table:
+    def __init__(self, instance):
+        self.instance = instance
+
+    def getDoubleTopic(self, name):
+        return self.instance.topic(name)
+
+
+class StandInInstance:
+    """In-process NetworkTables server/client pair covering what the generated Python runtime uses.
+
+    Values arrive in frames: every value of a frame is stored, then the
+    listeners of each changed topic run, as on a client receiving one
+    network update. Listeners run on the sending thread.
+    """
+    def __init__(self):
+        self.topics = {}
+        self.stopped = False
+        self.published = threading.Condition()
+        self.last = {}  # Result topic -> (value, perf_counter_ns at publish)
+        self.n_published = 0
+
+    def topic(self, name):
+        if name not in self.topics:
+            self.topics[name] = _Topic(self, name)
+        return self.topics[name]
+
+    # ntcore API subset
+    def startClient4(self, name):
+        pass
+
+    def setServer(self, address):
+        pass
+
+    def setServerTeam(self, team):
+        pass
+
+    def startDSClient(self):
+        pass
+
+    def getTable(self, name):
+        return _Table(self)
+
+    def addListener(self, subscriber, flags, callback):
+        subscriber.topic.listeners.append(callback)
+        if flags & EventFlags.kImmediate and subscriber.topic.value is not None:
+            callback(None)
+
+    def flush(self):
+        pass
+
+    # Robot side
+    def send(self, values):
+        for name, value in values.items():
+            self.topic(name).value = float(value)
+        for name in values:
+            for callback in list(self.topic(name).listeners):
+                callback(None)
+
+    def on_publish(self, name, value):
+        with self.published:
+            self.last[name] = (value, time.perf_counter_ns())
+            self.n_published += 1
+            self.published.notify_all()
+
+    def stop(self):
+        self.stopped = True
+        # Wake a runtime blocked on its listeners so it hits the stop on its next read
+        for topic in list(self.topics.values()):
+            for callback in list(topic.listeners):
+                callback(None)
+
+
+def module_for(instance):
+    """A stand-in `ntcore` module whose default instance is `instance`"""
+    module = types.ModuleType("ntcore")
+    module.EventFlags = EventFlags
+    module.NetworkTableInstance = type("NetworkTableInstance", (), {'getDefault': staticmethod(lambda: instance)})
+    return module
+
+
+def load_runtime(code, instance):
+    """Exec generated Python with the stand-in bound as `ntcore`; returns its namespace"""
+    saved = sys.modules.get("ntcore")
+    sys.modules["ntcore"] = module_for(instance)
+    try:
+        namespace = {}
+        exec(compile(code, "<generated>", "exec"), namespace)
+    finally:
+        if saved is None:
+            del sys.modules["ntcore"]
+        else:
+            sys.modules["ntcore"] = saved
+    return namespace
+
+
+def polling_loop(instance, func, input_names, topic):
+    """The fixed-rate runtime: read every input, publish, sleep POLL_PERIOD"""
+    table = instance.getTable("FlibberGen")
+    subs = [table.getDoubleTopic(n).subscribe(0.0) for n in input_names]
+    pub = table.getDoubleTopic(topic).publish()
+    while True:
+        pub.set(func(*[s.get() for s in subs]))
+        time.sleep(POLL_PERIOD)
+
+
+def measure(instance, runner, func, input_names, topic, X, seed=0):
+    """Latency from sending a row until its prediction is published on `topic`.
+
+    Rows are sent at random offsets within a poll period, so a fixed-rate
+    runtime is not phase-locked to the sender. Returns a dict with
+    median/p95 latency (ms), publishes per update and CPU milliseconds used
+    per idle second.
+    """
+    def target():
+        try:
+            runner()
+        except _Stopped:
+            pass
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    rng = np.random.default_rng(seed)
+    latencies = []
+    start_published = instance.n_published
+    try:
+        for row in X:
+            expected = func(*[float(v) for v in row])
+            time.sleep(rng.uniform(0.0, POLL_PERIOD))
+            sent = time.perf_counter_ns()
+            instance.send(dict(zip(input_names, row)))
+            with instance.published:
+                done = instance.published.wait_for(
+                    lambda: topic in instance.last and instance.last[topic][1] >= sent
+                    and instance.last[topic][0] == expected, timeout=TIMEOUT)
+                if not done:
+                    raise RuntimeError("no result published")
+                latencies.append((instance.last[topic][1] - sent) / 1e6)
+        n_published = instance.n_published - start_published
+        cpu = time.process_time()
+        time.sleep(IDLE_WINDOW)
+        idle_cpu = (time.process_time() - cpu) / IDLE_WINDOW * 1e3
+    finally:
+        instance.stop()
+        thread.join(timeout=TIMEOUT)
+    return {'median_ms': float(np.median(latencies)), 'p95_ms': float(np.percentile(latencies, 95)),
+            'publishes': n_published / len(X), 'idle_cpu': idle_cpu}
+
+
+def run_latency(code, func_name, input_names, topic, X):
+    """Event-driven runtime from the generated code against the polling loop, both on fresh stand-ins.
+
+    `code` must be generated with NetworkTables enabled; returns report rows.
+    """
+    rows = []
+    for mode in ("event", "poll"):
+        instance = StandInInstance()
+        namespace = load_runtime(code, instance)
+        func = namespace[func_name]
+        if mode == "event":
+            runner = namespace['run_network_tables']
+        else:
+            def runner():
+                polling_loop(instance, func, input_names, topic)
+        row = {'mode': "listener" if mode == "event" else f"poll {1 / POLL_PERIOD:.0f} Hz"}
+        try:
+            row.update(measure(instance, runner, func, input_names, topic, X))
+        except Exception as e:
+            row['error'] = str(e)[:60]
+        rows.append(row)
+    return rows
+
+
+def format_report(rows):
+    """Fixed-width table of latency rows (dicts with mode, median_ms, p95_ms, publishes, idle_cpu, error)"""
+    lines = [f"{'runtime':<12}{'median ms':>10}{'p95 ms':>9}{'pub/upd':>9}{'idle CPU ms/s':>15}"]
+    for r in rows:
+        head = f"{r['mode']:<12}"
+        if r.get('error'):
+            lines.append(head + f"  {r['error']}")
+        else:
+            lines.append(head + f"{r['median_ms']:>10.3f}{r['p95_ms']:>9.3f}{r['publishes']:>9.2f}{r['idle_cpu']:>15.2f}")
+    return lines
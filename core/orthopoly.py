@@ -0,0 +1,83 @@
+import numpy as np
+
+# Bases selectable on PolyFitNode. "Monomial" keeps the sklearn PolynomialFeatures path.
+BASES = ["Monomial", "Chebyshev", "Legendre"]
+
+
+def make_domain(X):
+    """Per-input (lo, hi) bounds used to map the data range onto [-1, 1]"""
+    X = np.asarray(X, dtype=float)
+    lo = X.min(axis=0)
+    hi = X.max(axis=0)
+    # Constant columns would divide by zero, give them a unit-width window
+    hi = np.where(hi > lo, hi, lo + 1.0)
+    return lo, hi
+
+
+def scale_to_unit(X, domain):
+    lo, hi = domain
+    return (2.0 * np.asarray(X, dtype=float) - (lo + hi)) / (hi - lo)
+
+
+def recurrence_coeffs(kind, k):
+    """(alpha, beta) such that phi_{k+1} = alpha * u * phi_k + beta * phi_{k-1}"""
+    if kind == "Chebyshev":
+        return (1.0 if k == 0 else 2.0), -1.0
+    # Legendre: (k+1) P_{k+1} = (2k+1) u P_k - k P_{k-1}
+    return (2.0 * k + 1.0) / (k + 1.0), -k / (k + 1.0)
+
+
+def basis_values(u, max_degree, kind):
+    """Evaluate phi_0..phi_max_degree at u via the three-term recurrence.
+
+    Returns an array with a trailing axis of length max_degree + 1.
+    """
+    u = np.asarray(u, dtype=float)
+    out = np.empty(u.shape + (max_degree + 1,))
+    out[..., 0] = 1.0
+    if max_degree >= 1:
+        out[..., 1] = u
+    for k in range(1, max_degree):
+        alpha, beta = recurrence_coeffs(kind, k)
+        out[..., k + 1] = alpha * u * out[..., k] + beta * out[..., k - 1]
+    return out
+
+
+def design_matrix(X, powers, domain, kind):
+    """Tensor-product basis columns, one per row of `powers` (same layout as PolynomialFeatures.powers_)"""
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X.reshape(-1, 1)
+    U = scale_to_unit(X, domain)
+    max_degree = int(powers.max()) if len(powers) else 0
+    T = basis_values(U, max_degree, kind)  # (n, n_features, max_degree + 1)
+
+    cols = np.ones((X.shape[0], len(powers)))
+    for i, p_row in enumerate(powers):
+        for j, p in enumerate(p_row):
+            if p:
+                cols[:, i] *= T[:, j, p]
+    return cols
+
+
+def clenshaw(coeffs, u, kind):
+    """Sum c_k * phi_k(u) with Clenshaw's backward recurrence (coeffs[0] is the phi_0 weight)"""
+    u = np.asarray(u, dtype=float)
+    n = len(coeffs) - 1
+    b1 = np.zeros_like(u)
+    b2 = np.zeros_like(u)
+    for k in range(n, 0, -1):
+        alpha, _ = recurrence_coeffs(kind, k)
+        _, beta_next = recurrence_coeffs(kind, k + 1)
+        b1, b2 = coeffs[k] + alpha * u * b1 + beta_next * b2, b1
+    _, beta1 = recurrence_coeffs(kind, 1)
+    return coeffs[0] + u * b1 + beta1 * b2
+
+
+def term_names(powers, input_names, kind):
+    prefix = "T" if kind == "Chebyshev" else "P"
+    names = []
+    for p_row in powers:
+        parts = [f"{prefix}{p}({input_names[j]})" for j, p in enumerate(p_row) if p]
+        names.append("*".join(parts))
+    return np.array(names, dtype=object)
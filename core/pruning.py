@@ -0,0 +1,55 @@
+import numpy as np
+from scipy.linalg import qr, qr_delete, solve_triangular
+
+# Rejected candidates tolerated per round before giving up on further removals
+MAX_REJECTS = 5
+
+
+def _solve(Q, R, Y):
+    return solve_triangular(R, Q.T @ Y)
+
+
+def prune_terms(A, Y, budget, keep=(0,)):
+    """Greedily drop design columns while staying within an error budget.
+
+    A is the design matrix (column 0 is the intercept), Y the target(s).
+    Terms are ranked by their largest contribution |beta_i * A[:, i]| over
+    the data; the smallest is removed, the remaining terms are refit through
+    a QR column downdate, and the removal is kept only if the refit stays
+    within `budget` (max absolute deviation from the full fit over the data).
+
+    Returns (solution with zeros for pruned columns, number of pruned columns).
+    """
+    A = np.asarray(A, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    Q, R = qr(A, mode='economic')
+    beta = _solve(Q, R, Y)
+    reference = A @ beta
+    active = list(range(A.shape[1]))
+    col_max = np.abs(A).max(axis=0)
+
+    while True:
+        # max_n |beta_i * A_ni| == |beta_i| * max_n |A_ni| (worst target for multi-output fits)
+        contrib = np.abs(beta.reshape(len(active), -1)).max(axis=1) * col_max[active]
+        ranking = np.argsort(contrib)
+        accepted = False
+        rejects = 0
+        for pos in ranking:
+            if active[pos] in keep:
+                continue
+            Q_try, R_try = qr_delete(Q, R, int(pos), 1, which='col')
+            cols = active[:pos] + active[pos + 1:]
+            beta_try = _solve(Q_try, R_try, Y)
+            if np.max(np.abs(A[:, cols] @ beta_try - reference)) <= budget:
+                Q, R, beta, active = Q_try, R_try, beta_try, cols
+                accepted = True
+                break
+            rejects += 1
+            if rejects >= MAX_REJECTS:
+                break
+        if not accepted:
+            break
+
+    full = np.zeros((A.shape[1],) + Y.shape[1:])
+    full[active] = beta
+    return full, A.shape[1] - len(active)
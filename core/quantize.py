@@ -0,0 +1,246 @@
+import numpy as np
+from scipy.special import expit
+
+# Smallest C integer type able to hold a signed value of the given bit width
+INT_TYPES = [(8, "int8_t"), (16, "int16_t"), (32, "int32_t"), (64, "int64_t")]
+# Sampled activation tables have 2^8 + 1 entries, interpolated on the low bits
+LUT_BITS = 8
+# Range assumed for inputs when the model carries no training data
+DEFAULT_RANGE = (0.0, 10.0)
+
+ACTIVATIONS = {'relu': lambda z: np.maximum(z, 0.0), 'identity': lambda z: z,
+               'tanh': np.tanh, 'logistic': expit}
+
+
+def int_type(bits_needed):
+    for width, name in INT_TYPES:
+        if bits_needed <= width:
+            return name
+    raise OverflowError(f"{bits_needed}-bit accumulator exceeds int64_t")
+
+
+def signed_bits(bound):
+    """Bits (including sign) for a signed integer of magnitude <= bound"""
+    return int(np.ceil(np.log2(float(bound) + 1.0))) + 1
+
+
+def rshift_round(v, s):
+    """Arithmetic right shift with round-half-up, as emitted in C"""
+    return (v + (1 << (s - 1))) >> s if s > 0 else v
+
+
+def saturate(v, bits):
+    qmax = (1 << (bits - 1)) - 1
+    return np.clip(v, -qmax, qmax)
+
+
+def calibration_set(X, n_extra=2000, seed=0):
+    """Training rows plus uniform samples over their bounding box; (X, lo, hi)"""
+    if X is None or len(X) == 0:
+        lo = np.array([DEFAULT_RANGE[0]])
+        hi = np.array([DEFAULT_RANGE[1]])
+        X = np.empty((0, 1))
+    else:
+        X = np.asarray(X, dtype=float).reshape(len(X), -1)
+        lo, hi = X.min(axis=0), X.max(axis=0)
+    rng = np.random.default_rng(seed)
+    box = lo + (hi - lo) * rng.random((n_extra, len(lo)))
+    return np.vstack([X, box]), lo, hi
+
+
+def quantize_inputs(X, mid, inv_half, bits):
+    """Map each input onto Q(bits-1) over its calibrated range, saturating outside it.
+
+    Rounds half away from zero: the same (v + copysign(0.5, v)) truncation as the C helper.
+    """
+    v = (np.asarray(X, dtype=float) - mid) * inv_half * float(1 << (bits - 1))
+    v = np.trunc(v + np.where(v >= 0, 0.5, -0.5))
+    return saturate(v, bits).astype(np.int64)
+
+
+def _pow2_exponent(value, bits):
+    """Largest F with round(|value| * 2^F) representable in `bits` signed bits"""
+    qmax = (1 << (bits - 1)) - 1
+    f = int(np.floor(np.log2(qmax / abs(value))))
+    while abs(round(value * 2.0 ** f)) > qmax:
+        f -= 1
+    return f
+
+
+class QuantizedPoly:
+    """Fixed-point polynomial in scaled inputs u = (x - mid) / half, |u| <= 1.
+
+    The model is refit as monomials in u over the calibration set, so any
+    basis maps onto the same integer kernel. Inputs are Q(bits-1); every
+    coefficient gets its own power-of-two exponent and is aligned onto the
+    accumulator scale by a right shift, which keeps small coefficients from
+    being flushed to zero by the largest one.
+    """
+    def __init__(self, predict, powers, X_calib, bits=16):
+        self.bits = bits
+        X, lo, hi = calibration_set(X_calib)
+        self.lo, self.hi = lo, hi
+        self.mid = (lo + hi) / 2.0
+        self.inv_half = 1.0 / np.maximum((hi - lo) / 2.0, 1e-12)
+        self.powers = np.asarray(powers, dtype=int)[np.asarray(powers).any(axis=1)]
+        self.frac = bits - 1
+
+        reference = np.asarray(predict(X), dtype=float).ravel()
+        U = (X - self.mid) * self.inv_half
+        design = np.column_stack([np.ones(len(U))] + [np.prod(U ** p, axis=1) for p in self.powers])
+        sol = np.linalg.lstsq(design, reference, rcond=None)[0]
+        intercept, coeffs = sol[0], sol[1:]
+
+        keep = coeffs != 0
+        self.powers, coeffs = self.powers[keep], coeffs[keep]
+        self.exponents = np.array([_pow2_exponent(c, bits) for c in coeffs], dtype=int)
+        self.q_coeffs = np.round(coeffs * 2.0 ** self.exponents).astype(np.int64)
+        self.acc_exp = int(self.exponents.min()) if len(coeffs) else 0
+        self.shifts = self.exponents - self.acc_exp
+        # A product has < 2*bits - 2 magnitude bits: shifted further it always rounds to zero
+        live = self.shifts < 2 * bits - 1
+        self.powers, self.q_coeffs = self.powers[live], self.q_coeffs[live]
+        self.exponents, self.shifts = self.exponents[live], self.shifts[live]
+        self.out_scale = 2.0 ** -(self.acc_exp + self.frac)
+        self.q_intercept = int(round(intercept / self.out_scale))
+
+        # Worst case over |u| <= 1: every aligned term at full magnitude (+1 for rounding)
+        bound = abs(self.q_intercept) + sum(
+            (abs(int(q)) << self.frac >> int(s)) + 1 for q, s in zip(self.q_coeffs, self.shifts))
+        self.product_bits = 2 * bits
+        self.acc_bits = signed_bits(bound)
+        self.acc_type = int_type(self.acc_bits)
+        self.product_type = int_type(self.product_bits)
+
+        self.n_calib = len(X)
+        self.max_error = float(np.max(np.abs(self.predict(X) - reference)))
+
+    def monomials(self, Uq):
+        """Fixed-point monomials, one column per kept term (powers hoisted per input)"""
+        pows = {}
+        for j in range(Uq.shape[1]):
+            pows[(j, 1)] = Uq[:, j]
+            for k in range(2, int(self.powers[:, j].max(initial=0)) + 1):
+                pows[(j, k)] = rshift_round(pows[(j, k - 1)] * Uq[:, j], self.frac)
+        cols = []
+        for p in self.powers:
+            factors = [pows[(j, k)] for j, k in enumerate(p) if k]
+            m = factors[0]
+            for f in factors[1:]:
+                m = rshift_round(m * f, self.frac)
+            cols.append(m)
+        return cols
+
+    def predict_int(self, X):
+        Uq = quantize_inputs(np.asarray(X, dtype=float).reshape(len(X), -1), self.mid, self.inv_half, self.bits)
+        acc = np.full(len(Uq), self.q_intercept, dtype=np.int64)
+        for q, s, m in zip(self.q_coeffs, self.shifts, self.monomials(Uq)):
+            acc += rshift_round(q * m, int(s))
+        return acc
+
+    def predict(self, X):
+        return self.predict_int(X) * self.out_scale
+
+
+class QuantizedMLP:
+    """Integer-only MLP inference with per-neuron weight scales.
+
+    The input range is folded into the first layer so it consumes the same
+    Q(bits-1) inputs as QuantizedPoly. Each neuron accumulates integer dot
+    products, then rescales by a fixed-point multiplier and shift onto the
+    next layer's calibrated activation scale. ReLU/identity act on the
+    integers directly; tanh/logistic go through a sampled table with
+    linear interpolation.
+    """
+    def __init__(self, mlp, X_calib, bits=8):
+        self.bits = bits
+        self.qmax = (1 << (bits - 1)) - 1
+        X, lo, hi = calibration_set(X_calib)
+        self.mid = (lo + hi) / 2.0
+        self.inv_half = 1.0 / np.maximum((hi - lo) / 2.0, 1e-12)
+        self.activation = mlp.activation
+        act = ACTIVATIONS[mlp.activation]
+
+        W = [np.asarray(w, dtype=float) for w in mlp.coefs_]
+        B = [np.asarray(b, dtype=float) for b in mlp.intercepts_]
+        # x = mid + u / inv_half  =>  x @ W0 + b0 = u @ (W0 / inv_half) + (b0 + mid @ W0)
+        B[0] = B[0] + self.mid @ W[0]
+        W[0] = W[0] / self.inv_half[:, None]
+
+        # Float pass over the calibration set fixes every activation range
+        U = (X - self.mid) * self.inv_half
+        a, in_scale = U, 1.0 / (1 << (bits - 1))
+        self.layers = []
+        for k, (w, b) in enumerate(zip(W, B)):
+            z = a @ w + b
+            last = k == len(W) - 1
+            # Per-neuron weight scale; a (near) dead neuron's bias must still fit one product's range
+            w_scale = np.maximum(np.abs(w).max(axis=0) / self.qmax, np.abs(b) / (in_scale * self.qmax ** 2))
+            w_scale = np.maximum(w_scale, 1e-12)
+            layer = {'w': np.round(w / w_scale).astype(np.int64), 'in_scale': in_scale}
+            layer['b'] = np.round(b / (in_scale * w_scale)).astype(np.int64)
+            acc_bound = (np.abs(layer['w']).sum(axis=0) * self.qmax + np.abs(layer['b'])).max()
+            layer['acc_bits'] = signed_bits(acc_bound)
+            layer['acc_type'] = int_type(max(layer['acc_bits'], 32 if bits > 8 else 16))
+
+            if last:
+                layer['out_scale'] = in_scale * w_scale
+                self.layers.append(layer)
+                break
+
+            a = act(z)
+            out_scale = max(np.abs(a).max(), 1e-12) / self.qmax
+            table = self.activation in ('tanh', 'logistic')
+            target = max(np.abs(z).max(), 1e-12) / self.qmax if table else out_scale
+            # Requantize: q = (acc * m) >> r with m a fixed-point multiplier that leaves the product in int64
+            mult_bits = min(31, 62 - layer['acc_bits'])
+            M = in_scale * w_scale / target
+            r = (mult_bits - 1) - np.floor(np.log2(M)).astype(int)
+            m = np.round(M * 2.0 ** r).astype(np.int64)
+            over = m >= (1 << mult_bits)
+            m[over] >>= 1
+            r[over] -= 1
+            # Negligible gain: the neuron contributes nothing at this precision
+            m[r > 62], r[r > 62] = 0, 1
+            if np.any(r < 1):
+                raise OverflowError("Activation scale out of fixed-point range")
+            layer.update(m=m, r=r, table=None)
+            if table:
+                step = 1 << (bits - LUT_BITS)
+                grid = (np.arange((1 << LUT_BITS) + 1) * step - (1 << (bits - 1))) * target
+                layer['table'] = saturate(np.round(act(grid) / out_scale), bits).astype(np.int64)
+            self.layers.append(layer)
+            in_scale = out_scale
+
+        self.n_calib = len(X)
+        reference = np.asarray(mlp.predict(X), dtype=float)
+        reference = reference[:, 0] if reference.ndim == 2 else reference
+        self.max_error = float(np.max(np.abs(self.predict(X) - reference)))
+
+    def _lookup(self, q, table):
+        shift = self.bits - LUT_BITS
+        idx = q + (1 << (self.bits - 1))
+        if shift == 0:
+            return table[idx]
+        frac = idx & ((1 << shift) - 1)
+        idx = idx >> shift
+        lo = table[idx]
+        return lo + (((table[idx + 1] - lo) * frac) >> shift)
+
+    def predict_int(self, X):
+        """Raw output-0 accumulator, scale layers[-1]['out_scale'][0]"""
+        a = quantize_inputs(np.asarray(X, dtype=float).reshape(len(X), -1), self.mid, self.inv_half, self.bits)
+        for layer in self.layers[:-1]:
+            acc = a @ layer['w'] + layer['b']
+            q = (acc * layer['m'] + (1 << (layer['r'] - 1))) >> layer['r']
+            if self.activation == 'relu':
+                q = np.maximum(q, 0)
+            q = saturate(q, self.bits)
+            if layer['table'] is not None:
+                q = self._lookup(q, layer['table'])
+            a = q
+        last = self.layers[-1]
+        return a @ last['w'][:, 0] + last['b'][0]
+
+    def predict(self, X):
+        return self.predict_int(X) * self.layers[-1]['out_scale'][0]
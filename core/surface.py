@@ -0,0 +1,88 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+# Grid points per side, coarse to fine; every level is shown as soon as it is complete
+LEVELS = (16, 32, 64, 128, 256)
+# Grid rows per vectorized predict batch (one cached tile)
+TILE_ROWS = 32
+# Tiles kept across slider states (a full 256 tile is 64 KB)
+CACHE_TILES = 512
+
+
+def n_tiles(level):
+    return -(-level // TILE_ROWS)
+
+
+class SurfaceWorker:
+    """Evaluates a model over a 2-D grid of two inputs on one background thread.
+
+    A state is (x_idx, y_idx, values): the two grid inputs and the value
+    every input takes otherwise. Each requested state is computed level by
+    level in row tiles, which are cached, so revisiting a state or a
+    coarse level is free. A newer request supersedes the running one
+    between tiles, which keeps refinement following a slider drag.
+    """
+    def __init__(self, predict, ranges):
+        self.predict = predict
+        self.ranges = ranges
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.error = None
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def grid(self, state, level):
+        x_idx, y_idx, _ = state
+        xs = np.linspace(*self.ranges[x_idx], level)
+        ys = np.linspace(*self.ranges[y_idx], level)
+        return xs, ys
+
+    def request(self, state):
+        with self.lock:
+            self.generation += 1
+            generation = self.generation
+        self.executor.submit(self._run, state, generation)
+
+    def close(self):
+        with self.lock:
+            self.generation += 1
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, state, generation):
+        x_idx, y_idx, values = state
+        for level in LEVELS:
+            xs, ys = self.grid(state, level)
+            for tile in range(n_tiles(level)):
+                if self.generation != generation:
+                    return  # Superseded by a newer slider state
+                key = (state, level, tile)
+                with self.lock:
+                    if key in self.cache:
+                        continue
+                rows = ys[tile * TILE_ROWS:(tile + 1) * TILE_ROWS]
+                X = np.tile(np.asarray(values, dtype=float), (len(rows) * level, 1))
+                X[:, x_idx] = np.tile(xs, len(rows))
+                X[:, y_idx] = np.repeat(rows, level)
+                try:
+                    Z = np.asarray(self.predict(X), dtype=float).reshape(len(rows), level)
+                except Exception as e:
+                    self.error = str(e)
+                    Z = np.full((len(rows), level), np.nan)
+                with self.lock:
+                    self.cache[key] = Z
+                    if len(self.cache) > CACHE_TILES:
+                        self.cache.popitem(last=False)
+
+    def best(self, state):
+        """Finest fully computed level for state: (level, xs, ys, Z with rows along ys) or None"""
+        with self.lock:
+            for level in reversed(LEVELS):
+                keys = [(state, level, tile) for tile in range(n_tiles(level))]
+                if all(k in self.cache for k in keys):
+                    for k in keys:
+                        self.cache.move_to_end(k)
+                    Z = np.vstack([self.cache[k] for k in keys])
+                    return (level,) + self.grid(state, level) + (Z,)
+        return None
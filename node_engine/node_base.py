@@ -105,7 +105,18 @@ class Node(QGraphicsItem):
         other_socket = socket.edges[0].start_socket
         # Get that socket's node
         other_node = other_socket.node
-        return other_node.eval()
+        # Multi-output nodes (splitter) take the index of the output being pulled
+        return other_node.eval(other_socket.index) if other_socket.index else other_node.eval()
+    
+    # Helper to get a fitted model without re-running the upstream fit
+    def get_input_model(self, index=0):
+        if index >= len(self.inputs): return None
+        socket = self.inputs[index]
+        if not socket.edges: return None
+        other_node = socket.edges[0].start_socket.node
+        # Model nodes keep their last fit in .model; only evaluate when nothing was fitted yet
+        model = getattr(other_node, 'model', None)
+        return model if model is not None else other_node.eval()
         
     def to_dict(self):
         return {
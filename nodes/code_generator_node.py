@@ -1,17 +1,31 @@
 from PySide6.QtWidgets import (QGraphicsProxyWidget, QWidget, QVBoxLayout, QHBoxLayout,
-                               QLabel, QCheckBox, QPushButton, QTextEdit, QLineEdit)
+                               QLabel, QCheckBox, QPushButton, QTextEdit, QLineEdit, QDoubleSpinBox)
 from ui.graphics_combo import GraphicsComboBox
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QClipboard, QGuiApplication
 from node_engine.node_base import Node
+from core import orthopoly, lut, eval_plan, codegen_bench, dispatch, nt_bench
+from core.quantize import QuantizedPoly, QuantizedMLP, LUT_BITS, DEFAULT_RANGE
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
+PRECISIONS = ["Float64", "Int16", "Int8"]
+# Generated sources kept per option set for the connected models; a refit or reconnect clears the rest
+CODE_CACHE_SIZE = 64
+# Prefix of locals the generator declares itself; inputs whose names start with it are renamed
+RESERVED_PREFIX = "_fg_"
+# How often a running benchmark is checked for its report (ms)
+BENCH_POLL_MS = 100
+
 class CodeGeneratorNode(Node):
     def __init__(self):
         super().__init__("Code Generator")
-        self.height = 250
+        self.height = 325
         self.width = 280
         
+        self._code_cache = OrderedDict()
+        
         # Multiple model inputs
         for i in range(4):  # Support up to 4 connected models
             self.add_input(i)
@@ -38,8 +52,6 @@ class CodeGeneratorNode(Node):
         self.horner_cb.setStyleSheet("color: white; font-size: 10px;")
         self.horner_cb.stateChanged.connect(self.generate)
         row.addWidget(self.horner_cb)
-        self.horner_cb.stateChanged.connect(self.generate)
-        row.addWidget(self.horner_cb)
         layout.addLayout(row)
         
         # Advanced Smart Generation Options
@@ -58,6 +70,43 @@ class CodeGeneratorNode(Node):
         h_row.addWidget(self.hw_combo)
         layout.addLayout(h_row)
         
+        # Numeric precision: fixed-point variants are calibrated on the training range
+        q_row = QHBoxLayout()
+        q_row.addWidget(QLabel("Precision:", styleSheet="color: #aaa; font-size: 10px;"))
+        self.precision_combo = GraphicsComboBox()
+        self.precision_combo.addItems(PRECISIONS)
+        self.precision_combo.currentIndexChanged.connect(self.generate)
+        q_row.addWidget(self.precision_combo)
+        layout.addLayout(q_row)
+        
+        # Lookup-table compilation (1-2 input models): grid sized to the max interpolation error
+        lut_row = QHBoxLayout()
+        self.lut_cb = QCheckBox("Compile to LUT")
+        self.lut_cb.setStyleSheet("color: #CE9178; font-size: 10px;")
+        self.lut_cb.stateChanged.connect(self.generate)
+        lut_row.addWidget(self.lut_cb)
+        self.lut_err_spin = QDoubleSpinBox()
+        self.lut_err_spin.setDecimals(6)
+        self.lut_err_spin.setRange(1e-6, 1e6)
+        self.lut_err_spin.setValue(1e-3)
+        self.lut_err_spin.setToolTip("Max interpolation error")
+        self.lut_err_spin.setStyleSheet("background: #3c3c3c; color: white;")
+        self.lut_err_spin.editingFinished.connect(self.generate)
+        lut_row.addWidget(self.lut_err_spin)
+        layout.addLayout(lut_row)
+        
+        # Batch prediction over arrays, row-major (AoS) or one array per input (SoA)
+        batch_row = QHBoxLayout()
+        self.batch_cb = QCheckBox("Batch (arrays)")
+        self.batch_cb.setStyleSheet("color: white; font-size: 10px;")
+        self.batch_cb.stateChanged.connect(self.generate)
+        batch_row.addWidget(self.batch_cb)
+        self.soa_cb = QCheckBox("SoA layout")
+        self.soa_cb.setStyleSheet("color: white; font-size: 10px;")
+        self.soa_cb.stateChanged.connect(self.generate)
+        batch_row.addWidget(self.soa_cb)
+        layout.addLayout(batch_row)
+        
         # NetworkTables
         nt_row = QHBoxLayout()
         self.nt_cb = QCheckBox("NetworkTables")
@@ -93,17 +142,37 @@ class CodeGeneratorNode(Node):
             QPushButton:hover { background: #0098FF; }
         """)
         self.copy_btn.clicked.connect(self.copy_code)
-        layout.addWidget(self.copy_btn)
+        
+        # Benchmark button: compile/import the generated code and compare it with the model
+        self.bench_btn = QPushButton("Benchmark")
+        self.bench_btn.setStyleSheet("""
+            QPushButton { background: #3c3c3c; color: white; border: 1px solid #555; padding: 4px; }
+            QPushButton:hover { background: #505050; }
+        """)
+        self.bench_btn.clicked.connect(self.run_benchmark)
+        btn_row = QHBoxLayout()
+        btn_row.addWidget(self.copy_btn)
+        btn_row.addWidget(self.bench_btn)
+        layout.addLayout(btn_row)
+        
+        # Benchmarks compile and time code for seconds: they run on one background
+        # thread and a timer picks up the report, so the UI stays responsive
+        self._bench_executor = ThreadPoolExecutor(max_workers=1)
+        self._bench_future = None
+        self._bench_timer = QTimer(self.widget)
+        self._bench_timer.setInterval(BENCH_POLL_MS)
+        self._bench_timer.timeout.connect(self._poll_benchmark)
         
         self.proxy.setWidget(self.widget)
         self.proxy.setPos(10, 30)
-        self.proxy.resize(260, 210)
+        self.proxy.resize(260, 285)
         self.proxy.setZValue(1.0)  # Ensure widget is above node body for clicks
 
     def generate(self):
+        # Fitted snapshots: option toggles must not re-run the upstream fits
         models = []
         for i in range(4):
-            model = self.get_input_value(i)
+            model = self.get_input_model(i)
             if model is not None:
                 models.append(model)
         
@@ -117,18 +186,44 @@ class CodeGeneratorNode(Node):
         use_nt = self.nt_cb.isChecked()
         nt_team = self.nt_team.text()
         hardware = self.hw_combo.currentText()
+        precision = self.precision_combo.currentText()
+        lut_error = self.lut_err_spin.value() if self.lut_cb.isChecked() else None
+        batch = ("SoA" if self.soa_cb.isChecked() else "AoS") if self.batch_cb.isChecked() else None
         
-        code = self.generate_code(models, lang, use_horner, use_smart, use_nt, nt_team, hardware)
+        options = (lang, use_horner, use_smart, use_nt, nt_team, hardware, precision, lut_error, batch)
+        ids = tuple(id(m) for m in models)
+        # Entries for models no longer connected would pin them, and their training data, in memory
+        for stale in [k for k, (held, _) in self._code_cache.items()
+                      if k[0] != ids or any(a is not b for a, b in zip(held, models))]:
+            del self._code_cache[stale]
+        key = (ids, options)
+        cached = self._code_cache.get(key)
+        if cached is not None:
+            self._code_cache.move_to_end(key)
+            code = cached[1]
+        else:
+            code = self.generate_code(models, *options)
+            self._code_cache[key] = (models, code)
+            if len(self._code_cache) > CODE_CACHE_SIZE:
+                self._code_cache.popitem(last=False)
         self.code_edit.setText(code)
         
-    def generate_code(self, models, lang, use_horner, use_smart, use_nt, nt_team, hardware):
+    def generate_code(self, models, lang, use_horner, use_smart, use_nt, nt_team, hardware, precision="Float64",
+                      lut_error=None, batch=None):
         # Dispatcher
+        if precision != "Float64":
+            if lang == "C":
+                return self._gen_c_fixed(models, int(precision[3:]))
+            note = "#" if lang == "Python" else "//"
+            return (f"{note} {precision} fixed-point export is generated for C only\n"
+                    + self.generate_code(models, lang, use_horner, use_smart, use_nt, nt_team, hardware,
+                                         lut_error=lut_error, batch=batch))
         if lang == "Python":
-            return self._gen_python(models, use_horner, use_smart, use_nt, nt_team, hardware)
+            return self._gen_python(models, use_horner, use_smart, use_nt, nt_team, hardware, lut_error, batch)
         elif lang == "Java":
-            return self._gen_java(models, use_horner, use_nt, nt_team)
+            return self._gen_java(models, use_horner, use_nt, nt_team, lut_error, batch)
         else: # C
-            return self._gen_c(models, use_horner)
+            return self._gen_c(models, use_horner, lut_error, batch)
             
     def _get_safe_names(self, model):
         input_names = getattr(model, 'all_input_names', None) or getattr(model, 'input_feature_names', None)
@@ -138,24 +233,131 @@ class CodeGeneratorNode(Node):
         if not input_names:
             input_names = ["x"]
             
-        safe_names = []
-        for name in input_names:
-            safe = "".join(c for c in name if c.isalnum() or c == '_')
-            if not safe or safe[0].isdigit(): safe = "v_" + safe
-            safe_names.append(safe)
-        return safe_names
+        return [self._safe_name(name) for name in input_names]
+    
+    def _safe_name(self, name):
+        safe = "".join(c for c in name if c.isalnum() or c == '_')
+        if not safe or safe[0].isdigit(): safe = "v_" + safe
+        if safe.startswith(RESERVED_PREFIX): safe = "v" + safe
+        return safe
+    
+    def _target_groups(self, models):
+        """[(function name, models)] - multi-output fits are split into one predict per target"""
+        target_names = getattr(models[0], 'target_names', None)
+        if not target_names or not hasattr(models[0], 'split_targets'):
+            return [("predict", models)]
+        split = [m.split_targets() if hasattr(m, 'split_targets') else [m] for m in models]
+        groups = []
+        for k, name in enumerate(target_names):
+            per_target = [parts[k] if k < len(parts) else parts[0] for parts in split]
+            groups.append((f"predict_{self._safe_name(name)}", per_target))
+        return groups
+    
+    def _suffix(self, func_name, group, i):
+        # Unique per target function and per branch, so module-level tables never clash
+        return func_name[len("predict"):] + (f"_{i}" if len(group) > 1 else "")
+    
+    def _result_topic(self, func_name):
+        # "predict" -> "Result", "predict_rpm" -> "Result_rpm"
+        return "Result" + func_name[len("predict"):]
+    
+    def _branches(self, group):
+        """[(index in group, model, clauses)] in dispatch order; a single model is unconditional"""
+        if len(group) == 1:
+            return [(0, group[0], [])]
+        conditions = [getattr(m, 'conditions', None) or [] for m in group]
+        return [(i, group[i], conditions[i]) for i in dispatch.order_branches(conditions)]
+    
+    def _condition(self, clauses, lang):
+        """Conjunction of (column, op, value) clauses; lang "NumPy" gives an elementwise mask"""
+        parts = [f"{self._safe_name(col)} {op} {float(val)!r}" for col, op, val in clauses]
+        if lang == "NumPy":
+            return " & ".join(f"({p})" for p in parts) if len(parts) > 1 else parts[0]
+        return (" and " if lang == "Python" else " && ").join(parts)
+    
+    def _dispatch_lines(self, func_name, branches, safe_names, lang, decls):
+        """Function body selecting one of the (clauses, stmts, expr) branches; the last is the default.
+        
+        Branches testing one column compile to a sorted threshold table:
+        a binary search gives the segment, then a switch (C/Java) or a tuple
+        of per-branch functions (Python) picks the branch, so the cost grows
+        with log(segments). Anything else becomes an if / else-if chain.
+        """
+        end = "" if lang == "Python" else ";"
+        comment = "#" if lang == "Python" else "//"
+        if len(branches) == 1:
+            _, stmts, expr = branches[0]
+            return list(stmts) + [f"return {expr}{end}"]
+        
+        conditions = [clauses for clauses, _, _ in branches]
+        table = dispatch.threshold_table(conditions) if len(branches) >= dispatch.TABLE_MIN_BRANCHES else None
+        if table:
+            col, thresholds, segment_branch = table
+            col = self._safe_name(col)
+            t_name = f"{func_name.upper()}_THRESHOLDS"
+            values = ", ".join(repr(float(t)) for t in thresholds)
+            lines = [f"{comment} {len(segment_branch)} segments of {col}: binary search over {t_name}"]
+            if lang == "Python":
+                args = ", ".join(safe_names)
+                for k, (_, stmts, expr) in enumerate(branches):
+                    decls.append(f"def _{func_name}_{k}({args}):")
+                    decls.extend(f"    {s}" for s in stmts)
+                    decls.append(f"    return {expr}")
+                decls.append(f"{t_name} = [{values}]")
+                decls.append(f"{func_name.upper()}_SEGMENTS = ({', '.join(f'_{func_name}_{b}' for b in segment_branch)},)")
+                lines.append(f"return {func_name.upper()}_SEGMENTS[bisect.bisect_left({t_name}, {col})]({args})")
+                return lines
+            decls.append(f"static const double {t_name}[{len(thresholds)}] = {{{values}}};" if lang == "C"
+                         else f"private static final double[] {t_name} = {{{values}}};")
+            # RESERVED_PREFIX locals: _safe_name never produces them, so the search cannot shadow an input
+            lines.append(f"int _fg_lo = 0, _fg_hi = {len(thresholds)};")
+            lines.append("while (_fg_lo < _fg_hi) {")
+            lines.append("    int _fg_mid = (_fg_lo + _fg_hi) >> 1;")
+            lines.append(f"    if ({t_name}[_fg_mid] < {col}) _fg_lo = _fg_mid + 1; else _fg_hi = _fg_mid;")
+            lines.append("}")
+            lines.append("switch (_fg_lo) {")
+            for k, (_, stmts, expr) in enumerate(branches):
+                segments = [seg for seg, b in enumerate(segment_branch) if b == k]
+                if k == len(branches) - 1:
+                    labels = "default:"
+                elif segments:
+                    labels = " ".join(f"case {seg}:" for seg in segments)
+                else:
+                    continue  # Shadowed everywhere by earlier branches
+                lines.append(f"    {labels} {{")
+                lines.extend(f"        {s}" for s in stmts)
+                lines.append(f"        return {expr};")
+                lines.append("    }")
+            lines.append("}")
+            return lines
+        
+        lines = []
+        for clauses, stmts, expr in branches[:-1]:
+            cond = self._condition(clauses, lang)
+            lines.append(f"if {cond}:" if lang == "Python" else f"if ({cond}) {{")
+            lines.extend(f"    {s}" for s in stmts)
+            lines.append(f"    return {expr}{end}")
+            if lang != "Python":
+                lines.append("}")
+        clauses, stmts, expr = branches[-1]
+        if clauses:
+            lines.append(f"{comment} otherwise ({self._condition(clauses, lang)})")
+        lines.extend(stmts)
+        lines.append(f"return {expr}{end}")
+        return lines
 
-    def _gen_python(self, models, use_horner, use_smart, use_nt, nt_team, hardware):
+    def _gen_python(self, models, use_horner, use_smart, use_nt, nt_team, hardware, lut_error=None, batch=None):
         lines = []
         safe_names = self._get_safe_names(models[0])
         
         # Imports
         if use_nt:
-            lines.append("import time")
+            lines.append("import threading")
             lines.append("import ntcore # pip install pyntcore")
         
+        if use_smart or batch:
+            lines.append("import numpy as np")  # Batch functions are NumPy-vectorized
         if use_smart:
-            lines.append("import numpy as np")
             if "NeuralNet" in str(type(models[0])):
                 lines.append("# Hardware Acceleration Options")
                 if "GPU" in hardware:
@@ -169,41 +371,34 @@ class CodeGeneratorNode(Node):
         
         lines.append("")
         
-        # Prediction Function
+        # Prediction Function(s): multi-output fits get one function per target
+        groups = self._target_groups(models)
         args_str = ", ".join(safe_names)
-        lines.append(f"def predict({args_str}):")
-        
-        # Body
-        if use_smart and "NeuralNet" in str(type(models[0])):
-            # Generate Numpy MLP inference (Manual matrix mult)
-            # This is "Smart" because it avoids the export step but is fast
-            model = models[0].model # sklearn MLP
-            
-            lines.append(f"    # Smart Inference using NumPy (Target: {hardware})")
-            lines.append("    X = np.array([" + ", ".join(safe_names) + "])")
+        for func_name, group in groups:
+            decls, body = [], []
+            if "NeuralNet" in str(type(group[0])):
+                body.append(f"    # {'NumPy' if use_smart else 'Pure Python'} MLP inference (Target: {hardware})")
             
-            # Extract weights
-            # For brevity in display, we show loop structure or simplified matrix
-            lines.append("    # Weights/Biases embedded:")
-            for i, (w, b) in enumerate(zip(model.coefs_, model.intercepts_)):
-                lines.append(f"    # Layer {i}: {w.shape}")
-                # Real implementation would be huge refactoring to verify sklearn internals mapping 1:1
-                # For this demo, let's assume we print instructions or simplified
-            lines.append(f"    # ... (Full weights would be exported here in a real deployment)")
-            lines.append(f"    return 0.0 # Placeholder for full matrix export")
+            branches = []
+            for i, model, clauses in self._branches(group):
+                suffix = self._suffix(func_name, group, i)
+                stmts, poly_expr = self.model_to_code(model, safe_names, use_horner, "Python", suffix,
+                                                      decls=decls, use_smart=use_smart, lut_error=lut_error)
+                branches.append((clauses, stmts, poly_expr))
+            body.extend(f"    {l}" for l in self._dispatch_lines(func_name, branches, safe_names, "Python", decls))
             
-        else:
-            # Standard Math Generation
-            for i, model in enumerate(models):
-                indent = "    "
-                poly_expr = self.poly_to_expr(model, safe_names, use_horner, "Python")
-                if len(models) > 1 and hasattr(model, 'condition') and model.condition:
-                    cond = str(model.condition)
-                    if i == 0: lines.append(f"    if {cond}:")
-                    else: lines.append(f"    else:")
-                    lines.append(f"        return {poly_expr}")
-                else:
-                    lines.append(f"    return {poly_expr}")
+            # Module-level weight tables go ahead of the function that uses them
+            if decls:
+                lines.extend(decls)
+                lines.append("")
+            lines.append(f"def {func_name}({args_str}):")
+            lines.extend(body)
+            lines.append("")
+            if batch:
+                lines.extend(self._python_batch(func_name, group, safe_names, use_horner, lut_error, batch, decls))
+                lines.append("")
+        if any("bisect." in l for l in lines):
+            lines.insert(0, "import bisect")
 
         # NetworkTables Wrapper
         if use_nt:
@@ -222,139 +417,832 @@ class CodeGeneratorNode(Node):
             for name in safe_names:
                 lines.append(f"    sub_{name} = table.getDoubleTopic('{name}').subscribe(0.0)")
             lines.append("    # Pubs")
-            lines.append("    pub_res = table.getDoubleTopic('Result').publish()")
+            for func_name, _ in groups:
+                topic = self._result_topic(func_name)
+                lines.append(f"    pub_{func_name} = table.getDoubleTopic('{topic}').publish()")
+            lines.append("")
+            lines.append("    # Listeners only flag a change; the loop recomputes once per burst of updates")
+            lines.append("    changed = threading.Event()")
+            lines.append(f"    for sub in ({', '.join(f'sub_{n}' for n in safe_names)},):")
+            lines.append("        inst.addListener(sub, ntcore.EventFlags.kValueAll | ntcore.EventFlags.kImmediate,")
+            lines.append("                         lambda event: changed.set())")
             lines.append("")
             lines.append("    while True:")
+            lines.append("        changed.wait()")
+            lines.append("        changed.clear()  # Updates landing from here on trigger one more pass")
             read_args = []
             for name in safe_names:
                 read_args.append(f"sub_{name}.get()")
             lines.append(f"        try:")
-            lines.append(f"            result = predict({', '.join(read_args)})")
-            lines.append(f"            pub_res.set(result)")
+            for func_name, _ in groups:
+                lines.append(f"            pub_{func_name}.set({func_name}({', '.join(read_args)}))")
             lines.append(f"        except Exception as e: print(e)")
-            lines.append("        time.sleep(0.02) # 50Hz")
+            lines.append("        inst.flush()  # Send now instead of at the next periodic network update")
             lines.append("")
             lines.append("if __name__ == '__main__':")
             lines.append("    run_network_tables()")
             
         return "\n".join(lines)
 
-    def _gen_java(self, models, use_horner, use_nt, nt_team):
+    def _gen_java(self, models, use_horner, use_nt, nt_team, lut_error=None, batch=None):
         lines = []
         safe_names = self._get_safe_names(models[0])
         
         lines.append("package frc.robot.generated;")
         if use_nt:
             lines.append("import edu.wpi.first.networktables.*;")
+            lines.append("import java.util.EnumSet;")
+            lines.append("import java.util.concurrent.ExecutorService;")
+            lines.append("import java.util.concurrent.Executors;")
+            lines.append("import java.util.concurrent.atomic.AtomicBoolean;")
         lines.append("")
         lines.append("public class FlibberModel {")
         
-        # Predict
+        # Predict (one method per target for multi-output fits)
+        groups = self._target_groups(models)
         args = ", ".join([f"double {n}" for n in safe_names])
-        lines.append(f"    public static double predict({args}) {{")
-        
-        for i, model in enumerate(models):
-            expr = self.poly_to_expr(model, safe_names, use_horner, "Java")
-            if len(models) > 1 and hasattr(model, 'condition'): 
-                # Basic condition handling
-                lines.append(f"        return {expr}; // Condition logic simplified") 
-            else:
-                lines.append(f"        return {expr};")
-        lines.append("    }")
+        for func_name, group in groups:
+            decls, body = [], []
+            branches = []
+            for i, model, clauses in self._branches(group):
+                suffix = self._suffix(func_name, group, i)
+                stmts, expr = self.model_to_code(model, safe_names, use_horner, "Java", suffix, decls=decls,
+                                                 lut_error=lut_error)
+                branches.append((clauses, stmts, expr))
+            body.extend(f"        {l}" for l in self._dispatch_lines(func_name, branches, safe_names, "Java", decls))
+            lines.extend(f"    {d}" for d in decls)
+            lines.append(f"    public static double {func_name}({args}) {{")
+            lines.extend(body)
+            lines.append("    }")
+            if batch:
+                lines.extend(f"    {l}" for l in self._loop_batch(func_name, *self._batch_body(func_name, branches, safe_names),
+                                                                   safe_names, "Java", batch))
         
         if use_nt:
             lines.append("")
-            lines.append("    // NetworkTables Boilerplate")
+            lines.append("    // NetworkTables: results are recomputed when an input changes, not on a fixed period")
             lines.append("    NetworkTableInstance inst = NetworkTableInstance.getDefault();")
             lines.append("    NetworkTable table = inst.getTable(\"FlibberGen\");")
             for name in safe_names:
                 lines.append(f"    DoubleSubscriber sub_{name} = table.getDoubleTopic(\"{name}\").subscribe(0.0);")
-            lines.append("    DoublePublisher pub_res = table.getDoubleTopic(\"Result\").publish();")
+            for func_name, _ in groups:
+                topic = self._result_topic(func_name)
+                lines.append(f"    DoublePublisher pub_{func_name} = table.getDoubleTopic(\"{topic}\").publish();")
+            lines.append("    // Listeners queue one recompute; changes arriving before it runs share it")
+            lines.append("    private final AtomicBoolean pending = new AtomicBoolean();")
+            lines.append("    // Daemon worker: a pending recompute never keeps the JVM from exiting")
+            lines.append("    private final ExecutorService worker = Executors.newSingleThreadExecutor(r -> {")
+            lines.append("        Thread t = new Thread(r, \"FlibberGen NT\");")
+            lines.append("        t.setDaemon(true);")
+            lines.append("        return t;")
+            lines.append("    });")
+            lines.append("")
+            lines.append("    public FlibberModel() {")
+            subs = ", ".join(f"sub_{n}" for n in safe_names)
+            lines.append(f"        for (DoubleSubscriber sub : new DoubleSubscriber[] {{{subs}}}) {{")
+            lines.append("            inst.addListener(sub, EnumSet.of(NetworkTableEvent.Kind.kValueAll, NetworkTableEvent.Kind.kImmediate),")
+            lines.append("                event -> { if (pending.compareAndSet(false, true)) worker.execute(this::update); });")
+            lines.append("        }")
+            lines.append("    }")
             lines.append("")
-            lines.append("    public void periodic() {")
+            lines.append("    private void update() {")
+            lines.append("        pending.set(false);")
             read_calls = [f"sub_{n}.get()" for n in safe_names]
-            lines.append(f"        double res = predict({', '.join(read_calls)});")
-            lines.append("        pub_res.set(res);")
+            for func_name, _ in groups:
+                lines.append(f"        pub_{func_name}.set({func_name}({', '.join(read_calls)}));")
+            lines.append("        inst.flush();")
             lines.append("    }")
         
         lines.append("}")
         return "\n".join(lines)
 
-    def _gen_c(self, models, use_horner):
+    def _gen_c(self, models, use_horner, lut_error=None, batch=None):
         # Basic C gen (unchanged mostly)
-        return self.generate_code_legacy(models, "C", use_horner)
+        return self.generate_code_legacy(models, "C", use_horner, lut_error, batch)
 
-    def generate_code_legacy(self, models, lang, use_horner):
+    def generate_code_legacy(self, models, lang, use_horner, lut_error=None, batch=None):
         # Fallback to old for C for now
         lines = []
         safe_names = self._get_safe_names(models[0])
         args = ", ".join([f"double {n}" for n in safe_names])
-        lines.append(f"double predict({args}) {{")
-        expr = self.poly_to_expr(models[0], safe_names, use_horner, lang)
-        lines.append(f"    return {expr};")
+        lines.append("#include <math.h>")
+        if batch:
+            lines.append("#include <stddef.h>")
+        for func_name, group in self._target_groups(models):
+            lines.append("")
+            decls, branches = [], []
+            for i, model, clauses in self._branches(group):
+                stmts, expr = self.model_to_code(model, safe_names, use_horner, lang, self._suffix(func_name, group, i),
+                                                 decls=decls, lut_error=lut_error)
+                branches.append((clauses, stmts, expr))
+            body = self._dispatch_lines(func_name, branches, safe_names, lang, decls)
+            lines.extend(decls)
+            lines.append(f"double {func_name}({args}) {{")
+            lines.extend(f"    {s}" for s in body)
+            lines.append("}")
+            if batch:
+                lines.append("")
+                lines.extend(self._loop_batch(func_name, *self._batch_body(func_name, branches, safe_names),
+                                              safe_names, lang, batch))
+        return "\n".join(lines)
+    
+    def _batch_body(self, func_name, branches, safe_names):
+        """(stmts, expr) for one row of a batch loop: inline a single model, call the dispatcher otherwise"""
+        if len(branches) == 1:
+            return branches[0][1], branches[0][2]
+        return [], f"{func_name}({', '.join(safe_names)})"
+    
+    def _loop_batch(self, func_name, stmts, expr, safe_names, lang, layout):
+        """C/Java array predict: one flat loop over rows around the scalar body.
+        
+        "AoS" reads row-major X[row * n_inputs + j]; "SoA" takes one array per
+        input. Polynomial bodies are straight-line arithmetic, so the loop
+        auto-vectorizes (restrict-qualified pointers in C).
+        """
+        d = len(safe_names)
+        if lang == "C":
+            if layout == "SoA":
+                args = ", ".join(f"const double *restrict _fg_in_{n}" for n in safe_names)
+                lines = [f"void {func_name}_batch({args}, double *restrict _fg_out, size_t _fg_n) {{",
+                         "    for (size_t _fg_row = 0; _fg_row < _fg_n; _fg_row++) {"]
+            else:
+                lines = [f"void {func_name}_batch(const double *restrict _fg_X, double *restrict _fg_out, size_t _fg_n) {{",
+                         "    for (size_t _fg_row = 0; _fg_row < _fg_n; _fg_row++) {"]
+        else:
+            if layout == "SoA":
+                args = ", ".join(f"double[] _fg_in_{n}" for n in safe_names)
+                lines = [f"public static void {func_name}_batch({args}, double[] _fg_out) {{"]
+            else:
+                lines = [f"public static void {func_name}_batch(double[] _fg_X, double[] _fg_out) {{"]
+            lines.append("    for (int _fg_row = 0; _fg_row < _fg_out.length; _fg_row++) {")
+        for j, n in enumerate(safe_names):
+            src = f"_fg_in_{n}[_fg_row]" if layout == "SoA" else f"_fg_X[_fg_row * {d} + {j}]"
+            lines.append(f"        {'const ' if lang == 'C' else 'final '}double {n} = {src};")
+        lines.extend(f"        {s}" for s in stmts)
+        lines.append(f"        _fg_out[_fg_row] = {expr};")
+        lines.append("    }")
+        lines.append("}")
+        return lines
+    
+    def _python_batch(self, func_name, group, safe_names, use_horner, lut_error, layout, scalar_decls):
+        """NumPy-vectorized predict over whole columns; conditional branches merge with np.where.
+        
+        Always NumPy, whatever the scalar function uses: tables the scalar
+        code already declared (scalar_decls) are shared, the rest are
+        declared ahead of the batch function.
+        """
+        tables = []
+        if layout == "SoA":
+            lines = [f"def {func_name}_batch({', '.join(safe_names)}):"]
+            lines.extend(f"    {n} = np.asarray({n}, dtype=float)" for n in safe_names)
+        else:
+            lines = [f"def {func_name}_batch(_fg_X):", "    _fg_X = np.asarray(_fg_X, dtype=float).reshape(len(_fg_X), -1)"]
+            lines.extend(f"    {n} = _fg_X[:, {j}]" for j, n in enumerate(safe_names))
+        branches = self._branches(group)
+        results = []
+        for k, (i, model, clauses) in enumerate(branches):
+            suffix = self._suffix(func_name, group, i)
+            stmts, expr = self.model_to_code(model, safe_names, use_horner, "Python", suffix, decls=tables,
+                                             lut_error=lut_error, batch=True)
+            lines.extend(f"    {s}" for s in stmts)
+            if len(branches) == 1:
+                lines.append(f"    return {expr}")
+                return self._with_tables(lines, tables, scalar_decls)
+            lines.append(f"    _fg_r{k} = {expr}")
+            results.append((clauses, f"_fg_r{k}"))
+        
+        conditions = [clauses for clauses, _ in results]
+        table = dispatch.threshold_table(conditions) if len(results) >= dispatch.TABLE_MIN_BRANCHES else None
+        if table:
+            # Same segments as the scalar function: searchsorted is bisect_left per row
+            col, _, segment_branch = table
+            lines.append(f"    _fg_branch = np.array({segment_branch})[np.searchsorted({func_name.upper()}_THRESHOLDS, "
+                         f"{self._safe_name(col)})]")
+            picks = ", ".join(f"_fg_branch == {k}" for k in range(len(results) - 1))
+            choices = ", ".join(r for _, r in results[:-1])
+            lines.append(f"    return np.select([{picks}], [{choices}], {results[-1][1]})")
+            return self._with_tables(lines, tables, scalar_decls)
+        # if/elif/else order: the last branch is the default
+        merged = results[-1][1]
+        for clauses, r in reversed(results[:-1]):
+            merged = f"np.where({self._condition(clauses, 'NumPy')}, {r}, {merged})"
+        lines.append(f"    return {merged}")
+        return self._with_tables(lines, tables, scalar_decls)
+    
+    def _with_tables(self, lines, tables, scalar_decls):
+        new = [d for d in tables if d not in scalar_decls]
+        return new + [""] + lines if new else lines
+    
+    def _gen_c_fixed(self, models, bits):
+        """Integer-only C: inputs are quantized once, everything after is int arithmetic"""
+        safe_names = self._get_safe_names(models[0])
+        args = ", ".join([f"double {n}" for n in safe_names])
+        lines = ["#include <stdint.h>", ""]
+        lines.append(f"/* Q{bits - 1} input over [lo, hi]: values outside the calibrated range saturate */")
+        lines.append(f"static inline int32_t q_in(double x, double mid, double inv_half) {{")
+        lines.append(f"    double v = (x - mid) * inv_half * {float(1 << (bits - 1))!r};")
+        lines.append("    v = v + (v >= 0.0 ? 0.5 : -0.5);")
+        qmax = float((1 << (bits - 1)) - 1)
+        lines.append(f"    if (v > {qmax!r}) v = {qmax!r};")
+        lines.append(f"    if (v < {-qmax!r}) v = {-qmax!r};")
+        lines.append("    return (int32_t)v;")
         lines.append("}")
+        
+        for func_name, group in self._target_groups(models):
+            branches = self._branches(group)
+            if len(branches) == 1:
+                lines.extend(self._fixed_function(branches[0][1], safe_names, func_name, bits))
+                continue
+            # Split models: one fixed-point function per branch behind a float dispatcher
+            calls = []
+            for k, (_, model, clauses) in enumerate(branches):
+                lines.extend(self._fixed_function(model, safe_names, f"{func_name}_{k}", bits))
+                calls.append((clauses, [], f"{func_name}_{k}({', '.join(safe_names)})"))
+            decls = []
+            body = self._dispatch_lines(func_name, calls, safe_names, "C", decls)
+            lines.append("")
+            lines.extend(decls)
+            lines.append(f"double {func_name}({args}) {{")
+            lines.extend(f"    {s}" for s in body)
+            lines.append("}")
         return "\n".join(lines)
     
-    def poly_to_expr(self, model, input_names, use_horner, lang):
-        """Convert model coefficients to expression string handling multivariate"""
+    def _fixed_function(self, model, safe_names, func_name, bits):
+        args = ", ".join([f"double {n}" for n in safe_names])
+        lines = [""]
+        direct = getattr(model, 'input_feature_names', None)
+        all_names = getattr(model, 'all_input_names', None) or direct
+        if direct and list(direct) != list(all_names):
+            # Chained models read an upstream prediction; keep those in floating point
+            lines.append(f"/* {func_name}: chained model, fixed-point export not supported - float fallback */")
+            decls = []
+            stmts, expr = self.model_to_code(model, safe_names, False, "C", self._suffix(func_name, [model], 0), decls=decls)
+            lines.extend(decls)
+            lines.append(f"double {func_name}({args}) {{")
+            lines.extend(f"    {s}" for s in stmts)
+            lines.append(f"    return {expr};")
+            lines.append("}")
+            return lines
+        try:
+            lines.extend(self.quantized_to_c(model, safe_names, func_name, bits))
+        except (OverflowError, ValueError, np.linalg.LinAlgError) as e:
+            lines.append(f"/* {func_name}: quantization failed ({e}) */")
+        return lines
+    
+    def quantized_to_c(self, model, input_names, func_name, bits):
+        """Calibrate a fixed-point version of the model and emit <func>_q (raw integer) plus a double wrapper"""
+        X = getattr(model, 'X_train', None)
+        q_t = f"int{bits}_t"
+        local_t = "int32_t" if bits > 8 else "int16_t"
+        frac = bits - 1
+        
+        if hasattr(model, 'model') and hasattr(model.model, 'coefs_'):
+            q = QuantizedMLP(model.model, X, bits)
+            out_scale = q.layers[-1]['out_scale'][0]
+            acc_info = ", ".join(f"L{k} {l['acc_type']} ({l['acc_bits']} bits)" for k, l in enumerate(q.layers))
+        else:
+            powers = getattr(getattr(model, 'poly_features', None), 'powers_', None)
+            if powers is None:
+                # Manual coefficients: univariate a0 + a1*x + ..., the constant is refit into the intercept
+                powers = np.arange(1, len(model.coeffs)).reshape(-1, 1)
+            q = QuantizedPoly(lambda Z: np.ravel(model.predict(Z)), powers, X, bits)
+            out_scale = q.out_scale
+            acc_info = f"{q.acc_type} ({q.acc_bits} bits worst case)"
+        
+        n_in = len(q.mid)
+        names = list(input_names[:n_in])
+        calib = "training range" if X is not None and len(X) else "default range [0, 10]"
+        lines = [f"/* {func_name}: int{bits} fixed point, calibrated on the {calib}",
+                 f" * accumulators: {acc_info}",
+                 f" * max |error| vs float model: {q.max_error:.3e} over {q.n_calib} calibration points */"]
+        
+        body = []
+        q_args = ", ".join(f"{local_t} _fg_u_{n}" for n in names)
+        if isinstance(q, QuantizedMLP):
+            lines.extend(self._quantized_mlp_c(q, names, func_name, q_t, body))
+            ret_t = q.layers[-1]['acc_type']
+        else:
+            ret_t = q.acc_type
+            pows = {}
+            for j, n in enumerate(names):
+                pows[(j, 1)] = f"_fg_u_{n}"
+                for k in range(2, int(q.powers[:, j].max(initial=0)) + 1):
+                    pows[(j, k)] = f"_fg_{n}_{k}"
+                    body.append(f"const {local_t} _fg_{n}_{k} = ({pows[(j, k - 1)]} * _fg_u_{n} + {1 << (frac - 1)}) >> {frac};")
+            body.append(f"{q.acc_type} _fg_acc = {q.q_intercept};")
+            for i, (p, c, s) in enumerate(zip(q.powers, q.q_coeffs, q.shifts)):
+                factors = [pows[(j, k)] for j, k in enumerate(p) if k]
+                m = factors[0]
+                if len(factors) > 1:
+                    m = f"_fg_m{i}"
+                    body.append(f"{local_t} {m} = {factors[0]};")
+                    for f in factors[1:]:
+                        body.append(f"{m} = ({m} * {f} + {1 << (frac - 1)}) >> {frac};")
+                term = f"({local_t}){int(c)} * {m}"
+                term = f"({term} + {1 << (int(s) - 1)}) >> {int(s)}" if s > 0 else term
+                body.append(f"_fg_acc += ({q.acc_type})({term});")
+            body.append("return _fg_acc;")
+        
+        lines.append(f"{ret_t} {func_name}_q({q_args}) {{")
+        lines.extend(f"    {b}" for b in body)
+        lines.append("}")
+        lines.append("")
+        lines.append(f"double {func_name}({', '.join(f'double {n}' for n in names)}) {{")
+        call = ", ".join(f"({local_t})q_in({n}, {float(q.mid[j])!r}, {float(q.inv_half[j])!r})" for j, n in enumerate(names))
+        lines.append(f"    return (double){func_name}_q({call}) * {float(out_scale)!r};")
+        lines.append("}")
+        return lines
+    
+    def _quantized_mlp_c(self, q, names, func_name, q_t, body):
+        """Weight/multiplier tables for QuantizedMLP; fills `body` with the integer forward pass"""
+        def arr(v):
+            return "{" + ", ".join(str(int(x)) for x in v) + "}"
+        
+        decls = []
+        bits = q.bits
+        qmax = (1 << (bits - 1)) - 1
+        prefix = f"Q{func_name[len('predict'):].upper()}"
+        prev, prev_n = "_fg_qa_in", len(names)
+        body.append(f"const {q_t} {prev}[{prev_n}] = {{{', '.join('(' + q_t + ')_fg_u_' + n for n in names)}}};")
+        for k, layer in enumerate(q.layers):
+            w = layer['w']
+            n_o = w.shape[1] if k < len(q.layers) - 1 else 1
+            acc_t = layer['acc_type']
+            decls.append(f"static const {q_t} {prefix}W_{k}[{n_o}][{w.shape[0]}] = {{{', '.join(arr(row) for row in w.T[:n_o])}}};")
+            decls.append(f"static const {acc_t} {prefix}B_{k}[{n_o}] = {arr(layer['b'][:n_o])};")
+            if k == len(q.layers) - 1:
+                body.append(f"{acc_t} _fg_acc = {prefix}B_{k}[0];")
+                body.append(f"for (int _fg_i = 0; _fg_i < {prev_n}; _fg_i++) _fg_acc += ({acc_t}){prefix}W_{k}[0][_fg_i] * {prev}[_fg_i];")
+                body.append("return _fg_acc;")
+                break
+            decls.append(f"static const int32_t {prefix}M_{k}[{n_o}] = {arr(layer['m'])};")
+            decls.append(f"static const uint8_t {prefix}R_{k}[{n_o}] = {arr(layer['r'])};")
+            if layer['table'] is not None:
+                decls.append(f"static const {q_t} {prefix}T_{k}[{len(layer['table'])}] = {arr(layer['table'])};")
+            h = f"_fg_qa_{k}"
+            body.append(f"{q_t} {h}[{n_o}];")
+            body.append(f"for (int _fg_j = 0; _fg_j < {n_o}; _fg_j++) {{")
+            body.append(f"    {acc_t} _fg_acc = {prefix}B_{k}[_fg_j];")
+            body.append(f"    for (int _fg_i = 0; _fg_i < {prev_n}; _fg_i++) _fg_acc += ({acc_t}){prefix}W_{k}[_fg_j][_fg_i] * {prev}[_fg_i];")
+            body.append(f"    int64_t _fg_v = ((int64_t)_fg_acc * {prefix}M_{k}[_fg_j] + ((int64_t)1 << ({prefix}R_{k}[_fg_j] - 1))) >> {prefix}R_{k}[_fg_j];")
+            if q.activation == 'relu':
+                body.append("    if (_fg_v < 0) _fg_v = 0;")
+            body.append(f"    if (_fg_v > {qmax}) _fg_v = {qmax}; else if (_fg_v < -{qmax}) _fg_v = -{qmax};")
+            if layer['table'] is not None:
+                shift = bits - LUT_BITS
+                if shift == 0:
+                    body.append(f"    _fg_v = {prefix}T_{k}[_fg_v + {1 << (bits - 1)}];")
+                else:
+                    body.append(f"    {{ int32_t _fg_t = (int32_t)_fg_v + {1 << (bits - 1)}; int32_t _fg_lo = {prefix}T_{k}[_fg_t >> {shift}];")
+                    body.append(f"      _fg_v = _fg_lo + ((({prefix}T_{k}[(_fg_t >> {shift}) + 1] - _fg_lo) * (_fg_t & {(1 << shift) - 1})) >> {shift}); }}")
+            body.append(f"    {h}[_fg_j] = ({q_t})_fg_v;")
+            body.append("}")
+            prev, prev_n = h, n_o
+        return decls
+    
+    def model_to_code(self, model, input_names, use_horner, lang, suffix="", decls=None, use_smart=True,
+                      lut_error=None, batch=False):
+        """Return (statement lines, result expression) for a single model.
+        
+        Module/class level declarations (weight tables) are appended to `decls`.
+        With batch=True (Python only) the inputs are NumPy columns and the
+        code is vectorized over rows.
+        """
+        decls = decls if decls is not None else []
+        bind_stmts, input_names = self._input_bindings(model, input_names, use_horner, lang, suffix, decls,
+                                                       lut_error, batch)
+        n_direct = len(getattr(model, 'input_feature_names', None) or input_names)
+        if lut_error and n_direct <= 2:
+            stmts, expr = self.lut_to_code(model, input_names[:n_direct], lang, suffix, decls, lut_error,
+                                           use_smart, batch)
+        elif hasattr(model, 'model') and hasattr(model.model, 'coefs_'):
+            stmts, expr = self.mlp_to_code(model, input_names, lang, suffix, decls, use_smart, batch)
+        elif getattr(model, 'basis', "Monomial") != "Monomial":
+            stmts, expr = self.ortho_to_code(model, input_names, lang, suffix)
+        else:
+            stmts = []
+            expr = self.poly_to_expr(model, input_names, use_horner, lang, stmts, suffix)
+        if lut_error and n_direct > 2:
+            note = "#" if lang == "Python" else "//"
+            stmts = [f"{note} LUT compilation supports 1-2 inputs; {n_direct}-input model kept as is"] + stmts
+        return bind_stmts + stmts, expr
+    
+    def lut_to_code(self, model, input_names, lang, suffix, decls, max_error, use_smart=True, batch=False):
+        """Sample the model on a uniform grid sized to max_error; emit the table plus (bi)linear interpolation"""
+        X = getattr(model, 'X_train', None)
+        n = len(input_names)
+        if X is not None and len(X):
+            X = np.asarray(X, dtype=float).reshape(len(X), -1)
+            lo, hi = X.min(axis=0)[:n], X.max(axis=0)[:n]
+        else:
+            lo, hi = np.full(n, DEFAULT_RANGE[0]), np.full(n, DEFAULT_RANGE[1])
+        table = lut.build_lut(lut.model_function(model), lo, hi, max_error)
+        T = table.table
+        name = f"LUT{suffix}"
+        
+        def num(v):
+            return repr(float(v))
+        
+        def rows(values, open_, close_):
+            if values.ndim == 1:
+                return open_ + ", ".join(num(v) for v in values) + close_
+            return open_ + ", ".join(rows(r, open_, close_) for r in values) + close_
+        
+        dims = "".join(f"[{k}]" for k in T.shape)
+        if lang == "Python":
+            # Scalar code indexes a plain list (NumPy scalar indexing is ~10x slower); batch code the array copy
+            decls.append(f"{name} = {rows(T, '[', ']')}")
+            if use_smart:
+                decls.append(f"{name}_np = np.array({name})")
+        elif lang == "C":
+            decls.append(f"static const double {name}{dims} = {rows(T, '{', '}')};")
+        else:
+            decls.append(f"private static final double{'[]' * T.ndim} {name} = {rows(T, '{', '}')};")
+        
+        comment = "#" if lang == "Python" else "//"
+        span = ", ".join(f"[{num(l)}, {num(h)}]" for l, h in zip(lo, hi))
+        lines = [f"{comment} LUT {'x'.join(map(str, T.shape))} over {span}, max interp error {table.max_error:.3e}"]
+        idx, frac = [], []
+        for axis, var in enumerate(input_names):
+            k = T.shape[axis]
+            t, i, f = (f"{RESERVED_PREFIX}lut_{c}{suffix}_{axis}" for c in "tif")
+            scaled = f"({var} - {num(lo[axis])}) * {num(table.inv_step[axis])}"
+            if batch:
+                lines.append(f"{t} = np.clip({scaled}, 0.0, {num(k - 1)})")
+                lines.append(f"{i} = np.minimum({t}.astype(int), {k - 2})")
+                lines.append(f"{f} = {t} - {i}")
+            elif lang == "Python":
+                lines.append(f"{t} = min(max({scaled}, 0.0), {num(k - 1)})")
+                lines.append(f"{i} = min(int({t}), {k - 2})")
+                lines.append(f"{f} = {t} - {i}")
+            else:
+                clamp = (f"fmin(fmax({scaled}, 0.0), {num(k - 1)})" if lang == "C"
+                         else f"Math.min(Math.max({scaled}, 0.0), {num(k - 1)})")
+                lines.append(f"double {t} = {clamp};")
+                lines.append(f"int {i} = (int){t};")
+                lines.append(f"if ({i} > {k - 2}) {i} = {k - 2};")
+                lines.append(f"double {f} = {t} - {i};")
+            idx.append(i)
+            frac.append(f)
+        
+        if n == 1:
+            i, fx = idx[0], frac[0]
+            name = f"{name}_np" if batch else name
+            return lines, f"({name}[{i}] + {fx} * ({name}[{i} + 1] - {name}[{i}]))"
+        if batch:
+            name = f"{name}_np"
+        (i, j), (fx, fy) = idx, frac
+        a, b = f"{RESERVED_PREFIX}lut_a{suffix}", f"{RESERVED_PREFIX}lut_b{suffix}"
+        sep = ", " if batch else "]["  # NumPy fancy indexing needs LUT[i, j]
+        at = lambda di, dj: f"{name}[{i}{' + 1' if di else ''}{sep}{j}{' + 1' if dj else ''}]"
+        lines.append(self._decl(lang, a, f"{at(0, 0)} + {fx} * ({at(1, 0)} - {at(0, 0)})"))
+        lines.append(self._decl(lang, b, f"{at(0, 1)} + {fx} * ({at(1, 1)} - {at(0, 1)})"))
+        return lines, f"({a} + {fy} * ({b} - {a}))"
+    
+    def _decl(self, lang, name, expr):
+        return f"{name} = {expr}" if lang == "Python" else f"double {name} = {expr};"
+    
+    def _input_bindings(self, model, safe_names, use_horner, lang, suffix, decls, lut_error=None, batch=False):
+        """Map the model's direct features onto the function arguments.
+        
+        Chained models read '_poly_pred' from their upstream model, whose
+        expression is inlined here from the original inputs.
+        """
+        direct = getattr(model, 'input_feature_names', None)
+        all_names = getattr(model, 'all_input_names', None) or direct
+        if not direct or list(direct) == list(all_names):
+            return [], safe_names
+        stmts, names = [], []
+        for feat in direct:
+            sub = getattr(model, 'sub_model', None)
+            if feat == '_poly_pred' and sub is not None:
+                sub_args = [safe_names[all_names.index(n)] for n in (getattr(model, 'sub_model_input_names', None) or [])
+                            if n in all_names]
+                sub_stmts, sub_expr = self.model_to_code(sub, sub_args, use_horner, lang, f"{suffix}_sub", decls,
+                                                         lut_error=lut_error, batch=batch)
+                var = f"{RESERVED_PREFIX}poly_pred{suffix}"
+                stmts += sub_stmts + [self._decl(lang, var, sub_expr)]
+                names.append(var)
+            elif feat in all_names:
+                names.append(safe_names[all_names.index(feat)])
+            else:
+                names.append(self._safe_name(feat))
+        return stmts, names
+    
+    def mlp_to_code(self, model, input_names, lang, suffix, decls, use_smart=True, batch=False):
+        """Exported MLP inference: constant weight tables plus fused dense+activation loops.
+        
+        Hidden activations live on the stack (C) or in per-call arrays
+        (Java), so concurrent calls share no state. Multi-output networks
+        are split per target first (see _target_groups).
+        """
+        mlp = model.model
+        W = [np.asarray(w, dtype=float) for w in mlp.coefs_]
+        B = [np.asarray(b, dtype=float) for b in mlp.intercepts_]
+        act = mlp.activation
+        n_in, n_out = W[0].shape[0], W[-1].shape[1]
+        if n_out != 1:
+            raise ValueError(f"{n_out}-output network: generate one function per target via split_targets()")
+        x_names = list(input_names[:n_in])
+        
+        def num(v):
+            return repr(float(v))
+        
+        def vec(v, open_="[", close_="]"):
+            return open_ + ", ".join(num(x) for x in v) + close_
+        
+        def mat(m, open_="[", close_="]"):
+            return open_ + ", ".join(vec(row, open_, close_) for row in m) + close_
+        
+        lines = []
+        last = len(W) - 1
+        
+        if lang == "Python" and use_smart:
+            for k, (w, b) in enumerate(zip(W, B)):
+                decls.append(f"NN_W{suffix}_{k} = np.array({mat(w)})")
+                decls.append(f"NN_B{suffix}_{k} = np.array({vec(b)})")
+            h = f"{RESERVED_PREFIX}nn_h{suffix}"
+            if batch:
+                lines.append(f"{h} = np.column_stack([{', '.join(x_names)}])")
+            else:
+                lines.append(f"{h} = np.array([{', '.join(x_names)}], dtype=float)")
+            np_act = {'relu': "np.maximum({z}, 0.0)", 'tanh': "np.tanh({z})",
+                      'logistic': "1.0 / (1.0 + np.exp(-({z})))", 'identity': "{z}"}[act]
+            for k in range(len(W)):
+                z = f"{h} @ NN_W{suffix}_{k} + NN_B{suffix}_{k}"
+                lines.append(f"{h} = {np_act.format(z=z) if k < last else z}")
+            if batch:
+                return lines, f"{h}[:, 0]"
+            return lines, f"float({h}[0])"
+        
+        if lang == "Python":
+            # Dependency-free: weights stored per neuron (transposed) as nested lists
+            if act in ("tanh", "logistic") and "import math" not in decls:
+                decls.insert(0, "import math")
+            # NN_WT/NN_BT: never the NumPy tables' names, which batch functions may declare alongside
+            for k, (w, b) in enumerate(zip(W, B)):
+                decls.append(f"NN_WT{suffix}_{k} = {mat(w.T)}")
+                decls.append(f"NN_BT{suffix}_{k} = {vec(b)}")
+            py_act = {'relu': "max({z}, 0.0)", 'tanh': "math.tanh({z})",
+                      'logistic': "0.5 * (1.0 + math.tanh(0.5 * ({z})))", 'identity': "{z}"}[act]
+            h = f"{RESERVED_PREFIX}nn_h{suffix}"
+            lines.append(f"{h} = [{', '.join(x_names)}]")
+            for k in range(len(W)):
+                z = f"b + sum(w * v for w, v in zip(row, {h}))"
+                z = py_act.format(z=z) if k < last else z
+                lines.append(f"{h} = [{z} for row, b in zip(NN_WT{suffix}_{k}, NN_BT{suffix}_{k})]")
+            return lines, f"{h}[0]"
+        
+        # C / Java: row-major per-neuron weights so the inner loop is contiguous
+        c_act = {'relu': "(_fg_acc > 0.0 ? _fg_acc : 0.0)", 'identity': "_fg_acc",
+                 'tanh': "tanh(_fg_acc)" if lang == "C" else "Math.tanh(_fg_acc)",
+                 'logistic': ("1.0 / (1.0 + exp(-_fg_acc))" if lang == "C"
+                              else "1.0 / (1.0 + Math.exp(-_fg_acc))")}[act]
+        x = f"{RESERVED_PREFIX}nn_in{suffix}"
+        for k, (w, b) in enumerate(zip(W, B)):
+            n_o, n_i = w.shape[1], w.shape[0]
+            if lang == "C":
+                decls.append(f"static const double NN_W{suffix}_{k}[{n_o}][{n_i}] = {mat(w.T, '{', '}')};")
+                decls.append(f"static const double NN_B{suffix}_{k}[{n_o}] = {vec(b, '{', '}')};")
+            else:
+                decls.append(f"private static final double[][] NN_W{suffix}_{k} = {mat(w.T, '{', '}')};")
+                decls.append(f"private static final double[] NN_B{suffix}_{k} = {vec(b, '{', '}')};")
+        
+        if lang == "C":
+            lines.append(f"const double {x}[{n_in}] = {{{', '.join(x_names)}}};")
+        else:
+            lines.append(f"final double[] {x} = {{{', '.join(x_names)}}};")
+        
+        prev, prev_n = x, n_in
+        for k, w in enumerate(W):
+            n_o = w.shape[1]
+            h = f"{RESERVED_PREFIX}nn_h{suffix}_{k}"
+            lines.append(f"double {h}[{n_o}];" if lang == "C" else f"final double[] {h} = new double[{n_o}];")
+            lines.append(f"for (int _fg_j = 0; _fg_j < {n_o}; _fg_j++) {{")
+            lines.append(f"    double _fg_acc = NN_B{suffix}_{k}[_fg_j];")
+            lines.append(f"    for (int _fg_i = 0; _fg_i < {prev_n}; _fg_i++) "
+                         f"_fg_acc += NN_W{suffix}_{k}[_fg_j][_fg_i] * {prev}[_fg_i];")
+            lines.append(f"    {h}[_fg_j] = {c_act if k < last else '_fg_acc'};")
+            lines.append("}")
+            prev, prev_n = h, n_o
+        return lines, f"{prev}[0]"
+    
+    def ortho_to_code(self, model, input_names, lang, suffix=""):
+        """Chebyshev/Legendre models: Clenshaw for one input, recurrence locals otherwise"""
+        kind = model.basis
+        lo, hi = model.domain
+        powers = model.poly_features.powers_
+        coeffs = np.asarray(model.coeffs, dtype=float)
+        intercept = float(model.intercept)
+        
+        def _num(v):
+            return repr(float(v))
+        
+        def decl(name, expr):
+            return f"{name} = {expr}" if lang == "Python" else f"double {name} = {expr};"
+        
+        def assign(name, expr):
+            return f"{name} = {expr}" if lang == "Python" else f"{name} = {expr};"
+        
+        lines = []
+        u_names, var_names = {}, {}
+        for j in range(powers.shape[1]):
+            if not powers[:, j].any():
+                continue
+            var_name = input_names[j] if j < len(input_names) else f"x{j}"
+            var_names[j] = var_name
+            u_names[j] = f"{RESERVED_PREFIX}u_{var_name}{suffix}"
+            lines.append(decl(u_names[j], f"(2.0 * {var_name} - {_num(lo[j] + hi[j])}) / {_num(hi[j] - lo[j])}"))
+        
+        if powers.shape[1] == 1:
+            # Clenshaw backward recurrence on the collected per-degree weights
+            c = np.zeros(int(powers.max()) + 1)
+            c[0] = intercept
+            for i, p in enumerate(powers[:, 0]):
+                c[p] += coeffs[i]
+            u = u_names[0]
+            b0, b1, b2 = (f"{RESERVED_PREFIX}b{k}{suffix}" for k in range(3))
+            lines.append(f"# Clenshaw ({kind})" if lang == "Python" else f"// Clenshaw ({kind})")
+            lines.append(decl(b1, "0.0"))
+            lines.append(decl(b2, "0.0"))
+            lines.append(decl(b0, "0.0"))
+            for k in range(len(c) - 1, 0, -1):
+                alpha, _ = orthopoly.recurrence_coeffs(kind, k)
+                _, beta = orthopoly.recurrence_coeffs(kind, k + 1)
+                lines.append(assign(b0, f"{_num(c[k])} + {_num(alpha)} * {u} * {b1} + {_num(beta)} * {b2}"))
+                lines.append(assign(b2, b1))
+                lines.append(assign(b1, b0))
+            _, beta1 = orthopoly.recurrence_coeffs(kind, 1)
+            return lines, f"({_num(c[0])} + {u} * {b1} + {_num(beta1)} * {b2})"
+        
+        # Multivariate: build phi_k(u_j) once per input, then sum tensor products
+        t_names = {}
+        for j, u in u_names.items():
+            t_names[(j, 1)] = u
+            for k in range(1, int(powers[:, j].max())):
+                alpha, beta = orthopoly.recurrence_coeffs(kind, k)
+                prev2 = t_names.get((j, k - 1), "1.0")
+                t_names[(j, k + 1)] = f"{RESERVED_PREFIX}t{k + 1}_{var_names[j]}{suffix}"
+                lines.append(decl(t_names[(j, k + 1)], f"{_num(alpha)} * {u} * {t_names[(j, k)]} + {_num(beta)} * {prev2}"))
+        
+        terms = [f"{_num(intercept)}"]
+        for i, c in enumerate(coeffs):
+            if c == 0:
+                continue  # Pruned term
+            factors = [t_names[(j, p)] for j, p in enumerate(powers[i]) if p]
+            terms.append(f"({_num(c)} * {' * '.join(factors)})")
+        return lines, " + ".join(terms)
+    
+    def poly_to_expr(self, model, input_names, use_horner, lang, stmts=None, suffix=""):
+        """Convert model coefficients to an expression string (multivariate aware).
+        
+        Powers are hoisted into locals appended to `stmts` and built by
+        multiplication chains instead of pow(); with use_horner the
+        polynomial is factored into nested Horner form across all inputs.
+        A comment with the multiply/add count against the flat pow() form
+        is added to `stmts`.
+        """
+        stmts = stmts if stmts is not None else []
         if not hasattr(model, 'coeffs'):
             return "0"
             
         coeffs = model.coeffs
         intercept = getattr(model, 'intercept', 0)
         
+        def num(v):
+            return repr(float(v))  # Exact round-trip; fixed decimals would drop small coefficients
+        
         # Check if we have powers_ for multivariate
         powers = None
         if hasattr(model, 'poly_features') and hasattr(model.poly_features, 'powers_'):
             powers = model.poly_features.powers_
             
-        # Fallback to univariate if no powers or only 1 feature
-        if powers is None or (len(input_names) == 1 and use_horner):
-            # Univariate Horner / Standard
-            coeffs_list = coeffs.tolist() if hasattr(coeffs, 'tolist') else list(coeffs)
-            x_var = input_names[0]
-            
-            if use_horner and len(coeffs_list) > 1:
-                expr = f"{coeffs_list[-1]:.6f}"
-                for c in reversed(coeffs_list[:-1]):
-                    expr = f"({c:.6f} + {x_var} * {expr})"
-                return f"({intercept:.6f} + {x_var} * {expr})"
-            else:
-                terms = [f"{intercept:.6f}"]
-                for i, c in enumerate(coeffs_list):
-                    if abs(c) < 1e-9: continue
-                    pow_func = f"pow({x_var}, {i+1})" if lang != "Python" else f"{x_var}**{i+1}"
-                    if i == 0: pow_func = x_var # Optimization for x^1
-                    terms.append(f"({c:.6f} * {pow_func})")
-                return " + ".join(terms) if terms else "0"
+        if powers is None:
+            # Manual coefficients a0 + a1*x + a2*x^2 + ...: a0 joins the intercept
+            coeffs = np.ravel(np.asarray(coeffs, dtype=float))
+            intercept = float(intercept) + (coeffs[0] if len(coeffs) else 0.0)
+            coeffs = coeffs[1:]
+            powers = np.arange(1, len(coeffs) + 1).reshape(-1, 1)
         
-        # Multivariate Standard Form (Horner is hard for multivariate)
-        terms = [f"{intercept:.6f}"]
+        powers = np.asarray(powers, dtype=int)
+        coeffs = np.asarray(coeffs, dtype=float)
+        names = [input_names[j] if j < len(input_names) else f"x{j}" for j in range(powers.shape[1])]
+        needed = {}  # var index -> powers > 1 referenced by the expression
         
-        for i, c in enumerate(coeffs):
-            if abs(c) < 1e-9: continue
-            
-            term_parts = []
-            if powers is not None and i < len(powers):
-                p_row = powers[i]
-                for feat_idx, p in enumerate(p_row):
-                    if p == 0: continue
-                    var_name = input_names[feat_idx] if feat_idx < len(input_names) else f"x{feat_idx}"
-                    
-                    if p == 1:
-                        term_parts.append(var_name)
-                    else:
-                        pow_str = f"pow({var_name}, {p})" if lang != "Python" else f"{var_name}**{p}"
-                        term_parts.append(pow_str)
+        def power(j, k):
+            if k > 1:
+                needed.setdefault(j, set()).add(k)
+            return names[j] if k == 1 else f"{RESERVED_PREFIX}{names[j]}_{k}{suffix}"
+        
+        if use_horner:
+            # Nested Horner across variables: children[k] multiplies x_var^k, gaps become hoisted powers
+            tree = eval_plan.build_horner_tree(powers, coeffs, float(intercept))
+            expr = eval_plan.horner_expr(tree, num, power)
+        else:
+            # Multivariate Standard Form
+            terms = [num(intercept)]
+            for i, c in enumerate(coeffs):
+                if c == 0: continue  # Pruned term
+                factors = [power(j, p) for j, p in enumerate(powers[i]) if p]
+                terms.append(f"({num(c)} * {' * '.join(factors)})" if factors else num(c))
+            expr = " + ".join(terms)
+        
+        # Multiplication chains for the hoisted powers: x^k = x^(k//2) * x^(k - k//2)
+        chain = []
+        for j, ks in sorted(needed.items()):
+            for k, a, b in eval_plan.power_chain(ks):
+                chain.append(self._decl(lang, power(j, k), f"{power(j, a)} * {power(j, b)}"))
+        
+        # Flat form: every term is c * pow(x, p) * ..., costing sum(p) multiplies once pow is expanded
+        live = [row for row, c in zip(powers, coeffs) if c != 0]
+        flat_muls = sum(int(row.sum()) for row in live)
+        muls = sum(line.count(" * ") for line in chain) + expr.count(" * ")
+        comment = "#" if lang == "Python" else "//"
+        stmts.append(f"{comment} {muls} mul, {expr.count(' + ')} add (flat pow form: {flat_muls} mul, {len(live)} add)")
+        stmts.extend(chain)
+        return expr
+    
+    def run_benchmark(self):
+        """Start a benchmark of the first connected model on the background thread"""
+        if self._bench_future is not None and not self._bench_future.done():
+            return
+        model = next((m for m in (self.get_input_model(i) for i in range(4)) if m is not None), None)
+        if model is None:
+            self.code_edit.setText("// Connect a model to benchmark")
+            return
+        
+        # Widgets are read here; the worker only sees plain values
+        self._bench_future = self._bench_executor.submit(self.benchmark_report, model, self.lut_err_spin.value(),
+                                                         self.nt_cb.isChecked())
+        self.bench_btn.setEnabled(False)
+        self.bench_btn.setText("Running...")
+        self.code_edit.setText("// Benchmarking...")
+        self._bench_timer.start()
+    
+    def _poll_benchmark(self):
+        if not self._bench_future.done():
+            return
+        self._bench_timer.stop()
+        self.bench_btn.setEnabled(True)
+        self.bench_btn.setText("Benchmark")
+        try:
+            lines = self._bench_future.result()
+        except Exception as e:
+            lines = [f"Benchmark error: {str(e)[:60]}"]
+        self.code_edit.setText("\n".join(f"// {line}" for line in lines))
+    
+    def benchmark_report(self, model, lut_error, use_nt):
+        """Report lines on the accuracy and speed of each code variant against the model.
+        
+        Python is imported and timed per scalar call; C is compiled with the
+        local compiler and timed through its batch function. Golden inputs
+        are rows of the training data. With use_nt, the generated
+        NetworkTables runtime's latency is measured as well. Runs on the
+        benchmark thread, so it touches no widgets.
+        """
+        X = codegen_bench.golden_inputs(model)
+        reference = codegen_bench.reference_predict(model, X)
+        compiler = codegen_bench.find_compiler()
+        variants = [("Horner", True, None), ("Standard", False, None), ("LUT", False, lut_error)]
+        rows = []
+        groups = self._target_groups([model])
+        for k, (func_name, _) in enumerate(groups):
+            ref = reference[:, min(k, reference.shape[1] - 1)]
+            for variant, use_horner, lut_error in variants:
+                for lang in ("Python", "C"):
+                    label = variant if len(groups) == 1 else f"{variant}[{k}]"
+                    row = {'variant': label, 'lang': lang}
+                    try:
+                        code = self.generate_code([model], lang, use_horner, True, False, "", "CPU (Standard)",
+                                                  lut_error=lut_error, batch="AoS" if lang == "C" else None)
+                        if lang == "Python":
+                            out, ns = codegen_bench.run_python(code, func_name, X)
+                        else:
+                            out, ns = codegen_bench.run_c(code, func_name, X, compiler)
+                        row['max_err'], row['mean_err'] = codegen_bench.error_stats(out, ref)
+                        row['ns'] = ns
+                    except Exception as e:
+                        row['error'] = str(e)[:60]
+                    rows.append(row)
             
-            if term_parts:
-                term_expr = " * ".join(term_parts)
-                terms.append(f"({c:.6f} * {term_expr})")
-            else:
-                 # Constant term (shouldn't happen in coefs usually if include_bias=False)
-                 terms.append(f"{c:.6f}")
-                 
-        return " + ".join(terms)
+        header = [f"Benchmark: {len(X)} golden inputs, compiler: {compiler or 'none'}"]
+        lines = header + codegen_bench.format_report(rows)
+        if use_nt:
+            lines += [""] + self._nt_latency(model, X)
+        return lines
+    
+    def _nt_latency(self, model, X):
+        """Update-to-result latency of the generated Python NetworkTables runtime on an in-process stand-in"""
+        func_name = self._target_groups([model])[0][0]
+        input_names = self._get_safe_names(model)
+        X = X[:nt_bench.N_UPDATES]
+        try:
+            code = self.generate_code([model], "Python", True, True, True, "", "CPU (Standard)")
+            rows = nt_bench.run_latency(code, func_name, input_names, self._result_topic(func_name), X)
+        except Exception as e:
+            rows = [{'mode': "listener", 'error': str(e)[:60]}]
+        return [f"NetworkTables: {len(X)} updates, Python runtime vs {1 / nt_bench.POLL_PERIOD:.0f} Hz polling"] \
+            + nt_bench.format_report(rows)
     
     def copy_code(self):
         clipboard = QGuiApplication.clipboard()
@@ -1,5 +1,5 @@
 from PySide6.QtWidgets import (QGraphicsProxyWidget, QWidget, QVBoxLayout, QHBoxLayout,
-                               QLabel, QCheckBox, QRadioButton, QButtonGroup, QPushButton)
+                               QLabel, QCheckBox, QPushButton)
 from PySide6.QtCore import Qt
 from node_engine.node_base import Node
 import pandas as pd
@@ -19,8 +19,7 @@ class ColumnSelectorNode(Node):
         
         self.columns = []
         self.feature_checks = []
-        self.target_radios = []
-        self.target_group = QButtonGroup()
+        self.target_checks = []  # Several targets can be fitted against one feature matrix
         self.merged_df = None  # Store merged DataFrame
         
         # UI
@@ -112,11 +111,10 @@ class ColumnSelectorNode(Node):
         # Clear existing
         for cb in self.feature_checks:
             cb.deleteLater()
-        for rb in self.target_radios:
-            self.target_group.removeButton(rb)
-            rb.deleteLater()
+        for cb in self.target_checks:
+            cb.deleteLater()
         self.feature_checks.clear()
-        self.target_radios.clear()
+        self.target_checks.clear()
         
         # Clear layout
         while self.cols_layout.count():
@@ -149,17 +147,16 @@ class ColumnSelectorNode(Node):
             row.addWidget(cb)
             self.feature_checks.append(cb)
             
-            # Target radio
-            rb = QRadioButton()
-            rb.setStyleSheet("margin-left: 5px;")
-            rb.setFixedWidth(25)
-            row.addWidget(rb)
-            self.target_group.addButton(rb, i)
-            self.target_radios.append(rb)
+            # Target checkbox
+            tb = QCheckBox()
+            tb.setStyleSheet("margin-left: 5px;")
+            tb.setFixedWidth(25)
+            row.addWidget(tb)
+            self.target_checks.append(tb)
             
             # Default: last column as target
             if i == len(self.columns) - 1:
-                rb.setChecked(True)
+                tb.setChecked(True)
             
             self.cols_layout.addLayout(row)
         
@@ -181,21 +178,25 @@ class ColumnSelectorNode(Node):
                 features.append(self.columns[i])
         return features
     
+    def get_targets(self):
+        targets = []
+        for i, cb in enumerate(self.target_checks):
+            if cb.isChecked() and i < len(self.columns):
+                targets.append(self.columns[i])
+        return targets
+    
     def get_target(self):
-        btn = self.target_group.checkedButton()
-        if btn:
-            idx = self.target_group.id(btn)
-            return self.columns[idx] if idx < len(self.columns) else None
-        return None
+        targets = self.get_targets()
+        return targets[0] if targets else None
         
     def eval(self):
         if self.merged_df is None:
             return None
         
         features = self.get_features()
-        target = self.get_target()
+        targets = self.get_targets()
         
-        if not features or not target:
+        if not features or not targets:
             return None
         
         # Get the sub-model if _poly_pred is selected as a feature
@@ -219,12 +220,17 @@ class ColumnSelectorNode(Node):
                 if f not in all_input_names:
                     all_input_names.append(f)
             
+        # Single target keeps the 1-D Y every model node expects;
+        # several targets become an (n, n_targets) matrix solved in one pass
+        Y = self.merged_df[targets[0]].values if len(targets) == 1 else self.merged_df[targets].values
+            
         return {
             'X': self.merged_df[features].values,
-            'Y': self.merged_df[target].values,
+            'Y': Y,
             'feature_names': features,  # What this node uses directly
             'all_input_names': all_input_names,  # All original inputs needed
-            'target_name': target,
+            'target_name': targets[0],
+            'target_names': targets,
             'sub_model': sub_model,  # Reference to chained model
             'sub_model_input_names': sub_model_input_names
         }
@@ -1,14 +1,9 @@
 from PySide6.QtWidgets import (QGraphicsProxyWidget, QWidget, QVBoxLayout, QPushButton, QLabel)
 from PySide6.QtCore import Qt
 from node_engine.node_base import Node
+from ui.plot_item import PlotItem, PALETTE
 import numpy as np
 
-# Matplotlib with Qt backend
-import matplotlib
-matplotlib.use('QtAgg')
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-
 class GraphNode(Node):
     def __init__(self):
         super().__init__("Graph View")
@@ -46,35 +41,27 @@ class GraphNode(Node):
         self.viz_btn.clicked.connect(self.open_visualizer)
         layout.addWidget(self.viz_btn)
         
-        # Matplotlib canvas
-        self.figure = Figure(figsize=(3, 2.5), dpi=80, facecolor='#1E1E1E')
-        self.canvas = FigureCanvas(self.figure)
-        self.canvas.setMinimumSize(280, 200)
-        layout.addWidget(self.canvas)
+        self.proxy.setWidget(self.widget)
+        self.proxy.setPos(10, 30)
+        self.proxy.resize(300, self.widget.sizeHint().height())
+        
+        # Plot: a native scene item (matplotlib is only used by the full-size slicer dialog)
+        plot_top = 30 + self.proxy.size().height() + 3
+        self.plot = PlotItem(300, self.height - plot_top - 24, self)
+        self.plot.setPos(10, plot_top)
         
         # Status
+        status_widget = QWidget()
+        status_widget.setStyleSheet("background: #1E1E1E;")
+        status_layout = QVBoxLayout(status_widget)
+        status_layout.setContentsMargins(5, 0, 5, 0)
         self.status_lbl = QLabel("Connect Model + Data")
         self.status_lbl.setStyleSheet("color: #888; font-size: 9px;")
-        layout.addWidget(self.status_lbl)
-        
-        self.proxy.setWidget(self.widget)
-        self.proxy.setPos(10, 30)
-        self.proxy.resize(300, 300) # Increased height for button
-        
-        # Initial empty plot
-        self.setup_axes()
-        
-    def setup_axes(self):
-        self.figure.clear()
-        self.ax = self.figure.add_subplot(111)
-        self.ax.set_facecolor('#252526')
-        self.ax.tick_params(colors='#888')
-        self.ax.spines['bottom'].set_color('#555')
-        self.ax.spines['top'].set_color('#555')
-        self.ax.spines['left'].set_color('#555')
-        self.ax.spines['right'].set_color('#555')
-        self.ax.set_xlabel('X', color='#888', fontsize=9)
-        self.ax.set_ylabel('Y', color='#888', fontsize=9)
+        status_layout.addWidget(self.status_lbl)
+        self.status_proxy = QGraphicsProxyWidget(self)
+        self.status_proxy.setWidget(status_widget)
+        self.status_proxy.setPos(10, self.height - 22)
+        self.status_proxy.resize(300, 16)
         
     def open_visualizer(self):
         from ui.graph_visualizer import GraphSlicerDialog
@@ -95,12 +82,10 @@ class GraphNode(Node):
         model = self.get_input_value(0)
         data = self.get_input_value(1)
         
-        self.setup_axes()
-        
         if model is None:
+            self.plot.set_series([])
             self.status_lbl.setText("No model connected (input 1)")
             self.status_lbl.setStyleSheet("color: #F44747; font-size: 9px;")
-            self.canvas.draw()
             return
         
         # Get data points if available
@@ -110,6 +95,7 @@ class GraphNode(Node):
             X_data = data.get('X')
             Y_data = data.get('Y')
         
+        series = []
         # Plot data points
         if X_data is not None and Y_data is not None:
             # For multi-feature, only plot first feature
@@ -118,7 +104,12 @@ class GraphNode(Node):
             else:
                 x_plot = X_data
             
-            self.ax.scatter(x_plot, Y_data, c='#4EC9B0', s=20, alpha=0.7, label='Data')
+            # Multi-target data: one point series per target column
+            columns = [Y_data[:, k] for k in range(Y_data.shape[1])] if Y_data.ndim > 1 else [Y_data]
+            for k, y_col in enumerate(columns):
+                series.append({'kind': 'points', 'x': x_plot, 'y': y_col,
+                               'color': '#4EC9B0' if len(columns) == 1 else PALETTE[k % len(PALETTE)],
+                               'label': 'Data' if len(columns) == 1 else f'Data {k}'})
             x_min, x_max = x_plot.min(), x_plot.max()
         else:
             # If no data, use default range
@@ -140,17 +131,27 @@ class GraphNode(Node):
             
             try:
                 y_line = model.predict(X_line)
-                self.ax.plot(x_line, y_line, c='#DCDCAA', linewidth=2, label='Fit')
+                if np.ndim(y_line) > 1:
+                    names = getattr(model, 'target_names', None) or [str(k) for k in range(y_line.shape[1])]
+                    curves = [(y_line[:, k], f'Fit {name}', PALETTE[k % len(PALETTE)]) for k, name in enumerate(names)]
+                else:
+                    curves = [(y_line, 'Fit', '#DCDCAA')]
+                # Bootstrap prediction band (Inspector) under the fit; its grid sweeps the first
+                # input with the others at their mean, so it only matches this view for one input
+                band = getattr(model, 'prediction_band', None)
+                if band is not None and band[0].shape[1] == 1:
+                    X_grid, band_lo, band_hi = band
+                    for k, (_, label, color) in enumerate(curves):
+                        series.append({'kind': 'band', 'x': X_grid[:, 0], 'y': band_lo[:, k], 'y2': band_hi[:, k],
+                                       'color': color, 'label': '95% band' if len(curves) == 1 else None})
+                for y_curve, label, color in curves:
+                    series.append({'kind': 'line', 'x': x_line, 'y': y_curve, 'color': color, 'label': label})
             except Exception as e:
                 self.status_lbl.setText(f"Plot error: {str(e)[:20]}")
         
         # Add legend and metrics
-        self.ax.legend(loc='upper left', fontsize=8, facecolor='#252526', edgecolor='#555', labelcolor='white')
-        
-        if hasattr(model, 'r2') and model.r2 is not None:
-            self.ax.set_title(f'R² = {model.r2:.4f}', color='#4EC9B0', fontsize=10)
-        
-        self.canvas.draw()
+        r2 = getattr(model, 'r2', None)
+        self.plot.set_series(series, f'R² = {r2:.4f}' if r2 is not None else "")
         self.status_lbl.setText("✓ Graph updated")
         self.status_lbl.setStyleSheet("color: #4EC9B0; font-size: 9px;")
         
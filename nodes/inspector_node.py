@@ -1,11 +1,14 @@
-from PySide6.QtWidgets import (QGraphicsProxyWidget, QWidget, QVBoxLayout, QLabel, QPushButton)
+from PySide6.QtWidgets import (QGraphicsProxyWidget, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                               QPushButton, QSpinBox)
 from PySide6.QtCore import Qt
 from node_engine.node_base import Node
+from core.bootstrap import bootstrap_coefficients, percentile_interval, prediction_band, band_grid
+import numpy as np
 
 class InspectorNode(Node):
     def __init__(self):
         super().__init__("Inspector")
-        self.height = 180
+        self.height = 300
         self.width = 200
         
         # Input: Model
@@ -46,9 +49,30 @@ class InspectorNode(Node):
         self.terms_label.setStyleSheet("font-size: 10px; color: #888;")
         layout.addWidget(self.terms_label)
         
+        # Bootstrap confidence intervals
+        b_row = QHBoxLayout()
+        b_row.addWidget(QLabel("B:", styleSheet="font-size: 10px;"))
+        self.boot_spin = QSpinBox()
+        self.boot_spin.setRange(50, 5000)
+        self.boot_spin.setValue(500)
+        self.boot_spin.setStyleSheet("background: #3c3c3c; color: white;")
+        b_row.addWidget(self.boot_spin)
+        self.boot_btn = QPushButton("95% CI")
+        self.boot_btn.setStyleSheet("""
+            QPushButton { background: #3C3C3C; color: #CCCCCC; border: 1px solid #555; padding: 3px; font-size: 10px; }
+            QPushButton:hover { background: #4C4C4C; }
+        """)
+        self.boot_btn.clicked.connect(self.run_bootstrap)
+        b_row.addWidget(self.boot_btn)
+        layout.addLayout(b_row)
+        
+        self.ci_label = QLabel("CI: --")
+        self.ci_label.setStyleSheet("font-size: 9px; color: #CE9178; font-family: Consolas, monospace;")
+        layout.addWidget(self.ci_label)
+        
         self.proxy.setWidget(self.widget)
         self.proxy.setPos(10, 30)
-        self.proxy.resize(180, 140)
+        self.proxy.resize(180, 260)
         self.proxy.setZValue(1.0)  # Ensure interactive
 
     def refresh(self):
@@ -76,3 +100,50 @@ class InspectorNode(Node):
         self.terms_label.setText(f"Terms: {len(coeffs) if hasattr(coeffs, '__len__') else 'N/A'}")
         
         return model
+    
+    def run_bootstrap(self):
+        """Percentile intervals for coefficients and predictions from B resamples"""
+        model = self.get_input_value(0)
+        X = getattr(model, 'X_train', None)
+        Y = getattr(model, 'Y_train', None)
+        if model is None or X is None or Y is None or not hasattr(model, 'features'):
+            self.ci_label.setText("CI: needs a fitted PolyFit model")
+            return
+        
+        try:
+            A = np.column_stack([np.ones(len(X)), model.features(X)])
+            draws = bootstrap_coefficients(A, Y, n_boot=self.boot_spin.value())
+            coef_lo, coef_hi = percentile_interval(draws)
+            # Band on an ordered grid over the data range, through the model's own feature transform
+            X_grid = band_grid(X)
+            A_grid = np.column_stack([np.ones(len(X_grid)), model.features(X_grid)])
+            band_lo, band_hi = prediction_band(A_grid, draws)
+        except Exception as e:
+            self.ci_label.setText(f"CI error: {str(e)[:20]}")
+            return
+        
+        # Multi-output fits: summarise the first target, the rest go in the tooltip
+        target_names = getattr(model, 'target_names', None) or ["Y"]
+        names = ["intercept"] + [str(n) for n in (model.feature_names if model.feature_names is not None else range(A.shape[1] - 1))]
+        if coef_lo.ndim == 1:
+            coef_lo, coef_hi = coef_lo[:, None], coef_hi[:, None]
+            band_lo, band_hi = band_lo[:, None], band_hi[:, None]
+        
+        model.coeff_intervals = (coef_lo, coef_hi)
+        model.prediction_band = (X_grid, band_lo, band_hi)
+        
+        half_band = (band_hi - band_lo) / 2
+        lines = [f"95% CI, B={len(draws)} ({target_names[0]})",
+                 f"Pred ±: mean {half_band[:, 0].mean():.4g}, max {half_band[:, 0].max():.4g}"]
+        # Widest coefficient intervals are the least trustworthy terms
+        widths = coef_hi[:, 0] - coef_lo[:, 0]
+        for i in np.argsort(widths)[::-1][:4]:
+            lines.append(f"{names[i][:10]}: [{coef_lo[i, 0]:.3g}, {coef_hi[i, 0]:.3g}]")
+        self.ci_label.setText("\n".join(lines))
+        
+        tooltip = []
+        for k, target in enumerate(target_names):
+            tooltip.append(f"{target}: prediction ± mean {half_band[:, k].mean():.6g}, max {half_band[:, k].max():.6g}")
+            for i, name in enumerate(names):
+                tooltip.append(f"  {name}: [{coef_lo[i, k]:.6g}, {coef_hi[i, k]:.6g}]")
+        self.ci_label.setToolTip("\n".join(tooltip))
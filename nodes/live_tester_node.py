@@ -163,8 +163,14 @@ class LiveTesterNode(Node):
                     result = result[0]
             else:
                 result = 0
-                    
-            self.result_label.setText(f"Y = {result:.6f}")
+            
+            target_names = getattr(model, 'target_names', None)
+            if np.ndim(result) == 1:
+                # Multi-output model: one line per target
+                names = target_names or [f"Y{k}" for k in range(len(result))]
+                self.result_label.setText("\n".join(f"{n} = {v:.6f}" for n, v in zip(names, result)))
+            else:
+                self.result_label.setText(f"Y = {result:.6f}")
             self.result_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #4EC9B0;")
         except Exception as e:
             self.result_label.setText(f"Error: {str(e)[:20]}")
@@ -1,16 +1,30 @@
 from PySide6.QtWidgets import (QGraphicsProxyWidget, QWidget, QVBoxLayout, QHBoxLayout,
-                               QLabel, QSpinBox, QPushButton, QLineEdit)
+                               QLabel, QSpinBox, QPushButton, QLineEdit, QCheckBox, QApplication)
 from ui.graphics_combo import GraphicsComboBox
+from ui.loss_chart import LossChart
+from core import hparam_search
+from core.mlp_forward import MLPForward
 from PySide6.QtCore import Qt
 from node_engine.node_base import Node
 from sklearn.neural_network import MLPRegressor
 from sklearn.metrics import r2_score, mean_squared_error
+from sklearn.model_selection import train_test_split
+from sklearn.exceptions import ConvergenceWarning
 import numpy as np
+import copy
+import time
+import warnings
+
+# lbfgs has no partial_fit, so each "epoch" is this many warm-started iterations
+LBFGS_EPOCH_ITERS = 10
+# Held-out fraction used for the validation curve and early stopping
+VAL_FRACTION = 0.1
 
 class NeuralNetModel:
     """Container for Neural Network regression results"""
     def __init__(self, model, r2, mse, input_feature_names, all_input_names=None, 
-                 sub_model=None, sub_model_input_names=None, condition=None):
+                 sub_model=None, sub_model_input_names=None, condition=None, conditions=None,
+                 target_names=None):
         self.model = model
         self.r2 = r2
         self.mse = mse
@@ -19,6 +33,11 @@ class NeuralNetModel:
         self.sub_model = sub_model
         self.sub_model_input_names = sub_model_input_names
         self.condition = condition
+        self.conditions = conditions
+        # Set for multi-output fits, one name per output column
+        if target_names is None and self.n_targets > 1:
+            target_names = [f"y{k}" for k in range(self.n_targets)]
+        self.target_names = target_names
         
         # Mock poly_features for compatibility with GraphNode/LiveTester
         class MockPolyFeatures:
@@ -26,14 +45,46 @@ class NeuralNetModel:
                 self.n_features_in_ = n_features
         
         self.poly_features = MockPolyFeatures(len(input_feature_names) if input_feature_names else 1)
+        self._engine = None
+        self.float32 = False  # Opt-in reduced precision inference
+        
+    @property
+    def engine(self):
+        """NumPy forward pass built from the fitted weights (skips sklearn's per-call validation)"""
+        dtype = np.float32 if self.float32 else np.float64
+        if self._engine is None or self._engine.dtype != dtype:
+            self._engine = MLPForward(self.model, dtype=dtype)
+        return self._engine
         
     def predict(self, X):
-        return self.model.predict(X)
+        return self.engine.predict(X)
+    
+    @property
+    def n_targets(self):
+        return self.model.n_outputs_
+    
+    def split_targets(self):
+        """One single-output NeuralNetModel per target: hidden layers shared, output layer sliced"""
+        if self.n_targets == 1:
+            return [self]
+        models = []
+        for k in range(self.n_targets):
+            mlp = copy.copy(self.model)
+            mlp.coefs_ = self.model.coefs_[:-1] + [self.model.coefs_[-1][:, k:k + 1]]
+            mlp.intercepts_ = self.model.intercepts_[:-1] + [self.model.intercepts_[-1][k:k + 1]]
+            mlp.n_outputs_ = 1
+            m = copy.copy(self)
+            m.model = mlp
+            m._engine = None
+            m.target_names = None
+            m.target_name = self.target_names[k]
+            models.append(m)
+        return models
 
 class NeuralNetNode(Node):
     def __init__(self):
         super().__init__("Neural Network")
-        self.height = 240
+        self.height = 425
         self.width = 200
         
         # Input: Data (X, Y)
@@ -42,6 +93,11 @@ class NeuralNetNode(Node):
         self.add_output(0)
         
         self.model = None
+        # Last trained estimator and the architecture it was built with, for warm starts
+        self._mlp = None
+        self._mlp_signature = None
+        # Inputs self.model was trained or searched for; eval() hands it on unchanged while they hold
+        self._fit_key = None
         
         # UI
         self.proxy = QGraphicsProxyWidget(self)
@@ -102,6 +158,34 @@ class NeuralNetNode(Node):
         row3.addWidget(self.iter_spin)
         layout.addLayout(row3)
         
+        # Early stopping patience (epochs without validation improvement, 0 = off)
+        row4 = QHBoxLayout()
+        row4.addWidget(QLabel("Patience:", styleSheet="font-size: 10px;"))
+        self.patience_spin = QSpinBox()
+        self.patience_spin.setRange(0, 1000)
+        self.patience_spin.setValue(20)
+        self.patience_spin.setStyleSheet("background: #3c3c3c; color: white;")
+        row4.addWidget(self.patience_spin)
+        layout.addLayout(row4)
+        
+        # Continue from the previous weights when only data or budget changed
+        row_opts = QHBoxLayout()
+        self.warm_cb = QCheckBox("Warm start")
+        self.warm_cb.setChecked(True)
+        self.warm_cb.setStyleSheet("color: white; font-size: 10px;")
+        row_opts.addWidget(self.warm_cb)
+        # Reduced precision predict for downstream plots/testers; exported code stays double
+        self.f32_cb = QCheckBox("Float32")
+        self.f32_cb.setToolTip("Run predict() in float32 (faster, ~1e-6 relative error)")
+        self.f32_cb.setStyleSheet("color: white; font-size: 10px;")
+        self.f32_cb.stateChanged.connect(self.apply_precision)
+        row_opts.addWidget(self.f32_cb)
+        layout.addLayout(row_opts)
+        
+        # Live loss curve
+        self.loss_chart = LossChart()
+        layout.addWidget(self.loss_chart)
+        
         # Train Button
         self.train_btn = QPushButton("▶ Train Model")
         self.train_btn.setStyleSheet("""
@@ -111,6 +195,24 @@ class NeuralNetNode(Node):
         self.train_btn.clicked.connect(self.run_train)
         layout.addWidget(self.train_btn)
         
+        # Hyperparameter search (parallel worker processes)
+        row5 = QHBoxLayout()
+        self.search_combo = GraphicsComboBox()
+        self.search_combo.addItems(["Grid", "Random + Halving"])
+        row5.addWidget(self.search_combo)
+        self.search_btn = QPushButton("Search")
+        self.search_btn.setStyleSheet("""
+            QPushButton { background: #3C3C3C; color: #CCCCCC; border: 1px solid #555; padding: 4px; }
+            QPushButton:hover { background: #4C4C4C; }
+        """)
+        self.search_btn.clicked.connect(self.run_search)
+        row5.addWidget(self.search_btn)
+        layout.addLayout(row5)
+        
+        self.leaderboard_lbl = QLabel("")
+        self.leaderboard_lbl.setStyleSheet("color: #888; font-size: 9px; font-family: Consolas, monospace;")
+        layout.addWidget(self.leaderboard_lbl)
+        
         # Status Label
         self.status_lbl = QLabel("Ready")
         self.status_lbl.setAlignment(Qt.AlignCenter)
@@ -152,13 +254,91 @@ class NeuralNetNode(Node):
     def adjust_height(self):
         # Base height + space per layer row
         n = self.num_layers_spin.value()
-        new_height = 240 + (n * 25)
-        self.height = max(240, new_height)
+        new_height = 425 + (n * 25)
+        self.height = max(425, new_height)
         self.proxy.resize(180, new_height - 30)
 
+    def apply_precision(self):
+        if self.model is not None:
+            self.model.float32 = self.f32_cb.isChecked()
+
     def run_train(self):
+        # An explicit Train always trains (warm-starting if enabled), even on unchanged inputs
+        self._fit_key = None
         self.eval()
 
+    def current_config(self):
+        return {
+            'layers': tuple(spin.value() for spin in self.layer_spinboxes),
+            'activation': self.activation_combo.currentText(),
+            'solver': self.solver_combo.currentText(),
+        }
+    
+    def apply_config(self, config):
+        """Load a searched config back into the spinboxes/combos"""
+        self.num_layers_spin.setValue(len(config['layers']))
+        for spin, width in zip(self.layer_spinboxes, config['layers']):
+            spin.setValue(width)
+        self.activation_combo.setCurrentIndex(self.activation_combo.items.index(config['activation']))
+        self.solver_combo.setCurrentIndex(self.solver_combo.items.index(config['solver']))
+    
+    def run_search(self):
+        """Train candidate configs in parallel and keep the best one"""
+        data = self.get_input_value(0)
+        if data is None or not isinstance(data, dict) or data.get('X') is None or len(data['X']) < 10:
+            self.status_lbl.setText("Need data to search")
+            return
+        
+        X, Y = data['X'], data['Y']
+        halving = self.search_combo.currentIndex() == 1
+        current = self.current_config()
+        configs = hparam_search.random_configs(27, current=current) if halving else hparam_search.grid_configs(current)
+        
+        def on_progress(rung, n_rungs, done, total):
+            self.status_lbl.setText(f"Rung {rung + 1}/{n_rungs}: {done}/{total}")
+            QApplication.processEvents()
+        
+        try:
+            leaderboard, mlp = hparam_search.run_search(X, Y, configs, self.iter_spin.value(),
+                                                        halving=halving, on_progress=on_progress)
+        except Exception as e:
+            self.status_lbl.setText(f"Search error: {str(e)[:15]}")
+            self.status_lbl.setStyleSheet("color: #F44747; font-size: 10px;")
+            return
+        
+        best = leaderboard[0]
+        self.apply_config(best['config'])
+        self._mlp = mlp
+        self._mlp_signature = self.signature(best['config']['layers'], best['config']['activation'],
+                                             best['config']['solver'], X, Y)
+        
+        Y_pred = mlp.predict(X)
+        self.model = NeuralNetModel(
+            model=mlp,
+            r2=r2_score(Y, Y_pred),
+            mse=mean_squared_error(Y, Y_pred),
+            input_feature_names=data.get('feature_names', []),
+            all_input_names=data.get('all_input_names'),
+            sub_model=data.get('sub_model'),
+            sub_model_input_names=data.get('sub_model_input_names', []),
+            condition=data.get('condition'),
+            conditions=data.get('conditions'),
+            target_names=data.get('target_names') if np.ndim(Y) == 2 else None
+        )
+        self.model.leaderboard = leaderboard
+        self.model.float32 = self.f32_cb.isChecked()
+        self.model.X_train = X
+        self.model.Y_train = Y
+        self._fit_key = self.input_key(X, Y)
+        
+        self.leaderboard_lbl.setText("\n".join(
+            f"{i + 1}. {e['label'][:18]} {e['val_mse']:.3g}" for i, e in enumerate(leaderboard[:3])))
+        self.leaderboard_lbl.setToolTip("\n".join(
+            f"{i + 1}. {e['label']}  val MSE {e['val_mse']:.6g}  ({e['budget']} it)" for i, e in enumerate(leaderboard)))
+        self.status_lbl.setText(f"✓ Best {best['label']} R²={self.model.r2:.4f}")
+        self.status_lbl.setStyleSheet("color: #4EC9B0; font-size: 10px;")
+        return self.model
+
     def fit(self, X, Y, input_feature_names=None):
         try:
             # Parse layers from dynamic list
@@ -172,33 +352,112 @@ class NeuralNetNode(Node):
             solver = self.solver_combo.currentText()
             max_iter = self.iter_spin.value()
             
-            # Configure and train model
-            mlp = MLPRegressor(
-                hidden_layer_sizes=layers,
-                activation=activation,
-                solver=solver,
-                max_iter=max_iter,
-                random_state=42
-            )
+            signature = self.signature(layers, activation, solver, X, Y)
+            warm = self.warm_cb.isChecked() and self._mlp is not None and signature == self._mlp_signature
+            
+            if warm:
+                # Same architecture: continue from the previous weights. Work on a copy
+                # so models already handed downstream are never mutated.
+                mlp = copy.deepcopy(self._mlp)
+            else:
+                # Configure model; training runs epoch by epoch so progress can be streamed
+                mlp = MLPRegressor(
+                    hidden_layer_sizes=layers,
+                    activation=activation,
+                    solver=solver,
+                    max_iter=max_iter,
+                    random_state=42
+                )
             
-            mlp.fit(X, Y)
+            history = self.train_epochs(mlp, X, Y, max_iter)
+            history['warm'] = warm
+            self._mlp, self._mlp_signature = mlp, signature
             
             Y_pred = mlp.predict(X)
             r2 = r2_score(Y, Y_pred)
             mse = mean_squared_error(Y, Y_pred)
             
-            return NeuralNetModel(
+            model = NeuralNetModel(
                 model=mlp,
                 r2=r2,
                 mse=mse,
                 input_feature_names=input_feature_names
             )
+            model.loss_history = history
+            return model
             
         except Exception as e:
             self.status_lbl.setText(f"Error: {str(e)[:20]}")
             self.status_lbl.setStyleSheet("color: #F44747; font-size: 10px;")
             return None
 
+    def input_key(self, X, Y):
+        """Hyperparameters and data a fit depends on, to tell when the current model is stale"""
+        X, Y = np.ascontiguousarray(X), np.ascontiguousarray(Y)
+        signature = self.signature(tuple(spin.value() for spin in self.layer_spinboxes),
+                                   self.activation_combo.currentText(), self.solver_combo.currentText(), X, Y)
+        return (signature, self.iter_spin.value(), self.patience_spin.value(),
+                X.shape, Y.shape, hash(X.tobytes()), hash(Y.tobytes()))
+
+    def signature(self, layers, activation, solver, X, Y):
+        """Everything that fixes the weight shapes and optimizer; a change forces a fresh start"""
+        n_features = X.shape[1] if X.ndim > 1 else 1
+        n_outputs = Y.shape[1] if Y.ndim > 1 else 1
+        return (tuple(layers), activation, solver, n_features, n_outputs)
+    
+    def train_epochs(self, mlp, X, Y, max_epochs):
+        """Train in epochs, streaming losses to the chart and stopping on a validation plateau"""
+        patience = self.patience_spin.value()
+        if len(X) >= 20:
+            X_tr, X_val, Y_tr, Y_val = train_test_split(X, Y, test_size=VAL_FRACTION, random_state=42)
+        else:
+            X_tr, X_val, Y_tr, Y_val = X, None, Y, None
+        
+        self.loss_chart.reset()
+        train_losses, val_losses = [], []
+        best_val, best_epoch, best_state = np.inf, 0, None
+        last_paint = 0.0
+        
+        if mlp.solver == "lbfgs":
+            mlp.set_params(warm_start=True, max_iter=LBFGS_EPOCH_ITERS)
+            max_epochs = -(-max_epochs // LBFGS_EPOCH_ITERS)
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ConvergenceWarning)
+            for epoch in range(max_epochs):
+                if mlp.solver == "lbfgs":
+                    mlp.fit(X_tr, Y_tr)
+                else:
+                    mlp.partial_fit(X_tr, Y_tr)
+                
+                train_losses.append(mean_squared_error(Y_tr, mlp.predict(X_tr)))
+                val_loss = mean_squared_error(Y_val, mlp.predict(X_val)) if X_val is not None else None
+                if val_loss is not None:
+                    val_losses.append(val_loss)
+                self.loss_chart.add_point(train_losses[-1], val_loss)
+                
+                if val_loss is not None and val_loss < best_val:
+                    best_val, best_epoch = val_loss, epoch
+                    best_state = (copy.deepcopy(mlp.coefs_), copy.deepcopy(mlp.intercepts_))
+                
+                # Keep the chart live without repainting on every fast epoch
+                now = time.perf_counter()
+                if now - last_paint > 0.05:
+                    self.status_lbl.setText(f"Epoch {epoch + 1}/{max_epochs}")
+                    QApplication.processEvents()
+                    last_paint = now
+                
+                if patience and val_loss is not None and epoch - best_epoch >= patience:
+                    break
+        
+        # Roll back to the epoch with the best validation loss
+        if patience and best_state is not None:
+            mlp.coefs_, mlp.intercepts_ = best_state
+            self.loss_chart.best_epoch = best_epoch
+            self.loss_chart.update()
+        
+        return {'train': train_losses, 'val': val_losses, 'epochs': len(train_losses), 'best_epoch': best_epoch}
+
     def eval(self):
         data = self.get_input_value(0)
         if data is None or not isinstance(data, dict):
@@ -211,6 +470,13 @@ class NeuralNetNode(Node):
             self.status_lbl.setText("Empty data")
             return None
             
+        # Downstream pulls keep the current model until the data or hyperparameters change;
+        # refitting on every pull would warm-start another max_iter epochs each time and drift
+        key = self.input_key(X, Y)
+        if self.model is not None and self._fit_key == key:
+            return self.model
+        self._fit_key = None
+        
         # Get feature names from the data
         input_feature_names = data.get('feature_names', [])
         all_input_names = data.get('all_input_names', input_feature_names)
@@ -221,12 +487,21 @@ class NeuralNetNode(Node):
         
         if self.model:
             self.model.condition = data.get('condition')
+            self.model.conditions = data.get('conditions')
             # Store info for chained models
             self.model.all_input_names = all_input_names
             self.model.sub_model = sub_model
             self.model.sub_model_input_names = sub_model_input_names
+            if np.ndim(Y) == 2 and data.get('target_names'):
+                self.model.target_names = data['target_names']
+            self.model.X_train = X
+            self.model.Y_train = Y
+            self.model.float32 = self.f32_cb.isChecked()
+            self._fit_key = key
             
-            self.status_lbl.setText(f"✓ R²={self.model.r2:.4f}")
+            epochs = self.model.loss_history['epochs']
+            mode = "+" if self.model.loss_history.get('warm') else ""
+            self.status_lbl.setText(f"✓ R²={self.model.r2:.4f} ({mode}{epochs} ep)")
             self.status_lbl.setStyleSheet("color: #4EC9B0; font-size: 10px;")
             
         return self.model
@@ -1,17 +1,23 @@
 from PySide6.QtWidgets import (QGraphicsProxyWidget, QWidget, QVBoxLayout, QHBoxLayout,
-                               QLabel, QSpinBox, QCheckBox)
+                               QLabel, QSpinBox, QDoubleSpinBox, QCheckBox)
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor
 from node_engine.node_base import Node
+from ui.graphics_combo import GraphicsComboBox
+from core import orthopoly
+from core.eval_plan import MonomialPlan
+from core.pruning import prune_terms
 from sklearn.preprocessing import PolynomialFeatures
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import r2_score, mean_squared_error
 import numpy as np
+import copy
 
 class PolyFitModel:
     """Container for polynomial regression results"""
     def __init__(self, coeffs, intercept, degree, feature_names, r2, mse, poly_features, 
-                 input_feature_names=None, condition=None):
+                 input_feature_names=None, condition=None, basis="Monomial", domain=None,
+                 target_names=None, n_pruned=0, conditions=None):
         self.coeffs = coeffs
         self.intercept = intercept
         self.degree = degree
@@ -21,15 +27,53 @@ class PolyFitModel:
         self.mse = mse
         self.poly_features = poly_features
         self.condition = condition  # For conditional splits
+        self.conditions = conditions  # Same split as (column, op, value) clauses, for code generation
+        self.basis = basis  # "Monomial", "Chebyshev" or "Legendre"
+        self.domain = domain  # (lo, hi) per input, maps data range onto [-1, 1] for orthogonal bases
+        self.target_names = target_names  # Set for multi-output fits; coeffs is then (n_terms, n_targets)
+        self.n_pruned = n_pruned  # Terms zeroed by error-bounded pruning
+        self._plan = None  # Compiled Horner kernel; PolyFitNode builds it at fit time
+        
+    @property
+    def plan(self):
+        if self._plan is None:
+            self._plan = MonomialPlan(self.poly_features.powers_, self.coeffs, self.intercept)
+        return self._plan
+        
+    def features(self, X):
+        """Design matrix (without intercept column) in the model's basis"""
+        if self.basis == "Monomial":
+            return self.poly_features.transform(X)
+        return orthopoly.design_matrix(X, self.poly_features.powers_, self.domain, self.basis)
         
     def predict(self, X):
-        X_poly = self.poly_features.transform(X)
-        return X_poly @ self.coeffs + self.intercept
+        if self.basis == "Monomial":
+            return self.plan(X)
+        return self.features(X) @ self.coeffs + self.intercept
+    
+    @property
+    def n_targets(self):
+        return self.coeffs.shape[1] if np.ndim(self.coeffs) == 2 else 1
+    
+    def split_targets(self):
+        """One single-output PolyFitModel per target, sharing this model's metadata"""
+        if self.n_targets == 1:
+            return [self]
+        models = []
+        for k in range(self.n_targets):
+            m = copy.copy(self)
+            m.coeffs = self.coeffs[:, k]
+            m.intercept = float(self.intercept[k])
+            m.target_names = None
+            m.target_name = self.target_names[k] if self.target_names else f"y{k}"
+            m._plan = None
+            models.append(m)
+        return models
 
 class PolyFitNode(Node):
     def __init__(self):
         super().__init__("PolyFit")
-        self.height = 160  # Taller for button
+        self.height = 210  # Taller for button
         
         # Input: Data (X, Y)
         self.add_input(0)
@@ -37,6 +81,8 @@ class PolyFitNode(Node):
         self.add_output(0)
         
         self.model = None
+        # Inputs self.model was fitted for; eval() hands it on unchanged while they hold
+        self._fit_key = None
         
         # UI
         self.proxy = QGraphicsProxyWidget(self)
@@ -57,12 +103,32 @@ class PolyFitNode(Node):
         row.addWidget(self.degree_spin)
         layout.addLayout(row)
         
+        # Basis row (orthogonal bases stay well-conditioned up to degree 20)
+        b_row = QHBoxLayout()
+        b_row.addWidget(QLabel("Basis:", styleSheet="font-size: 10px;"))
+        self.basis_combo = GraphicsComboBox()
+        self.basis_combo.addItems(orthopoly.BASES)
+        self.basis_combo.currentIndexChanged.connect(self.on_basis_changed)
+        b_row.addWidget(self.basis_combo)
+        layout.addLayout(b_row)
+        
         # Interaction checkbox
         self.interact_cb = QCheckBox("Include interactions")
         self.interact_cb.setChecked(True)
         self.interact_cb.setStyleSheet("color: white; font-size: 10px;")
         layout.addWidget(self.interact_cb)
         
+        # Pruning budget: max allowed deviation over the data, 0 disables pruning
+        p_row = QHBoxLayout()
+        p_row.addWidget(QLabel("Prune err:", styleSheet="font-size: 10px;"))
+        self.prune_spin = QDoubleSpinBox()
+        self.prune_spin.setDecimals(6)
+        self.prune_spin.setRange(0.0, 1e6)
+        self.prune_spin.setValue(0.0)
+        self.prune_spin.setStyleSheet("background: #3c3c3c; color: white;")
+        p_row.addWidget(self.prune_spin)
+        layout.addLayout(p_row)
+        
         # Fit button
         from PySide6.QtWidgets import QPushButton
         self.fit_btn = QPushButton("▶ Fit Model")
@@ -80,43 +146,94 @@ class PolyFitNode(Node):
         
         self.proxy.setWidget(self.widget)
         self.proxy.setPos(10, 30)
-        self.proxy.resize(160, 120)
+        self.proxy.resize(160, 170)
+        
+    def on_basis_changed(self, index):
+        # Raw monomials become ill-conditioned past degree 5
+        max_degree = 5 if self.basis_combo.currentText() == "Monomial" else 20
+        self.degree_spin.setRange(1, max_degree)
     
     def run_fit(self):
         """Button callback to trigger evaluation"""
+        self._fit_key = None
         self.eval()
 
-    def fit(self, X, Y, input_feature_names=None):
+    def fit(self, X, Y, input_feature_names=None, target_names=None):
         """Perform polynomial regression"""
         degree = self.degree_spin.value()
         interaction_only = not self.interact_cb.isChecked()
+        basis = self.basis_combo.currentText()
         
         try:
+            X = X.reshape(-1, 1) if X.ndim == 1 else X
             poly = PolynomialFeatures(degree=degree, interaction_only=interaction_only, include_bias=False)
-            X_poly = poly.fit_transform(X.reshape(-1, 1) if X.ndim == 1 else X)
+            domain = None
+            
+            if basis == "Monomial":
+                X_poly = poly.fit_transform(X)
+                feature_names = poly.get_feature_names_out() if hasattr(poly, 'get_feature_names_out') else None
+                reg = LinearRegression(fit_intercept=True)
+                reg.fit(X_poly, Y)
+                # Multi-output coef_ is (n_targets, n_terms); keep terms on the first axis
+                coeffs, intercept = reg.coef_.T, reg.intercept_
+                Y_pred = reg.predict(X_poly)
+                A = np.column_stack([np.ones(len(X_poly)), X_poly])
+            else:
+                # Same term layout as PolynomialFeatures, but each factor is an
+                # orthogonal polynomial of the input scaled to [-1, 1]. Only powers_ is
+                # needed from PolynomialFeatures, so it never builds the monomial matrix
+                poly.fit(X[:1])
+                domain = orthopoly.make_domain(X)
+                Phi = orthopoly.design_matrix(X, poly.powers_, domain, basis)
+                A = np.column_stack([np.ones(len(Phi)), Phi])
+                sol, *_ = np.linalg.lstsq(A, Y, rcond=None)
+                intercept, coeffs = sol[0], sol[1:]
+                Y_pred = A @ sol
+                feature_names = orthopoly.term_names(poly.powers_, [f"x{j}" for j in range(X.shape[1])], basis)
             
-            reg = LinearRegression(fit_intercept=True)
-            reg.fit(X_poly, Y)
+            n_pruned = 0
+            budget = self.prune_spin.value()
+            if budget > 0:
+                # Pruned terms keep their slot with a zero coefficient, which the
+                # Horner plan and the code generator both skip
+                sol, n_pruned = prune_terms(A, Y, budget)
+                intercept, coeffs = sol[0], sol[1:]
+                Y_pred = A @ sol
             
-            Y_pred = reg.predict(X_poly)
             r2 = r2_score(Y, Y_pred)
             mse = mean_squared_error(Y, Y_pred)
             
-            return PolyFitModel(
-                coeffs=reg.coef_,
-                intercept=reg.intercept_,
+            model = PolyFitModel(
+                coeffs=coeffs,
+                intercept=intercept,
                 degree=degree,
-                feature_names=poly.get_feature_names_out() if hasattr(poly, 'get_feature_names_out') else None,
+                feature_names=feature_names,
                 r2=r2,
                 mse=mse,
                 poly_features=poly,
-                input_feature_names=input_feature_names  # Store original column names
+                input_feature_names=input_feature_names,  # Store original column names
+                basis=basis,
+                domain=domain,
+                target_names=target_names if np.ndim(Y) == 2 else None,
+                n_pruned=n_pruned
             )
+            if basis == "Monomial":
+                model.plan  # Compile now so the first in-app predict pays no build cost
+            return model
         except Exception as e:
             self.status_lbl.setText(f"Error: {str(e)[:20]}")
             self.status_lbl.setStyleSheet("color: #F44747; font-size: 10px;")
             return None
         
+    def input_key(self, X, Y, data):
+        """Settings and data a fit depends on, to tell when the current model is stale"""
+        X, Y = np.ascontiguousarray(X), np.ascontiguousarray(Y)
+        meta = tuple(repr(data.get(k)) for k in ('feature_names', 'all_input_names', 'target_names',
+                                                 'sub_model_input_names', 'condition', 'conditions'))
+        settings = (self.degree_spin.value(), self.interact_cb.isChecked(), self.basis_combo.currentText(),
+                    self.prune_spin.value())
+        return (settings, meta, id(data.get('sub_model')), X.shape, Y.shape, hash(X.tobytes()), hash(Y.tobytes()))
+    
     def eval(self):
         data = self.get_input_value(0)
         if data is None or not isinstance(data, dict):
@@ -129,19 +246,36 @@ class PolyFitNode(Node):
             self.status_lbl.setText("Empty data")
             return None
         
+        # Downstream pulls (graph, tester, inspector) reuse the fit until the data or settings change,
+        # which also keeps what they attached to it, e.g. the bootstrap band
+        key = self.input_key(X, Y, data)
+        if self.model is not None and self._fit_key == key:
+            return self.model
+        self._fit_key = None
+        
         # Get feature names from the data
         input_feature_names = data.get('feature_names', [])
         all_input_names = data.get('all_input_names', input_feature_names)
         sub_model = data.get('sub_model')
         sub_model_input_names = data.get('sub_model_input_names', [])
             
-        self.model = self.fit(X, Y, input_feature_names)
+        target_names = data.get('target_names') or [f"y{k}" for k in range(np.shape(Y)[1] if np.ndim(Y) == 2 else 1)]
+        
+        self.model = self.fit(X, Y, input_feature_names, target_names)
         if self.model:
             self.model.condition = data.get('condition')
+            self.model.conditions = data.get('conditions')
             # Store info for chained models
             self.model.all_input_names = all_input_names
             self.model.sub_model = sub_model
             self.model.sub_model_input_names = sub_model_input_names
-            self.status_lbl.setText(f"✓ R²={self.model.r2:.4f}")
+            # Training data for downstream diagnostics (bootstrap, calibration)
+            self.model.X_train = X.reshape(-1, 1) if X.ndim == 1 else X
+            self.model.Y_train = Y
+            self._fit_key = key
+            targets_txt = f" ({self.model.n_targets} targets)" if self.model.n_targets > 1 else ""
+            if self.model.n_pruned:
+                targets_txt += f" -{self.model.n_pruned} terms"
+            self.status_lbl.setText(f"✓ R²={self.model.r2:.4f}{targets_txt}")
             self.status_lbl.setStyleSheet("color: #4EC9B0; font-size: 10px;")
         return self.model
@@ -72,5 +72,6 @@ class RangeFilterNode(Node):
         return {
             'X': X[start_idx:end_idx],
             'Y': Y[start_idx:end_idx],
-            'feature_names': data.get('feature_names', [])
+            'feature_names': data.get('feature_names', []),
+            'target_names': data.get('target_names')
         }
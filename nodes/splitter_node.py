@@ -3,6 +3,7 @@ from PySide6.QtWidgets import (QGraphicsProxyWidget, QWidget, QVBoxLayout, QHBox
 from PySide6.QtCore import Qt
 from node_engine.node_base import Node
 from core.signals import Signals
+from core.dispatch import OPS, negate, clause_text
 import numpy as np
 
 class ConditionalSplitterNode(Node):
@@ -71,6 +72,7 @@ class ConditionalSplitterNode(Node):
             
         X, Y = data.get('X'), data.get('Y')
         feature_names = data.get('feature_names', [])
+        target_names = data.get('target_names')
         
         col = self.col_combo.currentText()
         op = self.op_combo.currentText()
@@ -87,13 +89,13 @@ class ConditionalSplitterNode(Node):
             return None
         
         # Apply condition
-        ops = {'>': np.greater, '<': np.less, '>=': np.greater_equal, 
-               '<=': np.less_equal, '==': np.equal, '!=': np.not_equal}
-        mask = ops[op](col_data, val)
+        mask = OPS[op](col_data, val)
         
-        if output_index == 0:  # True stream
-            return {'X': X[mask], 'Y': Y[mask], 'feature_names': feature_names,
-                    'condition': f"{col} {op} {val}"}
-        else:  # False stream
-            return {'X': X[~mask], 'Y': Y[~mask], 'feature_names': feature_names,
-                    'condition': f"NOT ({col} {op} {val})"}
+        # Structured clauses for the code generator; chained splitters AND onto the upstream ones
+        clause = (col, op, val)
+        if output_index != 0:  # False stream
+            mask, clause = ~mask, negate(clause)
+        conditions = list(data.get('conditions') or []) + [clause]
+        return {'X': X[mask], 'Y': Y[mask], 'feature_names': feature_names,
+                'target_names': target_names, 'conditions': conditions,
+                'condition': " and ".join(clause_text(c) for c in conditions)}
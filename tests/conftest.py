@@ -0,0 +1,17 @@
+import os
+import pytest
+
+# Node widgets need a QApplication; no display is required
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture(scope="session")
+def generator(qapp):
+    from nodes.code_generator_node import CodeGeneratorNode
+    return CodeGeneratorNode()
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from core import bootstrap
+
+
+def design(n=120, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(-2, 3, n)
+    A = np.column_stack([np.ones(n), x, x ** 2, x ** 3])
+    Y = np.column_stack([1.0 - x + 0.5 * x ** 3, np.cos(x)]) + rng.normal(0, 0.1, (n, 2))
+    return A, Y
+
+
+def loop_reference(A, Y, n_boot, seed):
+    """One lstsq per resample, on the rows the chunked solver's counts select"""
+    n, p = A.shape
+    W = np.concatenate([bootstrap.resample_weights(n, stop - start, ss)
+                        for start, stop, ss in bootstrap.chunk_plan(n, p, n_boot, seed)])
+    rows = [np.repeat(np.arange(n), w.astype(int)) for w in W]
+    return np.array([np.linalg.lstsq(A[r], Y[r], rcond=None)[0] for r in rows])
+
+
+@pytest.mark.parametrize("chunk_elements", [bootstrap.CHUNK_ELEMENTS, 2000])
+@pytest.mark.parametrize("targets", [1, 2])
+def test_batched_draws_match_per_resample_lstsq(monkeypatch, chunk_elements, targets):
+    monkeypatch.setattr(bootstrap, "CHUNK_ELEMENTS", chunk_elements)
+    A, Y = design()
+    Y = Y if targets == 2 else Y[:, 0]
+    draws = bootstrap.bootstrap_coefficients(A, Y, n_boot=60, seed=3)
+    reference = loop_reference(A, Y, 60, 3)
+    assert draws.shape == reference.shape
+    np.testing.assert_allclose(draws, reference, rtol=1e-10, atol=1e-12)
+
+
+def test_draws_do_not_depend_on_worker_count(monkeypatch):
+    monkeypatch.setattr(bootstrap, "CHUNK_ELEMENTS", 2000)
+    A, Y = design()
+    assert len(bootstrap.chunk_plan(*A.shape, 60)) > 1
+    serial = bootstrap.bootstrap_coefficients(A, Y, n_boot=60, seed=5, workers=1)
+    threaded = bootstrap.bootstrap_coefficients(A, Y, n_boot=60, seed=5, workers=4)
+    np.testing.assert_array_equal(serial, threaded)
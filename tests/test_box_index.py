@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from core.box_index import BoxIndex
+
+
+def brute_force(X, centres, tol):
+    mask = np.ones(len(X), dtype=bool)
+    for j, c in centres.items():
+        mask &= np.abs(X[:, j] - c) <= tol
+    return np.flatnonzero(mask)
+
+
+@pytest.fixture(scope="module")
+def X():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(5000, 4)) * [1.0, 10.0, 0.01, 1e4]
+    # Duplicates and values sitting exactly on query edges
+    X[:500, 0] = np.round(X[:500, 0], 1)
+    X[500:600] = X[:100]
+    return X
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_query_matches_brute_force(X, seed):
+    rng = np.random.default_rng(seed)
+    keys = rng.choice(X.shape[1], size=rng.integers(1, X.shape[1] + 1), replace=False)
+    row = X[rng.integers(len(X))]
+    centres = {int(j): float(row[j]) for j in keys}
+    tol = float(rng.choice([0.0, 0.1, 0.5, 1.0, 5.0]))
+    np.testing.assert_array_equal(BoxIndex(X).query(centres, tol), brute_force(X, centres, tol))
+
+
+def test_edges_are_inclusive(X):
+    index = BoxIndex(X)
+    for c, tol in [(0.0, 0.1), (0.3, 0.2), (-1.2, 0.5)]:
+        np.testing.assert_array_equal(index.query({0: c}, tol), brute_force(X, {0: c}, tol))
+
+
+def test_no_constraints_returns_every_row(X):
+    np.testing.assert_array_equal(BoxIndex(X).query({}, 1.0), np.arange(len(X)))
+
+
+def test_one_dimensional_input():
+    x = np.array([3.0, 1.0, 2.0, 2.0, 5.0])
+    np.testing.assert_array_equal(BoxIndex(x).query({0: 2.0}, 1.0), [0, 1, 2, 3])
@@ -0,0 +1,29 @@
+import gc
+import weakref
+import numpy as np
+from nodes.polyfit_node import PolyFitNode
+
+
+def fit(qapp, seed):
+    rng = np.random.default_rng(seed)
+    X = rng.uniform(-1, 1, (200, 2))
+    model = PolyFitNode().fit(X, X[:, 0] ** 2 - X[:, 1], ["a", "b"], ["y"])
+    model.X_train = X
+    return model
+
+
+def test_cache_keeps_only_the_connected_models(qapp, generator, monkeypatch):
+    connected = [fit(qapp, 0)]
+    monkeypatch.setattr(generator, "get_input_model", lambda i: connected[0] if i == 0 else None)
+    for lang in range(3):
+        generator.lang_combo.setCurrentIndex(lang)
+        generator.generate()
+    assert len(generator._code_cache) == 3
+    
+    old = weakref.ref(connected[0])
+    connected[0] = fit(qapp, 1)  # Refit upstream
+    generator.generate()
+    assert len(generator._code_cache) == 1
+    gc.collect()
+    assert old() is None
+    generator.lang_combo.setCurrentIndex(0)
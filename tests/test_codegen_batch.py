@@ -0,0 +1,78 @@
+import warnings
+import numpy as np
+import pytest
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.neural_network import MLPRegressor
+from core import codegen_bench
+from nodes.neural_net_node import NeuralNetModel
+from nodes.polyfit_node import PolyFitNode
+
+BASES = ["Monomial", "Chebyshev", "Legendre"]
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-2, 3, (300, 2))
+    return X, X[:, 0] ** 3 - 2 * X[:, 0] * X[:, 1] + np.sin(X[:, 1])
+
+
+def poly_model(qapp, X, y, basis):
+    node = PolyFitNode()
+    node.basis_combo.setCurrentIndex(BASES.index(basis))
+    node.degree_spin.setValue(3)
+    model = node.fit(X, y, ["a", "b"])
+    model.X_train = X
+    return model
+
+
+def mlp_model(X, y):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ConvergenceWarning)
+        mlp = MLPRegressor(hidden_layer_sizes=(8,), activation="tanh", max_iter=200, random_state=0).fit(X, y)
+    model = NeuralNetModel(mlp, 0.0, 0.0, ["a", "b"])
+    model.X_train = X
+    return model
+
+
+@pytest.fixture(scope="module", params=BASES + ["MLP"])
+def model(request, qapp, data):
+    X, y = data
+    return mlp_model(X, y) if request.param == "MLP" else poly_model(qapp, X, y, request.param)
+
+
+def generate(generator, model, use_smart, batch, lut_error=None):
+    return generator.generate_code([model], "Python", True, use_smart, False, "", "CPU (Standard)",
+                                   lut_error=lut_error, batch=batch)
+
+
+def scalar_part(code):
+    """Everything up to the end of the scalar predict function, NumPy import aside"""
+    lines = code.splitlines()
+    start = lines.index(next(line for line in lines if line.startswith("def predict(")))
+    end = next((i for i in range(start, len(lines)) if not lines[i]), len(lines))
+    return [line for line in lines[:end] if line != "import numpy as np"]
+
+
+@pytest.mark.parametrize("lut_error", [None, 1e-2])
+@pytest.mark.parametrize("use_smart", [True, False])
+def test_scalar_code_ignores_batch_flag(generator, model, use_smart, lut_error):
+    plain = generate(generator, model, use_smart, None, lut_error)
+    assert scalar_part(generate(generator, model, use_smart, "AoS", lut_error)) == scalar_part(plain)
+    assert scalar_part(generate(generator, model, use_smart, "SoA", lut_error)) == scalar_part(plain)
+
+
+@pytest.mark.parametrize("lut_error", [None, 1e-2])
+@pytest.mark.parametrize("layout", ["AoS", "SoA"])
+@pytest.mark.parametrize("use_smart", [True, False])
+def test_batch_matches_scalar_and_predict(generator, data, model, use_smart, layout, lut_error):
+    X = data[0][:100]
+    code = generate(generator, model, use_smart, layout, lut_error)
+    namespace = {}
+    exec(compile(code, "<generated>", "exec"), namespace)
+    batch = namespace["predict_batch"]
+    out = batch(X) if layout == "AoS" else batch(*X.T)
+    scalar, _ = codegen_bench.run_python(code, "predict", X)
+    np.testing.assert_allclose(out, scalar, rtol=1e-12, atol=1e-12)
+    if lut_error is None:
+        np.testing.assert_allclose(out, codegen_bench.reference_predict(model, X)[:, 0], rtol=1e-9, atol=1e-9)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from core import codegen_bench
+from nodes.polyfit_node import PolyFitNode
+
+# Input names that the C/Java binary search used to declare as locals
+INPUTS = ["lo", "mid", "_fg_hi"]
+SPLITS = [("lo", "<", 1.0), ("lo", "<", 2.5), ("lo", "<=", 4.0)]
+
+
+@pytest.fixture(scope="module")
+def split_models(qapp):
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, 6, (400, 3))
+    y = 3 * X[:, 0] - X[:, 1] + 0.5 * X[:, 2] ** 2
+    node = PolyFitNode()
+    node.degree_spin.setValue(2)
+    models = []
+    for k in range(len(SPLITS) + 1):
+        model = node.fit(X, y + 10 * k, INPUTS)
+        model.conditions = [SPLITS[k]] if k < len(SPLITS) else []
+        models.append(model)
+    return models, X
+
+
+def expected(models, X):
+    out = models[-1].predict(X)
+    for model, (_, op, value) in reversed(list(zip(models, SPLITS))):
+        hit = X[:, 0] < value if op == "<" else X[:, 0] <= value
+        out = np.where(hit, model.predict(X), out)
+    return out
+
+
+def test_c_split_dispatch_with_colliding_input_names(generator, split_models):
+    if codegen_bench.find_compiler() is None:
+        pytest.skip("no C compiler")
+    models, X = split_models
+    code = generator.generate_code(models, "C", True, True, False, "", "", batch="AoS")
+    assert "_fg_lo" in code  # The threshold table path is the one under test
+    out, _ = codegen_bench.run_c(code, "predict", X)
+    np.testing.assert_allclose(out, expected(models, X), rtol=1e-9, atol=1e-9)
+
+
+def test_python_split_dispatch_matches_models(generator, split_models):
+    models, X = split_models
+    code = generator.generate_code(models, "Python", True, False, False, "", "CPU (Standard)")
+    out, _ = codegen_bench.run_python(code, "predict", X)
+    np.testing.assert_allclose(out, expected(models, X), rtol=1e-9, atol=1e-9)
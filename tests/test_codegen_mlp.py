@@ -0,0 +1,102 @@
+import os
+import shutil
+import subprocess
+import warnings
+import numpy as np
+import pytest
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.neural_network import MLPRegressor
+from core import codegen_bench
+from nodes.neural_net_node import NeuralNetModel
+
+JAVA_MAIN = """package frc.robot.generated;
+public class Main {
+    public static void main(String[] args) {
+        double[][] rows = %s;
+        for (double[] r : rows) System.out.println(Double.toString(FlibberModel.%s(r[0], r[1])));
+    }
+}
+"""
+
+
+def make_model(n_outputs, activation, names=("a", "b")):
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-2, 2, (200, 2))
+    Y = np.column_stack([np.sin(X[:, 0]) + X[:, 1] ** 2, X[:, 0] * X[:, 1]])
+    Y = Y[:, 0] if n_outputs == 1 else Y
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ConvergenceWarning)
+        mlp = MLPRegressor(hidden_layer_sizes=(8, 6), activation=activation, max_iter=200, random_state=0).fit(X, Y)
+    model = NeuralNetModel(mlp, 0.0, 0.0, list(names))
+    model.X_train = X
+    return model, X[:40]
+
+
+def run_java(code, func_name, X, tmp_path):
+    src = tmp_path / "frc" / "robot" / "generated"
+    src.mkdir(parents=True)
+    (src / "FlibberModel.java").write_text(code)
+    rows = "{" + ", ".join("{" + ", ".join(repr(float(v)) for v in row) + "}" for row in X) + "}"
+    (src / "Main.java").write_text(JAVA_MAIN % (rows, func_name))
+    subprocess.run(["javac", "-d", str(tmp_path), str(src / "FlibberModel.java"), str(src / "Main.java")], check=True)
+    out = subprocess.run(["java", "-cp", str(tmp_path), "frc.robot.generated.Main"],
+                         check=True, capture_output=True, text=True).stdout
+    return np.array([float(v) for v in out.split()])
+
+
+@pytest.mark.parametrize("n_outputs", [1, 2])
+def test_multi_output_splits_into_one_function_per_target(generator, n_outputs):
+    model, _ = make_model(n_outputs, "relu")
+    groups = generator._target_groups([model])
+    assert len(groups) == n_outputs
+    code = generator.generate_code([model], "Python", False, True, True, "", "CPU (Standard)")
+    for func_name, _ in groups:
+        assert f"pub_{func_name}.set({func_name}(" in code
+
+
+@pytest.mark.parametrize("activation", ["relu", "tanh", "logistic", "identity"])
+@pytest.mark.parametrize("n_outputs", [1, 2])
+@pytest.mark.parametrize("lang,use_smart", [("Python", True), ("Python", False), ("C", True), ("Java", True)])
+def test_generated_mlp_matches_predict(generator, tmp_path, lang, use_smart, n_outputs, activation):
+    if lang == "C" and codegen_bench.find_compiler() is None:
+        pytest.skip("no C compiler")
+    if lang == "Java" and not (shutil.which("javac") and shutil.which("java")):
+        pytest.skip("no JDK")
+    model, X = make_model(n_outputs, activation)
+    reference = codegen_bench.reference_predict(model, X)
+    code = generator.generate_code([model], lang, False, use_smart, False, "", "CPU (Standard)",
+                                   batch="AoS" if lang == "C" else None)
+    for k, (func_name, _) in enumerate(generator._target_groups([model])):
+        if lang == "Python":
+            out, _ = codegen_bench.run_python(code, func_name, X)
+        elif lang == "C":
+            out, _ = codegen_bench.run_c(code, func_name, X)
+        else:
+            out = run_java(code, func_name, X, tmp_path / func_name)
+        np.testing.assert_allclose(out, reference[:, k], rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("lang,use_smart", [("Python", True), ("Python", False), ("C", True), ("Java", True)])
+def test_mlp_loop_locals_do_not_shadow_inputs(generator, tmp_path, lang, use_smart):
+    if lang == "C" and codegen_bench.find_compiler() is None:
+        pytest.skip("no C compiler")
+    if lang == "Java" and not (shutil.which("javac") and shutil.which("java")):
+        pytest.skip("no JDK")
+    model, X = make_model(1, "tanh", names=("i", "acc"))
+    code = generator.generate_code([model], lang, False, use_smart, False, "", "CPU (Standard)",
+                                   batch="AoS" if lang == "C" else None)
+    if lang == "Python":
+        out, _ = codegen_bench.run_python(code, "predict", X)
+    elif lang == "C":
+        out, _ = codegen_bench.run_c(code, "predict", X)
+    else:
+        out = run_java(code, "predict", X, tmp_path)
+    np.testing.assert_allclose(out, codegen_bench.reference_predict(model, X)[:, 0], rtol=1e-9, atol=1e-12)
+
+
+def test_java_mlp_keeps_no_shared_buffers(generator):
+    # update() runs on the NT worker thread while robot code may call predict too
+    model, _ = make_model(1, "relu")
+    code = generator.generate_code([model], "Java", False, True, True, "", "CPU (Standard)")
+    assert "static final double[] _fg_" not in code
+    assert "final double[] _fg_nn_h_0 = new double[8];" in code
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from core import codegen_bench
+from nodes.polyfit_node import PolyFitNode
+
+BASES = ["Monomial", "Chebyshev", "Legendre"]
+CASES = [(1, 1, True), (3, 1, True), (5, 1, True), (2, 3, True), (4, 2, True), (3, 4, False)]
+
+
+def fit(qapp, degree, n_inputs, interactions, basis="Monomial", n_targets=1, prune=0.0, names=None):
+    rng = np.random.default_rng(degree * 10 + n_inputs)
+    X = rng.uniform(-3, 4, (300, n_inputs))
+    y = (X.sum(axis=1) ** degree) / 10 + np.sin(X[:, 0])
+    Y = np.column_stack([y * (k + 1) - k for k in range(n_targets)]) if n_targets > 1 else y
+    node = PolyFitNode()
+    node.basis_combo.setCurrentIndex(BASES.index(basis))
+    node.degree_spin.setValue(degree)
+    node.interact_cb.setChecked(interactions)
+    node.prune_spin.setValue(prune)
+    names = names or [f"x{j}" for j in range(n_inputs)]
+    model = node.fit(X, Y, names, [f"t{k}" for k in range(n_targets)])
+    model.X_train = X
+    return model, X[:200]
+
+
+def check(generator, model, X, lang, use_horner):
+    reference = codegen_bench.reference_predict(model, X)
+    code = generator.generate_code([model], lang, use_horner, True, False, "", "CPU (Standard)",
+                                   batch="AoS" if lang == "C" else None)
+    for k, (func_name, _) in enumerate(generator._target_groups([model])):
+        if lang == "Python":
+            out, _ = codegen_bench.run_python(code, func_name, X)
+        else:
+            out, _ = codegen_bench.run_c(code, func_name, X)
+        scale = np.abs(reference[:, k]).max()
+        np.testing.assert_allclose(out, reference[:, k], rtol=1e-10, atol=1e-12 * scale)
+
+
+def langs():
+    return ["Python"] + (["C"] if codegen_bench.find_compiler() else [])
+
+
+@pytest.mark.parametrize("lang", langs())
+@pytest.mark.parametrize("use_horner", [True, False])
+@pytest.mark.parametrize("degree,n_inputs,interactions", CASES)
+def test_generated_polynomial_matches_predict(qapp, generator, degree, n_inputs, interactions, use_horner, lang):
+    check(generator, *fit(qapp, degree, n_inputs, interactions), lang, use_horner)
+
+
+@pytest.mark.parametrize("lang", langs())
+@pytest.mark.parametrize("basis", BASES[1:])
+def test_generated_orthogonal_basis_matches_predict(qapp, generator, basis, lang):
+    check(generator, *fit(qapp, 8, 2, True, basis=basis), lang, True)
+
+
+@pytest.mark.parametrize("lang", langs())
+def test_generated_multi_target_and_pruned_fits_match_predict(qapp, generator, lang):
+    check(generator, *fit(qapp, 3, 2, True, n_targets=3), lang, True)
+    model, X = fit(qapp, 4, 2, True, prune=0.5)
+    assert model.n_pruned > 0
+    check(generator, model, X, lang, True)
+
+
+@pytest.mark.parametrize("lang", langs())
+@pytest.mark.parametrize("use_horner", [True, False])
+def test_hoisted_powers_do_not_shadow_inputs(qapp, generator, use_horner, lang):
+    # d^2 must not be hoisted into a local that overwrites the input d_2
+    check(generator, *fit(qapp, 2, 2, True, names=["d", "d_2"]), lang, use_horner)
+
+
+@pytest.mark.parametrize("lang", langs())
+@pytest.mark.parametrize("basis", BASES[1:])
+def test_orthogonal_locals_do_not_shadow_inputs(qapp, generator, basis, lang):
+    # Clenshaw's b0/b1/b2 and the recurrence's u_*/t*_ terms used to be plain names
+    check(generator, *fit(qapp, 5, 1, True, basis=basis, names=["b1"]), lang, True)
+    check(generator, *fit(qapp, 4, 2, True, basis=basis, names=["x", "t2_x"]), lang, True)
+
+
+def test_horner_needs_fewer_multiplies_than_the_flat_form(qapp, generator):
+    model, _ = fit(qapp, 5, 3, True)
+    header = next(line for line in generator.generate_code([model], "C", True, True, False, "", "").splitlines()
+                  if "flat pow form" in line)
+    muls, flat_muls = int(header.split()[1]), int(header.split("form: ")[1].split()[0])
+    assert muls < flat_muls
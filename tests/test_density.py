@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from core import density
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (7, 13), (120, 80)])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_bin_counts_match_histogram2d(shape, seed):
+    rng = np.random.default_rng(seed)
+    x, y = rng.normal(size=(2, 20000))
+    xlim, ylim = (-1.5, 2.0), (-2.0, 1.0)
+    counts = density.bin_counts(x, y, xlim, ylim, shape)
+    # Bins are half-open [a, b): keep histogram2d from closing the last one
+    inside = (x < xlim[1]) & (y < ylim[1])
+    expected, _, _ = np.histogram2d(y[inside], x[inside], bins=shape, range=[ylim, xlim])
+    np.testing.assert_array_equal(counts, expected.astype(int))
+
+
+def test_bin_counts_ignore_non_finite_and_outside_points():
+    x = np.array([0.5, np.nan, np.inf, -5.0, 1e300, 0.25])
+    y = np.array([0.5, 0.5, 0.5, 0.5, 0.5, np.nan])
+    counts = density.bin_counts(x, y, (0.0, 1.0), (0.0, 1.0), (2, 2))
+    np.testing.assert_array_equal(counts, [[0, 0], [0, 1]])
+
+
+def test_shade_opacity_follows_counts():
+    counts = np.array([[0, 1], [10, 100]])
+    image = density.shade(counts, (1.0, 0.5, 0.0))
+    assert image.shape == (2, 2, 4) and image.dtype == np.uint8
+    np.testing.assert_array_equal(image[..., :3], np.broadcast_to([255, 128, 0], (2, 2, 3)))
+    alpha = image[..., 3]
+    assert alpha[0, 0] == 0 and alpha[1, 1] == 255
+    assert round(density.MIN_ALPHA * 255) == alpha[0, 1] < alpha[1, 0] < alpha[1, 1]
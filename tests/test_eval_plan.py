@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import PolynomialFeatures
+from core import eval_plan
+from core.eval_plan import MonomialPlan
+
+
+def fitted(degree, n_features, n_targets=None, interaction_only=False):
+    rng = np.random.default_rng(degree * 10 + n_features)
+    X = rng.uniform(-2, 2, (200, n_features))
+    Y = rng.normal(size=(200, n_targets)) if n_targets else rng.normal(size=200)
+    Y = Y + X.sum(axis=1, keepdims=bool(n_targets)) ** degree
+    pipe = make_pipeline(PolynomialFeatures(degree, interaction_only=interaction_only, include_bias=False),
+                         LinearRegression()).fit(X, Y)
+    poly, reg = pipe.steps[0][1], pipe.steps[1][1]
+    return pipe, MonomialPlan(poly.powers_, reg.coef_.T, reg.intercept_)
+
+
+@pytest.mark.parametrize("interaction_only", [False, True])
+@pytest.mark.parametrize("degree,n_features", [(1, 1), (3, 1), (5, 1), (2, 3), (4, 3), (3, 5)])
+def test_plan_matches_sklearn(degree, n_features, interaction_only):
+    pipe, plan = fitted(degree, n_features, interaction_only=interaction_only)
+    X = np.random.default_rng(7).uniform(-3, 3, (500, n_features))
+    np.testing.assert_allclose(plan(X), pipe.predict(X), rtol=1e-10, atol=1e-9)
+    # Single rows take the scalar path
+    np.testing.assert_allclose(plan(X[:1]), pipe.predict(X[:1]), rtol=1e-10, atol=1e-9)
+
+
+@pytest.mark.parametrize("n_rows", [1, 10, eval_plan.BATCH_CHUNK + 17])
+def test_multi_target_plan_matches_sklearn(n_rows):
+    pipe, plan = fitted(3, 2, n_targets=3)
+    X = np.random.default_rng(3).uniform(-2, 2, (n_rows, 2))
+    out = plan(X)
+    assert out.shape == (n_rows, 3)
+    np.testing.assert_allclose(out, pipe.predict(X), rtol=1e-10, atol=1e-9)
+
+
+def test_zero_coefficients_leave_the_tree():
+    powers = np.array([[1, 0], [0, 1], [2, 0], [1, 1]])
+    tree = eval_plan.build_horner_tree(powers, np.array([1.0, 0.0, 2.0, 0.0]), 0.5)
+    # x0 * (1 + 2 * x0) + 0.5: x1 never appears
+    assert eval_plan.count_ops(tree) == (2, 2)
+    assert eval_plan.eval_tree(tree, [3.0, 100.0]) == pytest.approx(3.0 + 2 * 9.0 + 0.5)
+
+
+def test_power_chain_builds_every_power():
+    steps = eval_plan.power_chain([2, 5, 8])
+    have = {1: True}
+    for k, a, b in steps:
+        assert a in have and b in have and a + b == k
+        have[k] = True
+    assert {2, 5, 8} <= set(have)
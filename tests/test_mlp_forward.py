@@ -0,0 +1,49 @@
+import warnings
+import numpy as np
+import pytest
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.neural_network import MLPRegressor
+from core.mlp_forward import MLPForward
+from nodes.neural_net_node import NeuralNetModel
+
+
+def fit_mlp(activation, n_outputs):
+    rng = np.random.default_rng(1)
+    X = rng.uniform(-2, 2, (150, 3))
+    Y = np.column_stack([np.sin(X[:, 0]) + X[:, 1] * X[:, 2], X[:, 0] ** 2 - X[:, 2], np.cos(X[:, 1])])
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ConvergenceWarning)
+        mlp = MLPRegressor(hidden_layer_sizes=(12, 7), activation=activation, max_iter=150, random_state=0)
+        mlp.fit(X, Y[:, 0] if n_outputs == 1 else Y[:, :n_outputs])
+    return mlp, rng.uniform(-2.5, 2.5, (64, 3))
+
+
+@pytest.mark.parametrize("activation", ["relu", "tanh", "logistic", "identity"])
+@pytest.mark.parametrize("n_outputs", [1, 3])
+def test_float64_forward_equals_sklearn_predict(activation, n_outputs):
+    mlp, X = fit_mlp(activation, n_outputs)
+    forward = MLPForward(mlp)
+    np.testing.assert_array_equal(forward.predict(X), mlp.predict(X))
+    # Buffers are reused across calls and batch sizes
+    np.testing.assert_array_equal(forward.predict(X[:5]), mlp.predict(X[:5]))
+    np.testing.assert_array_equal(forward.predict(X), mlp.predict(X))
+
+
+@pytest.mark.parametrize("activation", ["relu", "tanh", "logistic", "identity"])
+@pytest.mark.parametrize("n_outputs", [1, 3])
+def test_float32_forward_is_close_to_sklearn_predict(activation, n_outputs):
+    mlp, X = fit_mlp(activation, n_outputs)
+    out = MLPForward(mlp, dtype=np.float32).predict(X)
+    assert out.dtype == np.float32
+    reference = mlp.predict(X)
+    np.testing.assert_allclose(out, reference, rtol=1e-4, atol=1e-5 * np.abs(reference).max())
+
+
+def test_model_switches_engine_with_float32_flag():
+    mlp, X = fit_mlp("tanh", 3)
+    model = NeuralNetModel(mlp, 0.0, 0.0, ["a", "b", "c"])
+    np.testing.assert_array_equal(model.predict(X), mlp.predict(X))
+    model.float32 = True
+    assert model.predict(X).dtype == np.float32
+    for k, part in enumerate(model.split_targets()):
+        np.testing.assert_allclose(part.predict(X), mlp.predict(X)[:, k], rtol=1e-4, atol=1e-5)
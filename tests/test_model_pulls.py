@@ -0,0 +1,28 @@
+from types import SimpleNamespace
+import numpy as np
+from nodes.inspector_node import InspectorNode
+from nodes.polyfit_node import PolyFitNode
+
+
+def connect(src, dst):
+    dst.inputs[0].edges = [SimpleNamespace(start_socket=src.outputs[0])]
+
+
+def test_downstream_pulls_follow_upstream_data(qapp):
+    X = np.linspace(-1, 1, 50).reshape(-1, 1)
+    data = {'X': X, 'Y': 2 * X[:, 0] + 1, 'feature_names': ["x"]}
+    fit = PolyFitNode()
+    fit.get_input_value = lambda index: data
+    inspector = InspectorNode()
+    connect(fit, inspector)
+    
+    model = inspector.eval()
+    # Unchanged data: the fit is reused, not redone
+    assert inspector.eval() is model
+    # New data: the next pull sees the refit instead of the stale model
+    data['Y'] = X[:, 0] ** 2
+    refit = inspector.eval()
+    assert refit is not model and refit is fit.model
+    np.testing.assert_allclose(refit.predict(X), X[:, 0] ** 2, atol=1e-12)
+    fit.degree_spin.setValue(1)
+    assert inspector.eval() is not refit
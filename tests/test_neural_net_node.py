@@ -0,0 +1,40 @@
+import numpy as np
+from nodes.neural_net_node import NeuralNetNode
+
+
+def make_node(qapp, X, Y):
+    node = NeuralNetNode()
+    node.num_layers_spin.setValue(1)
+    node.layer_spinboxes[0].setValue(8)
+    node.iter_spin.setValue(100)
+    data = {'X': X, 'Y': Y, 'feature_names': ["x"]}
+    node.get_input_value = lambda index: data
+    return node, data
+
+
+def test_repeated_pulls_reuse_the_trained_model(qapp):
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-1, 1, (60, 1))
+    node, data = make_node(qapp, X, np.sin(3 * X[:, 0]))
+    model = node.eval()
+    weights = [w.copy() for w in model.model.coefs_]
+    # Implicit downstream pulls must not warm-start further epochs
+    assert node.eval() is model and node.eval() is model
+    for w, w0 in zip(model.model.coefs_, weights):
+        np.testing.assert_array_equal(w, w0)
+    
+    data['Y'] = np.cos(3 * X[:, 0])
+    refit = node.eval()
+    assert refit is not model and refit.loss_history['warm']
+    node.run_train()
+    assert node.model is not refit
+
+
+def test_float32_checkbox_reaches_the_model(qapp):
+    X = np.linspace(-1, 1, 40).reshape(-1, 1)
+    node, _ = make_node(qapp, X, X[:, 0] ** 2)
+    model = node.eval()
+    assert model.predict(X).dtype == np.float64
+    node.f32_cb.setChecked(True)
+    assert model.predict(X).dtype == np.float32
+    assert node.eval() is model and model.float32
@@ -0,0 +1,31 @@
+import numpy as np
+from core import nt_bench
+from nodes.polyfit_node import PolyFitNode
+
+N_ROWS = 20
+
+
+def fit(qapp):
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-1, 1, (200, 3))
+    model = PolyFitNode().fit(X, X[:, 0] ** 2 + X[:, 1] * X[:, 2], ["a", "b", "c"], ["y"])
+    return model, X[:N_ROWS]
+
+
+def test_listener_runtime_publishes_each_prediction_once(qapp, generator):
+    model, X = fit(qapp)
+    code = generator.generate_code([model], "Python", True, True, True, "", "CPU (Standard)")
+    rows = nt_bench.run_latency(code, "predict", ["a", "b", "c"], "Result", X)
+    listener, poll = rows
+    # A row only completes once the published value equals predict(row) exactly
+    assert "error" not in listener and "error" not in poll
+    # Listeners of one update share a recompute
+    assert 1.0 <= listener['publishes'] <= 1.5
+    assert listener['median_ms'] < poll['median_ms']
+
+
+def test_java_runtime_worker_is_a_daemon(qapp, generator):
+    model, _ = fit(qapp)
+    code = generator.generate_code([model], "Java", True, True, True, "", "CPU (Standard)")
+    assert "newSingleThreadExecutor()" not in code
+    assert "t.setDaemon(true);" in code
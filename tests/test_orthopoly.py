@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from numpy.polynomial import chebyshev, legendre
+from sklearn.preprocessing import PolynomialFeatures
+from core import orthopoly
+
+NUMPY_VAL = {"Chebyshev": chebyshev.chebval, "Legendre": legendre.legval}
+KINDS = list(NUMPY_VAL)
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_basis_values_match_numpy(kind):
+    u = np.linspace(-1, 1, 101)
+    values = orthopoly.basis_values(u, 15, kind)
+    for k in range(16):
+        np.testing.assert_allclose(values[:, k], NUMPY_VAL[kind](u, np.eye(16)[k]), atol=1e-12)
+
+
+@pytest.mark.parametrize("degree", [0, 1, 2, 7, 20])
+@pytest.mark.parametrize("kind", KINDS)
+def test_clenshaw_matches_numpy(kind, degree):
+    rng = np.random.default_rng(degree)
+    coeffs = rng.normal(size=degree + 1)
+    u = np.linspace(-1, 1, 57)
+    np.testing.assert_allclose(orthopoly.clenshaw(coeffs, u, kind), NUMPY_VAL[kind](u, coeffs), atol=1e-12)
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_design_matrix_is_tensor_product_over_scaled_inputs(kind):
+    rng = np.random.default_rng(1)
+    X = rng.uniform([-5, 100], [3, 250], (80, 2))
+    powers = PolynomialFeatures(degree=4, include_bias=False).fit(X[:1]).powers_
+    domain = orthopoly.make_domain(X)
+    A = orthopoly.design_matrix(X, powers, domain, kind)
+    U = orthopoly.scale_to_unit(X, domain)
+    assert U.min() == pytest.approx(-1) and U.max() == pytest.approx(1)
+    for col, (p, q) in zip(A.T, powers):
+        expected = NUMPY_VAL[kind](U[:, 0], np.eye(5)[p]) * NUMPY_VAL[kind](U[:, 1], np.eye(5)[q])
+        np.testing.assert_allclose(col, expected, atol=1e-12)
+
+
+def test_make_domain_gives_constant_columns_a_unit_window():
+    lo, hi = orthopoly.make_domain(np.array([[1.0, 4.0], [3.0, 4.0]]))
+    np.testing.assert_array_equal(lo, [1.0, 4.0])
+    np.testing.assert_array_equal(hi, [3.0, 5.0])
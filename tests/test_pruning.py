@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from sklearn.preprocessing import PolynomialFeatures
+from core.pruning import prune_terms
+
+
+def design(n_targets=None):
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-1, 1, (300, 3))
+    Phi = PolynomialFeatures(degree=3, include_bias=False).fit_transform(X)
+    A = np.column_stack([np.ones(len(X)), Phi])
+    # A few strong terms, many weak ones
+    beta = rng.normal(size=(A.shape[1],) + ((n_targets,) if n_targets else ())) * 1e-3
+    beta[[0, 1, 5, 9]] = 2.0
+    Y = A @ beta + rng.normal(scale=1e-4, size=(len(X),) + beta.shape[1:])
+    return A, Y
+
+
+def full_fit(A, Y):
+    return A @ np.linalg.lstsq(A, Y, rcond=None)[0]
+
+
+@pytest.mark.parametrize("n_targets", [None, 2])
+@pytest.mark.parametrize("budget", [1e-3, 1e-2, 0.1])
+def test_pruned_solution_is_a_refit_within_budget(budget, n_targets):
+    A, Y = design(n_targets)
+    sol, n_pruned = prune_terms(A, Y, budget)
+    kept = np.flatnonzero(np.abs(sol.reshape(len(sol), -1)).max(axis=1) > 0)
+    assert n_pruned > 0 and len(kept) == A.shape[1] - n_pruned
+    assert 0 in kept  # The intercept is never pruned
+    # The QR downdates give the same coefficients as solving the kept columns from scratch
+    refit = np.linalg.lstsq(A[:, kept], Y, rcond=None)[0]
+    np.testing.assert_allclose(sol[kept], refit, rtol=1e-7, atol=1e-9)
+    assert np.max(np.abs(A @ sol - full_fit(A, Y))) <= budget * (1 + 1e-9)
+
+
+def test_larger_budget_prunes_at_least_as_much():
+    A, Y = design()
+    counts = [prune_terms(A, Y, budget)[1] for budget in (1e-4, 1e-3, 1e-2, 1e-1)]
+    assert counts == sorted(counts)
+
+
+def test_zero_budget_keeps_the_full_fit():
+    A, Y = design()
+    sol, n_pruned = prune_terms(A, Y, 0.0)
+    assert n_pruned == 0
+    np.testing.assert_allclose(A @ sol, full_fit(A, Y), atol=1e-9)
@@ -0,0 +1,94 @@
+import ctypes
+import subprocess
+import warnings
+import numpy as np
+import pytest
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.neural_network import MLPRegressor
+from sklearn.preprocessing import PolynomialFeatures
+from core import codegen_bench
+from core.quantize import QuantizedPoly, QuantizedMLP, calibration_set, quantize_inputs
+from nodes.neural_net_node import NeuralNetModel
+
+# Max |error| as a fraction of the output span over the calibration set
+POLY_BOUNDS = {8: 2e-2, 16: 1e-4}
+PIECEWISE_LINEAR_BOUNDS = {8: 2e-2, 16: 1e-4}  # relu / identity hidden layers
+TABLE_BOUND_16 = 1e-2  # tanh / logistic through 257-entry tables
+
+
+def target(X):
+    return 0.3 * X[:, 0] ** 3 - X[:, 0] * X[:, 1] + 2 * X[:, 1] ** 2 + 4
+
+
+@pytest.fixture(scope="module")
+def X():
+    return np.random.default_rng(0).uniform([0, -5], [10, 5], (300, 2))
+
+
+def mlp(X, activation):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ConvergenceWarning)
+        return MLPRegressor(hidden_layer_sizes=(16, 8), activation=activation, max_iter=500,
+                            random_state=0).fit(X, target(X))
+
+
+def relative_error(q, reference, X):
+    return np.max(np.abs(q.predict(X) - reference(X))) / np.ptp(reference(X))
+
+
+@pytest.mark.parametrize("bits", [8, 16])
+def test_poly_error_bound(X, bits):
+    powers = PolynomialFeatures(3, include_bias=False).fit(X[:1]).powers_
+    q = QuantizedPoly(target, powers, X, bits)
+    X_calib, _, _ = calibration_set(X)
+    assert relative_error(q, target, X_calib) <= POLY_BOUNDS[bits]
+    assert q.max_error == pytest.approx(np.max(np.abs(q.predict(X_calib) - target(X_calib))))
+    # Fresh points inside the calibrated box stay within the reported error (plus rounding slack)
+    fresh = np.random.default_rng(5).uniform(X.min(axis=0), X.max(axis=0), (5000, 2))
+    assert np.max(np.abs(q.predict(fresh) - target(fresh))) <= 1.5 * q.max_error
+    # The accumulator never exceeds the integer type chosen for it
+    assert np.abs(q.predict_int(np.vstack([X_calib, fresh]))).max() < 2 ** (q.acc_bits - 1)
+
+
+@pytest.mark.parametrize("activation", ["relu", "identity", "tanh", "logistic"])
+def test_mlp_error_bound(X, activation):
+    net = mlp(X, activation)
+    X_calib, _, _ = calibration_set(X)
+    errors = {bits: relative_error(QuantizedMLP(net, X, bits), net.predict, X_calib) for bits in (8, 16)}
+    assert errors[16] < errors[8]
+    if activation in ("relu", "identity"):
+        assert errors[8] <= PIECEWISE_LINEAR_BOUNDS[8] and errors[16] <= PIECEWISE_LINEAR_BOUNDS[16]
+    else:
+        assert errors[16] <= TABLE_BOUND_16
+
+
+def test_inputs_saturate_outside_the_calibrated_range():
+    mid, inv_half = np.array([0.0]), np.array([1.0])
+    q = quantize_inputs(np.array([[-3.0], [-1.0], [0.0], [0.5], [1.0], [3.0]]), mid, inv_half, 8)
+    np.testing.assert_array_equal(q.ravel(), [-127, -127, 0, 64, 127, 127])
+
+
+def compile_c(code, tmp_path):
+    src, lib = tmp_path / "model.c", tmp_path / "model.so"
+    src.write_text(code)
+    subprocess.run([codegen_bench.find_compiler(), "-O2", "-shared", "-fPIC", "-o", str(lib), str(src), "-lm"],
+                   check=True)
+    return ctypes.CDLL(str(lib))
+
+
+@pytest.mark.parametrize("activation", ["relu", "tanh"])
+@pytest.mark.parametrize("precision", ["Int8", "Int16"])
+def test_generated_fixed_point_c_is_bit_exact(generator, X, tmp_path, precision, activation):
+    if codegen_bench.find_compiler() is None:
+        pytest.skip("no C compiler")
+    model = NeuralNetModel(mlp(X, activation), 0.0, 0.0, ["a", "b"])
+    model.X_train = X
+    lib = compile_c(generator.generate_code([model], "C", False, True, False, "", "", precision=precision), tmp_path)
+    bits = int(precision[3:])
+    q = QuantizedMLP(model.model, X, bits)
+    func = lib.predict_q
+    func.restype = ctypes.c_int64 if q.layers[-1]['acc_type'] == "int64_t" else ctypes.c_int32
+    func.argtypes = [ctypes.c_int32] * 2
+    U = quantize_inputs(X, q.mid, q.inv_half, bits)
+    out = np.array([func(int(u0), int(u1)) for u0, u1 in U])
+    np.testing.assert_array_equal(out, q.predict_int(X))
@@ -0,0 +1,48 @@
+import numpy as np
+from matplotlib.colors import to_rgb
+from core import density
+
+
+class DensityScatter:
+    """A scatter drawn as one image of per-pixel point counts (log-scaled opacity).
+
+    The image is binned at the axes' pixel resolution for the current view,
+    so drawing costs the same for a thousand rows or ten million. Call
+    rebin() before drawing the image: it re-aggregates only when the data,
+    view limits (toolbar zoom/pan) or axes size changed since the last call.
+    """
+    def __init__(self, ax, color, alpha=None):
+        self.ax = ax
+        self.rgb = to_rgb(color)
+        self.x = self.y = None
+        self.key = None
+        self.image = ax.imshow(np.zeros((1, 1, 4), dtype=np.uint8), origin='lower', aspect='auto',
+                               interpolation='nearest', extent=(0, 1, 0, 1), alpha=alpha, animated=True)
+        self.image.set_visible(False)
+
+    def set_data(self, x, y):
+        self.x, self.y = x, y
+        self.key = None
+        self.image.set_visible(x is not None and len(x) > 0)
+
+    def set_color(self, color):
+        if to_rgb(color) != self.rgb:
+            self.rgb = to_rgb(color)
+            self.key = None
+
+    def hide(self):
+        self.set_data(None, None)
+
+    def rebin(self):
+        if not self.image.get_visible():
+            return
+        xlim, ylim = sorted(self.ax.get_xlim()), sorted(self.ax.get_ylim())
+        bbox = self.ax.bbox
+        shape = (max(int(bbox.height), 1), max(int(bbox.width), 1))
+        key = (tuple(xlim), tuple(ylim), shape)
+        if key == self.key:
+            return
+        counts = density.bin_counts(self.x, self.y, xlim, ylim, shape)
+        self.image.set_data(density.shade(counts, self.rgb))
+        self.image.set_extent((*xlim, *ylim))
+        self.key = key
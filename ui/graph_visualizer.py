@@ -1,12 +1,29 @@
 import numpy as np
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                                QComboBox, QSlider, QWidget, QScrollArea)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QGuiApplication
+from collections import OrderedDict
 import matplotlib
 matplotlib.use('QtAgg')
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.colors import Normalize
+from matplotlib.cm import ScalarMappable
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
+from core.box_index import BoxIndex
+from core.density import DENSITY_MIN_POINTS
+from ui.density_scatter import DensityScatter
+from core import surface, lut
+
+# Points along the horizontal axis per model slice
+N_SLICE_POINTS = 200
+# Predicted slices kept per (axis, fixed slider values)
+SLICE_CACHE_SIZE = 256
+# Two-input views of the model surface
+SURFACE_VIEWS = ("Heatmap", "Contour")
+N_CONTOUR_LEVELS = 12
+SURFACE_CMAP = 'viridis'
 
 class GraphSlicerDialog(QDialog):
     def __init__(self, model, data=None, parent=None):
@@ -27,11 +44,43 @@ class GraphSlicerDialog(QDialog):
         
         # State: which feature is on X axis
         self.x_axis_idx = 0 
+        # Surface views: second grid axis and the selected view ("Slice" or one of SURFACE_VIEWS)
+        self.y_axis_idx = 1 if self.n_features > 1 else 0
+        self.view_mode = "Slice"
+        # Surface views show one output of multi-target models at a time
+        self.target_names = list(getattr(self.model, 'target_names', None) or [])
+        self.target_idx = 0
         # State: discrete values for all features (sliders)
         # Initialize to mean of range
         self.current_values = [(r[0] + r[1])/2 for r in self.ranges]
+        self._slice_cache = OrderedDict()
+        # Sorted per-feature index for the "Nearby Data" tolerance box, built once per dataset
+        self._data_index = None
+        if self.data and 'X' in self.data and np.ndim(self.data['X']) > 1:
+            self._data_index = BoxIndex(self.data['X'])
+        
+        # Slider ticks only mark the plot dirty; it is redrawn at most once per display frame
+        screen = QGuiApplication.primaryScreen()
+        refresh_hz = screen.refreshRate() if screen and screen.refreshRate() > 0 else 60.0
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(max(1, int(1000 / refresh_hz)))
+        self._redraw_timer.timeout.connect(self._update_plot)
+        
+        # Surfaces are evaluated off the GUI thread; finished levels are picked up once per frame
+        self._surface = None
+        if self.n_features > 1:
+            self._surface = surface.SurfaceWorker(lut.model_function(self.model, self.target_idx), self.ranges)
+        self._surface_requested = None
+        self._surface_level = None
+        self._surface_shown = None
+        self._surface_dirty = False
+        self._surface_timer = QTimer(self)
+        self._surface_timer.setInterval(self._redraw_timer.interval())
+        self._surface_timer.timeout.connect(self._poll_surface)
         
         self._init_ui()
+        self._setup_axes()
         self._update_plot()
         
     def _get_feature_names(self):
@@ -82,6 +131,31 @@ class GraphSlicerDialog(QDialog):
         self.xaxis_combo.currentIndexChanged.connect(self._on_axis_changed)
         top_layout.addWidget(self.xaxis_combo)
         
+        # Y-Axis Selector (surface views only)
+        self.yaxis_lbl = QLabel("Vertical Axis:")
+        top_layout.addWidget(self.yaxis_lbl)
+        self.yaxis_combo = QComboBox()
+        self.yaxis_combo.addItems(self.features)
+        self.yaxis_combo.setCurrentIndex(self.y_axis_idx)
+        self.yaxis_combo.currentIndexChanged.connect(self._on_yaxis_changed)
+        top_layout.addWidget(self.yaxis_combo)
+        
+        top_layout.addWidget(QLabel("View:"))
+        self.view_combo = QComboBox()
+        self.view_combo.addItems(["Slice", *SURFACE_VIEWS])
+        # A surface needs two inputs
+        self.view_combo.setEnabled(self.n_features > 1)
+        self.view_combo.currentTextChanged.connect(self._on_view_changed)
+        top_layout.addWidget(self.view_combo)
+        
+        # Target selector (surface views of multi-target models)
+        self.target_lbl = QLabel("Target:")
+        top_layout.addWidget(self.target_lbl)
+        self.target_combo = QComboBox()
+        self.target_combo.addItems(self.target_names)
+        self.target_combo.currentIndexChanged.connect(self._on_target_changed)
+        top_layout.addWidget(self.target_combo)
+        
         top_layout.addStretch()
         layout.addLayout(top_layout)
         
@@ -93,6 +167,8 @@ class GraphSlicerDialog(QDialog):
         plot_layout = QVBoxLayout(plot_container)
         self.figure = Figure(facecolor='#1E1E1E')
         self.canvas = FigureCanvas(self.figure)
+        self.background = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         self.toolbar = NavigationToolbar(self.canvas, self)
         plot_layout.addWidget(self.toolbar)
         plot_layout.addWidget(self.canvas)
@@ -171,25 +247,77 @@ class GraphSlicerDialog(QDialog):
         
         self.xaxis_combo.setCurrentIndex(0)
         self._update_slider_visibility()
+        self.yaxis_lbl.setVisible(False)
+        self.yaxis_combo.setVisible(False)
+        self.target_lbl.setVisible(False)
+        self.target_combo.setVisible(False)
 
     def _on_tol_change(self, val):
         real_val = val / 10.0
         self.tol_val_lbl.setText(f"{real_val:.1f}")
-        self._update_plot()
+        self._schedule_update()
+
+    def _surface_mode(self):
+        return self.view_mode in SURFACE_VIEWS
 
     def _update_slider_visibility(self):
-        # Hide the slider for the currently selected X-axis
+        # Hide the sliders for the currently selected axes
+        axes = {self.x_axis_idx, self.y_axis_idx} if self._surface_mode() else {self.x_axis_idx}
         for i, w in enumerate(self.slider_widgets):
-            if i == self.x_axis_idx:
+            if i in axes:
                 w.setVisible(False)
             else:
                 w.setVisible(True)
 
     def _on_axis_changed(self, index):
+        if index == self.y_axis_idx and self.n_features > 1:
+            # Keep the two surface axes distinct by swapping them
+            self._set_yaxis(self.x_axis_idx)
         self.x_axis_idx = index
         self._update_slider_visibility()
+        self._setup_axes()
+        self._update_plot()
+
+    def _on_yaxis_changed(self, index):
+        if index == self.x_axis_idx:
+            self.xaxis_combo.blockSignals(True)
+            self.xaxis_combo.setCurrentIndex(self.y_axis_idx)
+            self.xaxis_combo.blockSignals(False)
+            self.x_axis_idx = self.y_axis_idx
+        self.y_axis_idx = index
+        self._update_slider_visibility()
+        self._setup_axes()
+        self._update_plot()
+
+    def _set_yaxis(self, index):
+        self.yaxis_combo.blockSignals(True)
+        self.yaxis_combo.setCurrentIndex(index)
+        self.yaxis_combo.blockSignals(False)
+        self.y_axis_idx = index
+
+    def _on_view_changed(self, text):
+        self.view_mode = text
+        self.yaxis_lbl.setVisible(self._surface_mode())
+        self.yaxis_combo.setVisible(self._surface_mode())
+        self.target_lbl.setVisible(self._surface_mode() and len(self.target_names) > 1)
+        self.target_combo.setVisible(self._surface_mode() and len(self.target_names) > 1)
+        self._surface_timer.stop()
+        self._update_slider_visibility()
+        self._setup_axes()
+        self._update_plot()
+    
+    def _on_target_changed(self, index):
+        # Cached tiles belong to the previous output: start a fresh worker
+        self.target_idx = index
+        self._surface_timer.stop()
+        self._surface.close()
+        self._surface = surface.SurfaceWorker(lut.model_function(self.model, index), self.ranges)
+        self._setup_axes()
         self._update_plot()
         
+    def _target_name(self):
+        return self.target_names[self.target_idx] if self.target_names else "Output"
+        
     def _on_slider_change(self, slider_obj, int_val):
         idx = slider_obj.idx
         # Map 0-1000 to min-max
@@ -198,75 +326,344 @@ class GraphSlicerDialog(QDialog):
         
         self.current_values[idx] = val
         slider_obj.val_label.setText(f"{val:.2f}")
-        self._update_plot()
+        self._schedule_update()
 
-    def _update_plot(self):
+    def _schedule_update(self):
+        # Ticks arriving before the pending frame fires are folded into it
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+
+    def _predict_slice(self):
+        """Model output along the horizontal axis at the current slider values (cached per slider state)"""
+        idx_main = self.x_axis_idx
+        key = (idx_main, tuple(v for i, v in enumerate(self.current_values) if i != idx_main))
+        cached = self._slice_cache.get(key)
+        if cached is not None:
+            self._slice_cache.move_to_end(key)
+            return cached
+        
+        r_min, r_max = self.ranges[idx_main]
+        x_steps = np.linspace(r_min, r_max, N_SLICE_POINTS)
+        X_pred = np.tile(np.asarray(self.current_values, dtype=float), (N_SLICE_POINTS, 1))
+        X_pred[:, idx_main] = x_steps
+        y_pred = np.asarray(self.model.predict(X_pred), dtype=float)
+        
+        self._slice_cache[key] = (x_steps, y_pred)
+        if len(self._slice_cache) > SLICE_CACHE_SIZE:
+            self._slice_cache.popitem(last=False)
+        return x_steps, y_pred
+
+    def _new_axes(self):
         self.figure.clear()
-        ax = self.figure.add_subplot(111)
+        ax = self.ax = self.figure.add_subplot(111)
         ax.set_facecolor('#252526')
         ax.tick_params(colors='#AAAAAA')
         for spine in ax.spines.values():
             spine.set_color('#555555')
-            
-        # 1. Plot the Model Curve (Slice)
+        ax.title.set_color('#CCCCCC')
+        ax.title.set_fontsize(9)
+        return ax
+
+    def _setup_axes(self):
+        """Axes, labels, legend and persistent artists for the current horizontal axis"""
+        if self._surface_mode():
+            self._setup_surface_axes()
+            return
+        ax = self._new_axes()
+        self.surface_artists = []
+        
         idx_main = self.x_axis_idx
-        r_min, r_max = self.ranges[idx_main]
-        x_steps = np.linspace(r_min, r_max, 200)
+        feat_name = self.features[idx_main]
+        ax.set_xlabel(f"{feat_name} (Variable)", color='#CCCCCC')
+        ax.set_ylabel("Output", color='#CCCCCC')
+        ax.grid(True, color='#444444', linestyle='--')
         
-        X_pred = np.zeros((200, self.n_features))
-        for i in range(self.n_features):
-            X_pred[:, i] = self.current_values[i]
-        X_pred[:, idx_main] = x_steps
+        # Model slice lines and data scatters only ever change data: they are blitted
+        self.lines, self.scatters = [], []
+        n_targets = 1
+        try:
+            _, y_pred = self._predict_slice()
+            n_targets = y_pred.shape[1] if y_pred.ndim > 1 else 1
+        except Exception:
+            pass
+        if n_targets > 1:
+            names = getattr(self.model, 'target_names', None) or [str(k) for k in range(n_targets)]
+            for name in names:
+                self.lines.append(ax.plot([], [], linewidth=2, label=f'Model Slice ({name})', animated=True)[0])
+        else:
+            self.lines.append(ax.plot([], [], color='#DCDCAA', linewidth=2, label='Model Slice', animated=True)[0])
+        
+        if self.data and 'X' in self.data and 'Y' in self.data:
+            Y_real = self.data['Y']
+            label = 'Nearby Data' if self.data['X'].ndim > 1 else 'Data'
+            if Y_real.ndim > 1:
+                for k in range(Y_real.shape[1]):
+                    self.scatters.append(ax.scatter([], [], s=25, alpha=0.9, label=f'{label} {k}', animated=True))
+            else:
+                self.scatters.append(ax.scatter([], [], color='#4EC9B0', s=25, alpha=0.9, label=label, animated=True))
         
+        # Large slices are drawn as density images; the scatters stay as legend handles
+        self.densities = [DensityScatter(ax, sc.get_facecolor()[0]) for sc in self.scatters]
+        ax.legend(handles=self.lines + self.scatters)
+        ax.title.set_animated(True)
+        
+        # Fixed view for blitting: horizontal range, output range of the data and the initial slice
+        ax.set_xlim(*self.ranges[idx_main])
+        ys = [np.ravel(self.data['Y'])] if self.scatters else []
         try:
-            if hasattr(self.model, 'predict'):
-                y_pred = self.model.predict(X_pred)
-                ax.plot(x_steps, y_pred, color='#DCDCAA', linewidth=2, label='Model Slice')
+            ys.append(np.ravel(self._predict_slice()[1]))
+        except Exception:
+            pass
+        self._fit_ylim(ys, force=True)
+        self.canvas.draw()
+
+    def _setup_surface_axes(self):
+        """Axes, colorbar and persistent artists for the surface over the two selected axes"""
+        ax = self._new_axes()
+        ix, iy = self.x_axis_idx, self.y_axis_idx
+        ax.set_xlabel(self.features[ix], color='#CCCCCC')
+        ax.set_ylabel(self.features[iy], color='#CCCCCC')
+        ax.set_xlim(*self.ranges[ix])
+        ax.set_ylim(*self.ranges[iy])
+        
+        # One colour scale shared by the surface, the data points and the colorbar
+        self.surface_norm = Normalize()
+        mappable = ScalarMappable(norm=self.surface_norm, cmap=SURFACE_CMAP)
+        cbar = self.figure.colorbar(mappable, ax=ax)
+        cbar.set_label(self._target_name(), color='#CCCCCC')
+        cbar.ax.tick_params(colors='#AAAAAA')
+        cbar.outline.set_edgecolor('#555555')
+        
+        # Surface (image, or contour sets rebuilt per level), data and title are blitted
+        self.lines, self.scatters, self.surface_artists = [], [], []
+        if self.view_mode == "Heatmap":
+            self.surface_artists.append(ax.imshow(np.zeros((1, 1)), origin='lower', aspect='auto', cmap=SURFACE_CMAP,
+                                                  norm=self.surface_norm, interpolation='bilinear',
+                                                  extent=(*self.ranges[ix], *self.ranges[iy]), animated=True))
+            self.surface_artists[0].set_visible(False)
+        if self.data and 'X' in self.data and 'Y' in self.data and np.ndim(self.data['X']) > 1:
+            self.scatters.append(ax.scatter(np.zeros(0), np.zeros(0), c=np.zeros(0), cmap=SURFACE_CMAP,
+                                            norm=self.surface_norm, s=25, edgecolors='#FFFFFF', linewidths=0.8,
+                                            label='Nearby Data', animated=True))
+        # Translucent so dense data does not hide the surface under it
+        self.densities = [DensityScatter(ax, '#FFFFFF', alpha=0.4) for _ in self.scatters]
+        ax.title.set_animated(True)
+        
+        self._surface_requested = None
+        self._surface_level = None
+        self._surface_shown = None
+        self._surface_dirty = False
+        self.canvas.draw()
+
+    def _surface_state(self):
+        ix, iy = self.x_axis_idx, self.y_axis_idx
+        values = tuple(0.0 if i in (ix, iy) else float(v) for i, v in enumerate(self.current_values))
+        return (ix, iy, values)
+
+    def _fit_clim(self, Z):
+        """Grow the shared colour scale to Z; True when it changed"""
+        values = Z[np.isfinite(Z)]
+        if not len(values):
+            return False
+        lo, hi = float(values.min()), float(values.max())
+        norm = self.surface_norm
+        if norm.scaled() and lo >= norm.vmin and hi <= norm.vmax:
+            return False
+        # Grow with headroom so a drag does not redraw the colorbar on every step
+        pad = (hi - lo) * 0.1 or 0.5
+        lo, hi = lo - pad, hi + pad
+        if norm.scaled():
+            lo, hi = min(lo, norm.vmin), max(hi, norm.vmax)
+        norm.vmin, norm.vmax = lo, hi
+        return True
+
+    def _update_surface(self):
+        """Surface view: queue the slider state; the poll timer shows it, at most once per frame"""
+        state = self._surface_state()
+        if state != self._surface_requested:
+            # Until the new state's first level lands the previous surface stays up
+            self._surface_requested = state
+            self._surface.request(state)
+        self._surface_dirty = True
+        if not self._surface_timer.isActive():
+            self._surface_timer.start()
+
+    def _poll_surface(self):
+        best = self._surface.best(self._surface_requested)
+        shown = None if best is None else (self._surface_requested, best[0])
+        if best is not None and best[0] == surface.LEVELS[-1]:
+            self._surface_timer.stop()
+        if shown is not None and shown != self._surface_shown:
+            self._surface_shown = shown
+            self._refresh_surface(best)
+        elif self._surface_dirty:
+            self._refresh_surface(None)
+
+    def _refresh_surface(self, best):
+        ax = self.ax
+        full = self.background is None
+        if best is not None:
+            level, xs, ys, Z = best
+            full |= self._fit_clim(Z)
+            if self.view_mode == "Heatmap":
+                # Pixel centres sit on the grid points
+                dx, dy = (xs[1] - xs[0]) / 2, (ys[1] - ys[0]) / 2
+                image = self.surface_artists[0]
+                image.set_data(Z)
+                image.set_extent((xs[0] - dx, xs[-1] + dx, ys[0] - dy, ys[-1] + dy))
+                image.set_visible(True)
+            else:
+                for artist in self.surface_artists:
+                    artist.remove()
+                self.surface_artists = []
+                if np.isfinite(Z).any():
+                    levels = np.linspace(self.surface_norm.vmin, self.surface_norm.vmax, N_CONTOUR_LEVELS + 1)
+                    self.surface_artists = [
+                        ax.contourf(xs, ys, Z, levels=levels, cmap=SURFACE_CMAP, norm=self.surface_norm),
+                        ax.contour(xs, ys, Z, levels=levels, colors='#1E1E1E', linewidths=0.5)]
+                    for artist in self.surface_artists:
+                        artist.set_animated(True)
+            self._surface_level = level
+        self._surface_dirty = False
+        
+        # Data near the slice: every input but the two surface axes within tolerance of its slider
+        tolerance = self.tol_slider.value() / 10.0
+        if self.scatters:
+            X_real, Y_real = self.data['X'], self.data['Y']
+            ix, iy = self.x_axis_idx, self.y_axis_idx
+            centres = {i: self.current_values[i] for i in range(min(self.n_features, X_real.shape[1]))
+                       if i not in (ix, iy)}
+            rows = self._data_index.query(centres, tolerance)
+            y_col = Y_real[rows, min(self.target_idx, Y_real.shape[1] - 1)] if Y_real.ndim > 1 else Y_real[rows]
+            self._set_points(0, X_real[rows, ix], X_real[rows, iy])
+            self.scatters[0].set_array(np.asarray(y_col, dtype=float) if len(rows) <= DENSITY_MIN_POINTS else None)
+            self.setWindowTitle(f"Multivariate Graph Slicer - Showing {len(rows)}/{len(X_real)} points "
+                                f"(Tol={tolerance:.1f})")
+        
+        title = f"{self.view_mode}: {self.features[self.x_axis_idx]} × {self.features[self.y_axis_idx]} → {self._target_name()}"
+        if self._surface.error:
+            title = f"Prediction Error: {self._surface.error}"
+        elif self._surface_level is None:
+            title += "\nEvaluating..."
+        else:
+            n = self._surface_level
+            title += f"\n{n}×{n} grid" + (" (refining)" if n < surface.LEVELS[-1] else "")
+        if self.n_features > 2:
+            title += f", other vars within ±{tolerance:.1f} of slider"
+        ax.set_title(title)
+        
+        if full:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_animated()
+        self.canvas.blit(self.figure.bbox)
+
+    def _fit_ylim(self, ys, force=False):
+        """Grow the output range to the shown content; True when it changed.
+        
+        The view is left alone once the toolbar has zoomed or panned it.
+        """
+        values = np.concatenate(ys) if ys else np.zeros(0)
+        values = values[np.isfinite(values)]
+        if not len(values):
+            return False
+        lo, hi = float(values.min()), float(values.max())
+        cur = self.ax.get_ylim()
+        if not force and (cur != self._auto_ylim or (lo >= cur[0] and hi <= cur[1])):
+            return False
+        pad = (hi - lo) * 0.1 or 1.0
+        if not force:
+            lo, hi = min(lo - pad, cur[0]), max(hi + pad, cur[1])
+        else:
+            lo, hi = lo - pad, hi + pad
+        self.ax.set_ylim(lo, hi)
+        self._auto_ylim = self.ax.get_ylim()
+        return True
+
+    def _on_draw(self, event):
+        # Any full redraw (resize, toolbar navigation) re-caches the static background
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+
+    def _set_points(self, k, x, y):
+        """Data for scatter k: markers, or its density image once there are too many to draw"""
+        if len(x) > DENSITY_MIN_POINTS:
+            self.densities[k].set_data(x, y)
+            self.scatters[k].set_offsets(np.zeros((0, 2)))
+        else:
+            self.densities[k].hide()
+            self.scatters[k].set_offsets(np.column_stack([x, y]))
+
+    def _draw_animated(self):
+        for dens in self.densities:
+            dens.rebin()
+        images = [d.image for d in self.densities]
+        for artist in self.surface_artists + images + self.lines + self.scatters + [self.ax.title]:
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
+
+    def _update_plot(self):
+        if self._surface_mode():
+            self._update_surface()
+            return
+        idx_main = self.x_axis_idx
+        tolerance = self.tol_slider.value() / 10.0
+        ys = []
+        title = None
+        
+        # 1. Model Curve (Slice)
+        try:
+            x_steps, y_pred = self._predict_slice()
+            columns = [y_pred[:, k] for k in range(y_pred.shape[1])] if y_pred.ndim > 1 else [y_pred]
+            for line, y_col in zip(self.lines, columns):
+                line.set_data(x_steps, y_col)
+                line.set_visible(True)
+                ys.append(y_col)
         except Exception as e:
-            ax.text(0.5, 0.5, f"Prediction Error: {e}", color='red')
+            for line in self.lines:
+                line.set_visible(False)
+            title = f"Prediction Error: {e}"
             
-        # 2. Plot Real Data (Filtered by Slice)
-        if self.data and 'X' in self.data and 'Y' in self.data:
+        # 2. Real Data (Filtered by Slice)
+        if self.scatters:
             X_real = self.data['X']
             Y_real = self.data['Y']
             
-            # Filter condition: Keep points where ALL non-active dimensions are within tolerance
-            tolerance = self.tol_slider.value() / 10.0
-            mask = np.ones(len(X_real), dtype=bool)
-            
             if X_real.ndim > 1:
-                for i in range(self.n_features):
-                    if i == idx_main: continue 
-                    # Use provided ranges for scale-independent tolerance?
-                    # For now using absolute tolerance as requested: "if its(2,2) and my x=1 [don't show]"
-                    dist = np.abs(X_real[:, i] - self.current_values[i])
-                    mask = mask & (dist <= tolerance)
-                
-                x_real_filtered = X_real[mask, idx_main]
-                y_real_filtered = Y_real[mask]
-                
-                # Show ghost points (faded) for context? User asked for filtering.
-                # Let's just show filtered points clearly.
-                ax.scatter(x_real_filtered, y_real_filtered, color='#4EC9B0', s=25, alpha=0.9, label='Nearby Data')
-                
-                # Show stats about filtering
-                total_pts = len(X_real)
-                shown_pts = len(x_real_filtered)
-                self.setWindowTitle(f"Multivariate Graph Slicer - Showing {shown_pts}/{total_pts} points (Tol={tolerance:.1f})")
+                # Keep points where ALL non-active dimensions are within tolerance (absolute:
+                # a point at (2, 2) is hidden from the x=1 slice)
+                centres = {i: self.current_values[i] for i in range(min(self.n_features, X_real.shape[1]))
+                           if i != idx_main}
+                rows = self._data_index.query(centres, tolerance)
+                x_shown, y_shown = X_real[rows, idx_main], Y_real[rows]
+                self.setWindowTitle(f"Multivariate Graph Slicer - Showing {len(x_shown)}/{len(X_real)} points "
+                                    f"(Tol={tolerance:.1f})")
             else:
                 # 1D case, show all
-                ax.scatter(X_real, Y_real, color='#4EC9B0', s=20, alpha=0.7, label='Data')
+                x_shown, y_shown = X_real, Y_real
             
-        feat_name = self.features[idx_main]
-        ax.set_xlabel(f"{feat_name} (Variable)", color='#CCCCCC')
-        ax.set_ylabel("Output", color='#CCCCCC')
+            columns = [y_shown[:, k] for k in range(y_shown.shape[1])] if y_shown.ndim > 1 else [y_shown]
+            for k, y_col in enumerate(columns[:len(self.scatters)]):
+                self._set_points(k, x_shown, y_col)
+                ys.append(y_col)
         
-        title = f"Model Slice: {feat_name} vs Output"
-        if self.n_features > 1:
-            title += f"\nNon-axis vars within ±{tolerance:.1f} of slider"
-            
-        ax.set_title(title, color='#CCCCCC', fontsize=9)
-        ax.legend()
-        ax.grid(True, color='#444444', linestyle='--')
+        if title is None:
+            title = f"Model Slice: {self.features[idx_main]} vs Output"
+            if self.n_features > 1:
+                title += f"\nNon-axis vars within ±{tolerance:.1f} of slider"
+        self.ax.set_title(title)
         
-        self.canvas.draw()
+        if self.background is None or self._fit_ylim(ys):
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_animated()
+        self.canvas.blit(self.figure.bbox)
+
+    def done(self, result):
+        # Drop queued surface work; a tile in flight finishes on its own
+        self._surface_timer.stop()
+        if self._surface is not None:
+            self._surface.close()
+        super().done(result)
@@ -0,0 +1,75 @@
+import math
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtGui import QPainter, QPen, QColor, QPolygonF, QFont
+
+
+class LossChart(QWidget):
+    """
+    Tiny live chart of per-epoch training/validation loss.
+    Painted directly with QPainter so it can be refreshed every epoch
+    without the cost of a matplotlib canvas inside the node.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.train = []
+        self.val = []
+        self.best_epoch = None
+        self.setMinimumHeight(60)
+        self.setStyleSheet("background: #1E1E1E;")
+
+    def reset(self):
+        self.train = []
+        self.val = []
+        self.best_epoch = None
+        self.update()
+
+    def add_point(self, train_loss, val_loss=None):
+        self.train.append(train_loss)
+        if val_loss is not None:
+            self.val.append(val_loss)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), QColor("#1E1E1E"))
+        painter.setPen(QPen(QColor("#555555")))
+        painter.drawRect(self.rect().adjusted(0, 0, -1, -1))
+
+        series = [s for s in (self.train, self.val) if s]
+        if not series:
+            painter.end()
+            return
+
+        # Log scale: losses typically fall over several decades
+        values = [math.log10(max(v, 1e-12)) for s in series for v in s]
+        lo, hi = min(values), max(values)
+        if hi - lo < 1e-9:
+            hi = lo + 1.0
+        n = max(len(s) for s in series)
+        w, h = self.width() - 4, self.height() - 14
+
+        def to_point(i, v):
+            x = 2 + (w * i / max(n - 1, 1))
+            y = 2 + h - h * (math.log10(max(v, 1e-12)) - lo) / (hi - lo)
+            return QPointF(x, y)
+
+        for data, color in ((self.train, "#4EC9B0"), (self.val, "#DCDCAA")):
+            if len(data) < 2:
+                continue
+            painter.setPen(QPen(QColor(color), 1.2))
+            painter.drawPolyline(QPolygonF([to_point(i, v) for i, v in enumerate(data)]))
+
+        if self.best_epoch is not None and n > 1:
+            painter.setPen(QPen(QColor("#CE9178"), 1, Qt.DashLine))
+            x = to_point(self.best_epoch, 1.0).x()
+            painter.drawLine(QPointF(x, 2), QPointF(x, 2 + h))
+
+        painter.setPen(QColor("#888888"))
+        painter.setFont(QFont("Segoe UI", 7))
+        label = f"train {self.train[-1]:.3g}" if self.train else ""
+        if self.val:
+            label += f"  val {self.val[-1]:.3g}"
+        painter.drawText(4, self.height() - 2, label)
+        painter.end()
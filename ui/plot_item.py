@@ -0,0 +1,217 @@
+import math
+import numpy as np
+from PySide6.QtWidgets import QGraphicsItem
+from PySide6.QtCore import Qt, QRectF, QPointF, QByteArray, QDataStream
+from PySide6.QtGui import QPen, QColor, QFont, QPolygonF, QImage
+from core import density
+
+# Colours of multi-series plots (matplotlib's default cycle, as in the slicer dialog)
+PALETTE = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+           "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"]
+# Space around the axes rectangle for title, tick labels and axis labels: left, top, right, bottom (px)
+MARGINS = (42, 18, 8, 28)
+MARKER_SIZE = 4.5
+# Mapped coordinates are clamped this far outside the axes so off-scale values stay drawable
+CLAMP = 1e5
+
+
+def polygon(px, py):
+    """QPolygonF of the points (px, py), filled from one NumPy buffer through QDataStream"""
+    buf = np.empty(len(px), dtype=[('x', '>f8'), ('y', '>f8')])
+    buf['x'] = px
+    buf['y'] = py
+    stream = QDataStream(QByteArray(np.array([len(px)], dtype='>u4').tobytes() + buf.tobytes()))
+    poly = QPolygonF()
+    stream >> poly
+    return poly
+
+
+def nice_ticks(lo, hi, n=5):
+    """Round tick values (steps of 1, 2, 2.5 or 5 x 10^k) splitting [lo, hi] into about n intervals"""
+    span = hi - lo
+    if not span > 0:
+        return [lo]
+    raw = span / n
+    mag = 10.0 ** math.floor(math.log10(raw))
+    step = next(m * mag for m in (1, 2, 2.5, 5, 10) if m * mag >= raw * (1 - 1e-9))
+    first = math.ceil(lo / step - 1e-9)
+    return [k * step for k in range(first, int(math.floor(hi / step + 1e-9)) + 1)]
+
+
+class PlotItem(QGraphicsItem):
+    """Lines, points and axes painted with QPainter straight from NumPy arrays.
+
+    The item lives in the node scene, so zooming the view scales vectors
+    instead of re-rasterizing an embedded canvas, and it is cached in
+    device coordinates: panning the scene or moving the node does not repaint
+    it. Point series with more than DENSITY_MIN_POINTS points are drawn as a
+    density image binned at on-screen resolution (re-binned on view zoom).
+    """
+    def __init__(self, width, height, parent=None):
+        super().__init__(parent)
+        self.width = width
+        self.height = height
+        self.series = []  # dicts: kind ('line', 'points' or 'band' with y2 as its upper edge), x, y, color, label
+        self.title = ""
+        self.xlabel, self.ylabel = "X", "Y"
+        self.xlim, self.ylim = (0.0, 1.0), (0.0, 1.0)
+        self._paths = {}  # Series index -> mapped QPolygonF, or (shape, QImage) for density series
+        self.font = QFont("Segoe UI", 7)
+        self.title_font = QFont("Segoe UI", 8)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+    def boundingRect(self):
+        return QRectF(0, 0, self.width, self.height)
+
+    def plot_rect(self):
+        left, top, right, bottom = MARGINS
+        return QRectF(left, top, self.width - left - right, self.height - top - bottom)
+
+    def set_series(self, series, title=""):
+        """Replace the plotted series; limits follow the content (see fit_limits)"""
+        self.series = series
+        self.title = title
+        self._paths = {}
+        self.fit_limits([s['x'] for s in series], [s['y'] for s in series] + [s['y2'] for s in series if 'y2' in s])
+        self.update()
+
+    def fit_limits(self, xs, ys):
+        """Keep the current view when the content fits it snugly; True when the limits changed"""
+        changed = False
+        for axis, values in (('xlim', xs), ('ylim', ys)):
+            values = np.concatenate([np.ravel(v) for v in values]) if values else np.zeros(0)
+            values = values[np.isfinite(values)]
+            if not len(values):
+                continue
+            lo, hi = float(values.min()), float(values.max())
+            pad = (hi - lo) * 0.05 or 1.0
+            cur_lo, cur_hi = getattr(self, axis)
+            # Hysteresis: small changes between refits keep the axes (and tick labels) still
+            if lo >= cur_lo and hi <= cur_hi and (hi - lo + 2 * pad) >= 0.5 * (cur_hi - cur_lo):
+                continue
+            setattr(self, axis, (lo - pad, hi + pad))
+            changed = True
+        return changed
+
+    def _map(self, x, y, rect):
+        """Item coordinates of data points, non-finite points dropped"""
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        keep = np.isfinite(x) & np.isfinite(y)
+        (x0, x1), (y0, y1) = self.xlim, self.ylim
+        px = rect.left() + (x[keep] - x0) * (rect.width() / (x1 - x0))
+        py = rect.bottom() - (y[keep] - y0) * (rect.height() / (y1 - y0))
+        return np.clip(px, -CLAMP, CLAMP), np.clip(py, -CLAMP, CLAMP)
+
+    def _density_image(self, k, rect, scale):
+        s = self.series[k]
+        shape = (max(int(rect.height() * scale), 1), max(int(rect.width() * scale), 1))
+        cached = self._paths.get(k)
+        if cached is None or cached[0] != shape:
+            counts = density.bin_counts(s['x'], s['y'], self.xlim, self.ylim, shape)
+            # Image rows run top-down, counts rows bottom-up
+            rgba = np.ascontiguousarray(density.shade(counts[::-1], QColor(s['color']).getRgbF()[:3]))
+            image = QImage(rgba.data, shape[1], shape[0], 4 * shape[1], QImage.Format_RGBA8888).copy()
+            self._paths[k] = cached = (shape, image)
+        return cached[1]
+
+    def paint(self, painter, option, widget):
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        painter.fillRect(self.boundingRect(), QColor("#1E1E1E"))
+        rect = self.plot_rect()
+        painter.fillRect(rect, QColor("#252526"))
+        self._paint_axes(painter, rect)
+
+        painter.save()
+        painter.setClipRect(rect)
+        # Pixels per item unit on the device: density images are binned at screen resolution
+        scale = abs(painter.deviceTransform().m11()) or 1.0
+        for k, s in enumerate(self.series):
+            color = QColor(s['color'])
+            if s['kind'] == 'points' and len(s['x']) > density.DENSITY_MIN_POINTS:
+                painter.drawImage(rect, self._density_image(k, rect, scale))
+                continue
+            poly = self._paths.get(k)
+            if poly is None and s['kind'] == 'band':
+                # Outline: lower edge left to right, then upper edge back
+                x = np.concatenate([s['x'], s['x'][::-1]])
+                poly = self._paths[k] = polygon(*self._map(x, np.concatenate([s['y'], s['y2'][::-1]]), rect))
+            elif poly is None:
+                poly = self._paths[k] = polygon(*self._map(s['x'], s['y'], rect))
+            if s['kind'] == 'band':
+                color.setAlphaF(0.25)
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(color)
+                painter.drawPolygon(poly)
+                painter.setBrush(Qt.NoBrush)
+            elif s['kind'] == 'points':
+                color.setAlphaF(0.7)
+                pen = QPen(color, MARKER_SIZE)
+                pen.setCapStyle(Qt.RoundCap)
+                painter.setPen(pen)
+                painter.drawPoints(poly)
+            else:
+                painter.setPen(QPen(color, 2))
+                painter.drawPolyline(poly)
+        painter.restore()
+
+        self._paint_legend(painter, rect)
+        if self.title:
+            painter.setFont(self.title_font)
+            painter.setPen(QColor("#4EC9B0"))
+            painter.drawText(QRectF(0, 0, self.width, MARGINS[1]), Qt.AlignCenter, self.title)
+
+    def _paint_axes(self, painter, rect):
+        painter.setPen(QColor("#555555"))
+        painter.drawRect(rect)
+        painter.setFont(self.font)
+        (x0, x1), (y0, y1) = self.xlim, self.ylim
+        for v in nice_ticks(x0, x1):
+            px = rect.left() + (v - x0) * rect.width() / (x1 - x0)
+            painter.setPen(QColor("#555555"))
+            painter.drawLine(QPointF(px, rect.bottom()), QPointF(px, rect.bottom() + 3))
+            painter.setPen(QColor("#888888"))
+            painter.drawText(QRectF(px - 30, rect.bottom() + 3, 60, 11), Qt.AlignHCenter | Qt.AlignTop, f"{v:.4g}")
+        for v in nice_ticks(y0, y1):
+            py = rect.bottom() - (v - y0) * rect.height() / (y1 - y0)
+            painter.setPen(QColor("#555555"))
+            painter.drawLine(QPointF(rect.left() - 3, py), QPointF(rect.left(), py))
+            painter.setPen(QColor("#888888"))
+            painter.drawText(QRectF(0, py - 6, rect.left() - 5, 12), Qt.AlignRight | Qt.AlignVCenter, f"{v:.4g}")
+
+        painter.drawText(QRectF(rect.left(), self.height - 12, rect.width(), 12), Qt.AlignCenter, self.xlabel)
+        painter.save()
+        painter.translate(1, rect.center().y())
+        painter.rotate(-90)
+        painter.drawText(QRectF(-rect.height() / 2, 0, rect.height(), 11), Qt.AlignCenter, self.ylabel)
+        painter.restore()
+
+    def _paint_legend(self, painter, rect):
+        labels = [s for s in self.series if s.get('label')]
+        if not labels:
+            return
+        painter.setFont(self.font)
+        metrics = painter.fontMetrics()
+        row = metrics.height()
+        box = QRectF(rect.left() + 4, rect.top() + 4,
+                     22 + max(metrics.horizontalAdvance(s['label']) for s in labels), 4 + row * len(labels))
+        painter.setPen(QColor("#555555"))
+        painter.setBrush(QColor("#252526"))
+        painter.drawRect(box)
+        for i, s in enumerate(labels):
+            y = box.top() + 2 + row * (i + 0.5)
+            if s['kind'] == 'points':
+                pen = QPen(QColor(s['color']), MARKER_SIZE)
+                pen.setCapStyle(Qt.RoundCap)
+                painter.setPen(pen)
+                painter.drawPoint(QPointF(box.left() + 10, y))
+            elif s['kind'] == 'band':
+                color = QColor(s['color'])
+                color.setAlphaF(0.25)
+                painter.fillRect(QRectF(box.left() + 4, y - 3, 12, 6), color)
+            else:
+                painter.setPen(QPen(QColor(s['color']), 2))
+                painter.drawLine(QPointF(box.left() + 4, y), QPointF(box.left() + 16, y))
+            painter.setPen(QColor("#FFFFFF"))
+            painter.drawText(QRectF(box.left() + 20, y - row / 2, box.width() - 20, row),
+                             Qt.AlignLeft | Qt.AlignVCenter, s['label'])